@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
 from sklearn.linear_model import LinearRegression
 
 ###
@@ -21,7 +22,7 @@ from sklearn.linear_model import LinearRegression
 # 4. Seconds between the play
 ###
 
-df = pd.read_csv('./data/between_play.csv')
+df = load_nfl_pbp_dataset('between_play')
 df["norm_average_play_duration"] = 1 - df["norm_average_play_duration"]
 df["up_tempo_group"] = pd.cut(df["norm_average_play_duration"], bins=4)
 
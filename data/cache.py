@@ -0,0 +1,320 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import numpy as np
+import pandas as pd
+from data.source import HTTP_CONNECTIONS, LocalDirectorySource, open_nfl_pbp_source
+
+WORKDIR = os.path.dirname(os.path.abspath(__file__))
+PBP_CACHE_DIR = f'{WORKDIR}/cache/pbp'
+
+# Binary play-by-play flags, stored as int8 when they have no missing values
+NFL_PBP_FLAG_COLUMNS = [
+    'sack',
+    'fumble',
+    'qb_hit',
+    'tackled_for_loss',
+    'interception',
+    'complete_pass',
+    'incomplete_pass',
+    'pass_attempt',
+    'rush_attempt',
+    'qb_scramble',
+    'touchdown',
+    'pass_touchdown',
+    'first_down',
+    'penalty',
+    'timeout',
+    'no_huddle',
+    'goal_to_go',
+    'out_of_bounds',
+    'touchback',
+    'field_goal_attempt',
+    'punt_attempt',
+    'punt_blocked',
+    'punt_inside_twenty',
+    'punt_in_endzone',
+    'punt_out_of_bounds',
+    'punt_downed',
+    'punt_fair_catch',
+    'kickoff_attempt',
+    'kickoff_inside_twenty',
+    'kickoff_in_endzone',
+    'kickoff_out_of_bounds',
+    'kickoff_downed',
+    'kickoff_fair_catch'
+]
+
+# Team abbreviation columns, stored as categoricals sharing one set of teams
+# so that they can be compared with each other
+NFL_PBP_TEAM_COLUMNS = [
+    'posteam',
+    'defteam',
+    'home_team',
+    'away_team',
+    'penalty_team',
+    'timeout_team',
+    'side_of_field',
+    'td_team',
+    'return_team'
+]
+
+# The columns every fetched season must have before it is cached
+NFL_PBP_KEY_COLUMNS = ['season', 'game_id', 'play_id']
+
+def pbp_partition_path(
+        year: int,
+        cache_dir: str=PBP_CACHE_DIR
+    ) -> str:
+    """
+    Gets the path of the cached Parquet partition for a single season
+
+    Args:
+        year (int): The season of the partition
+        cache_dir (str): The root directory of the play-by-play cache
+
+    Returns:
+        str: The path of the season's Parquet partition
+    """
+    return os.path.join(cache_dir, f'season={year}', 'pbp.parquet')
+
+def resolve_nfl_pbp_source(
+        source: object=None,
+        source_dir: str=None
+    ) -> object:
+    """
+    Resolves the source seasons are fetched from
+
+    Args:
+        source (object): The source, which fetches a season with fetch(year)
+        source_dir (str): Optional local directory replacing the default
+            source, used when no source is given
+
+    Returns:
+        object: The given source, a LocalDirectorySource of the source
+            directory, or else the source at NFL_PBP_SOURCE
+    """
+    if source is not None:
+        return source
+    if source_dir is not None:
+        return LocalDirectorySource(source_dir)
+    return open_nfl_pbp_source()
+
+def fetch_nfl_pbp_season(
+        year: int,
+        source_dir: str=None,
+        source: object=None
+    ) -> pd.DataFrame:
+    """
+    Fetches a single season of raw NFL play-by-play data from its source.  If
+    a source directory is given, the season is read from the nflverse release
+    file (play_by_play_<year>.parquet) in that directory instead of the remote
+    source.
+
+    Args:
+        year (int): The season to fetch
+        source_dir (str): Optional local directory replacing the remote source
+        source (object): The source to fetch from, e.g. an HttpMirrorSource,
+            overriding the source directory
+
+    Returns:
+        pd.DataFrame: The raw play-by-play data for the season
+    """
+    return resolve_nfl_pbp_source(source, source_dir).fetch(year)
+
+def check_nfl_pbp_season(
+        df: pd.DataFrame,
+        year: int
+    ) -> None:
+    """
+    Checks that a season fetched from any source holds plays before it is
+    cached, since a source which is offline or has not yet published the
+    season may return an empty table, which would otherwise be cached and
+    never re-fetched
+
+    Args:
+        df (pd.DataFrame): The fetched play-by-play data for the season
+        year (int): The season
+    """
+    missing = [column for column in NFL_PBP_KEY_COLUMNS if column not in df.columns]
+    if len(missing) > 0:
+        raise ValueError(f"Fetched season {year} is missing columns: {missing}")
+    if len(df) == 0:
+        raise ValueError(f"Fetched season {year} has no plays")
+
+def cache_nfl_pbp_season(
+        year: int,
+        cache_dir: str=PBP_CACHE_DIR,
+        source_dir: str=None,
+        refresh: bool=False,
+        source: object=None
+    ) -> str:
+    """
+    Ensures a single season of play-by-play data is stored in the local cache,
+    fetching it from its source only if the partition does not yet exist
+
+    Args:
+        year (int): The season to cache
+        cache_dir (str): The root directory of the play-by-play cache
+        source_dir (str): Optional local directory replacing the remote source
+        refresh (bool): Whether to re-fetch the season even if it is cached,
+            replacing the cached partition only if the re-fetched season
+            holds every cached game
+        source (object): The source to fetch from, overriding the source
+            directory
+
+    Returns:
+        str: The path of the season's Parquet partition
+    """
+    path = pbp_partition_path(year, cache_dir)
+    if refresh or not os.path.exists(path):
+        # Check the season before writing, so that a failed fetch never
+        # replaces or poisons the cached partition
+        df = fetch_nfl_pbp_season(year, source_dir=source_dir, source=source)
+        check_nfl_pbp_season(df, year)
+
+        # A refreshed season must still hold every cached game
+        if os.path.exists(path):
+            cached_games = pd.read_parquet(path, columns=['game_id'])['game_id']
+            dropped = set(cached_games) - set(df['game_id'])
+            if len(dropped) > 0:
+                raise ValueError(
+                    f"Re-fetched season {year} is missing {len(dropped)} cached games, " \
+                    f"keeping the cached partition"
+                )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first so partial writes are never read,
+        # named per thread so concurrent fetches of a season never collide
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    return path
+
+def cache_nfl_pbp_seasons(
+        years: list[int],
+        cache_dir: str=PBP_CACHE_DIR,
+        source_dir: str=None,
+        refresh: bool=False,
+        source: object=None,
+        workers: int=HTTP_CONNECTIONS
+    ) -> list[str]:
+    """
+    Ensures several seasons of play-by-play data are stored in the local
+    cache.  Missing seasons are fetched concurrently from one shared source,
+    so that a cold cache fills at the bandwidth of the source rather than
+    one round trip after another.
+
+    Args:
+        years (list[int]): The seasons to cache
+        cache_dir (str): The root directory of the play-by-play cache
+        source_dir (str): Optional local directory replacing the remote source
+        refresh (bool): Whether to re-fetch the seasons even if they are cached
+        source (object): The source to fetch from, overriding the source
+            directory
+        workers (int): The number of seasons fetched at once
+
+    Returns:
+        list[str]: The path of each season's Parquet partition
+    """
+    if workers < 1:
+        raise ValueError(f"Workers must be at least 1, got: {workers}")
+    missing = [
+        year for year in dict.fromkeys(years)
+        if refresh or not os.path.exists(pbp_partition_path(year, cache_dir))
+    ]
+    if len(missing) > 1 and workers > 1:
+        source = resolve_nfl_pbp_source(source, source_dir)
+        with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            # Consume the results so that any failed fetch is raised
+            list(executor.map(
+                partial(cache_nfl_pbp_season, cache_dir=cache_dir, refresh=refresh, source=source),
+                missing
+            ))
+    else:
+        for year in missing:
+            cache_nfl_pbp_season(year, cache_dir=cache_dir, source_dir=source_dir, refresh=refresh, source=source)
+    return [pbp_partition_path(year, cache_dir) for year in years]
+
+def downcast_nfl_pbp_data(
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Downcasts raw NFL play-by-play data to compact dtypes.  Continuous columns
+    become float32, binary flags without missing values become int8, and team
+    abbreviations become categoricals.
+
+    Args:
+        df (pd.DataFrame): Raw NFL play-by-play data
+
+    Returns:
+        pd.DataFrame: The downcast play-by-play data
+    """
+    float_cols = df.select_dtypes(include=[np.float64]).columns
+    df[float_cols] = df[float_cols].astype(np.float32)
+    for column in NFL_PBP_FLAG_COLUMNS:
+        if column in df.columns and df[column].notna().all():
+            df[column] = df[column].astype(np.int8)
+    return unify_nfl_pbp_team_categories(df)
+
+def unify_nfl_pbp_team_categories(
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Stores the team abbreviation columns as categoricals sharing one set of
+    teams, so that they can be compared with each other.  This also restores
+    the categoricals of play-by-play data concatenated from seasons with
+    different sets of teams.
+
+    Args:
+        df (pd.DataFrame): NFL play-by-play data
+
+    Returns:
+        pd.DataFrame: The play-by-play data with categorical team columns
+    """
+    team_cols = [column for column in NFL_PBP_TEAM_COLUMNS if column in df.columns]
+    teams = pd.unique(df[team_cols].astype(object).values.ravel())
+    teams = sorted(team for team in teams if isinstance(team, str))
+    for column in team_cols:
+        df[column] = pd.Categorical(df[column].astype(object), categories=teams)
+    return df
+
+def load_nfl_pbp_data(
+        years: list[int],
+        columns: list[str]=None,
+        cache_dir: str=PBP_CACHE_DIR,
+        source_dir: str=None,
+        refresh: bool=False,
+        source: object=None,
+        workers: int=HTTP_CONNECTIONS
+    ) -> pd.DataFrame:
+    """
+    Loads raw NFL play-by-play data for the given seasons through the local
+    season-partitioned Parquet cache.  Only the partitions for the requested
+    seasons and only the requested columns are read, and missing seasons are
+    fetched concurrently and cached once.
+
+    Args:
+        years (list[int]): The years of play-by-play data to load
+        columns (list[str]): The columns to read, every column if None
+        cache_dir (str): The root directory of the play-by-play cache
+        source_dir (str): Optional local directory replacing the remote source
+        refresh (bool): Whether to re-fetch seasons even if they are cached
+        source (object): The source to fetch from, overriding the source
+            directory
+        workers (int): The number of seasons fetched at once
+
+    Returns:
+        pd.DataFrame: The raw play-by-play data for the requested seasons
+    """
+    paths = cache_nfl_pbp_seasons(
+        years,
+        cache_dir=cache_dir,
+        source_dir=source_dir,
+        refresh=refresh,
+        source=source,
+        workers=workers
+    )
+    frames = [pd.read_parquet(path, columns=columns) for path in paths]
+    return downcast_nfl_pbp_data(pd.concat(frames, ignore_index=True))
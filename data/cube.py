@@ -0,0 +1,293 @@
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data.cache import WORKDIR
+from data.dataset import NFL_PBP_DATASET_FILES, load_nfl_pbp_dataset, read_dataset_metadata
+
+CUBE_METADATA_KEY = b'cube'
+CUBE_DIR = f'{WORKDIR}/cache/cubes'
+
+# The bucket edges of each default situational dimension.  Each bucket spans
+# from its edge up to the next, and values below the first edge fall into a
+# leading bucket labeled -inf.
+PLAY_CUBE_DIMENSIONS = {
+    'down': [0, 1, 2, 3, 4],
+    'ydstogo': [1, 2, 3, 4, 5, 7, 10, 11, 15, 20],
+    'yardline_100': [0, 10, 20, 30, 40, 50, 60, 70, 80, 90],
+    'half_seconds_remaining': [0, 60, 120, 180, 300, 600, 900, 1200, 1500]
+}
+
+# Fine bucket edges for normalized skills, from which coarser bins roll up
+NORM_SKILL_EDGES = [round(edge, 2) for edge in np.arange(0, 1, 0.05)]
+
+class AggregateCube:
+    """
+    A materialized aggregate of plays over bucketed dimensions.  Each cell
+    holds the number of plays in one combination of buckets and, for every
+    outcome column, the count, sum and sum of squares of its non-missing
+    values.  Since these are additive, cells can be sliced and rolled up to
+    any coarser grouping of the buckets, and rates, means and standard
+    deviations derived from the rolled up cells.
+    """
+    def __init__(
+            self,
+            cells: pd.DataFrame,
+            dimensions: dict[str, list[float]],
+            outcomes: list[str]
+        ) -> "AggregateCube":
+        """
+        Constructor for the AggregateCube class
+
+        Args:
+            cells (pd.DataFrame): One row per non-empty cell, with the lower
+                bucket edge of each dimension and the aggregates
+            dimensions (dict[str, list[float]]): The bucket edges of each
+                dimension
+            outcomes (list[str]): The aggregated outcome columns
+
+        Returns:
+            AggregateCube: The instantiated AggregateCube
+        """
+        self.cells = cells
+        self.dimensions = dimensions
+        self.outcomes = outcomes
+
+    def slice(
+            self,
+            **conditions: object
+        ) -> "AggregateCube":
+        """
+        Keeps the cells whose buckets start within the given ranges, e.g.
+        slice(down=3, yardline_100=(40, 50))
+
+        Args:
+            conditions (object): The lower bucket edge of a dimension, or the
+                inclusive (low, high) range of lower bucket edges where None
+                leaves a side unbounded
+
+        Returns:
+            AggregateCube: The sliced cube
+        """
+        keep = pd.Series(True, index=self.cells.index)
+        for dimension, condition in conditions.items():
+            if dimension not in self.dimensions:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+            low, high = condition if isinstance(condition, tuple) else (condition, condition)
+            low = -np.inf if low is None else low
+            high = np.inf if high is None else high
+            keep &= self.cells[dimension].between(low, high)
+        return AggregateCube(self.cells[keep], self.dimensions, self.outcomes)
+
+    def roll_up(
+            self,
+            dimensions: list[str],
+            bins: dict[str, list[float]]={}
+        ) -> pd.DataFrame:
+        """
+        Aggregates the cells by a subset of the dimensions, summing out the
+        rest, and derives the mean and standard deviation of every outcome.
+        For binary outcomes, the mean is the rate of the outcome.
+
+        Args:
+            dimensions (list[str]): The dimensions to group by
+            bins (dict[str, list[float]]): Coarser bucket edges of any of the
+                dimensions, each of which must be one of the dimension's edges
+
+        Returns:
+            pd.DataFrame: One row per group, indexed by the lower bucket edge
+                of each dimension
+        """
+        cells = self.cells.copy()
+        for dimension in dimensions:
+            if dimension not in self.dimensions:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+        for dimension, edges in bins.items():
+            if not set(edges) <= set(self.dimensions[dimension]):
+                raise ValueError(f"Bins of {dimension} must be bucket edges of the cube: {edges}")
+
+            # Relabel each bucket with the lower edge of its coarser bin
+            edges = np.asarray(edges, dtype=np.float64)
+            bin_ids = np.digitize(cells[dimension], edges)
+            cells[dimension] = np.where(bin_ids > 0, edges[np.maximum(bin_ids - 1, 0)], -np.inf)
+
+        # Sum the additive aggregates, then derive the statistics
+        aggregates = [column for column in cells.columns if column not in self.dimensions]
+        if len(dimensions) > 0:
+            table = cells.groupby(dimensions, dropna=False)[aggregates].sum()
+        else:
+            table = cells[aggregates].sum().to_frame().T
+        for outcome in self.outcomes:
+            count = table[f'{outcome}_count']
+            mean = table[f'{outcome}_sum'] / count
+            table[f'{outcome}_mean'] = mean
+            table[f'{outcome}_std'] = np.sqrt(
+                np.maximum(table[f'{outcome}_sum_squares'] / count - mean ** 2, 0) * count / (count - 1)
+            )
+        return table
+
+    def save(
+            self,
+            path: str
+        ) -> str:
+        """
+        Writes the cube to Parquet, with its dimensions and outcomes in the
+        file metadata
+
+        Args:
+            path (str): The path of the Parquet file
+
+        Returns:
+            str: The path of the Parquet file
+        """
+        arrow_table = pa.Table.from_pandas(self.cells, preserve_index=False)
+        arrow_table = arrow_table.replace_schema_metadata({
+            **arrow_table.schema.metadata,
+            CUBE_METADATA_KEY: json.dumps({
+                'dimensions': self.dimensions,
+                'outcomes': self.outcomes
+            }).encode()
+        })
+
+        # Write to a temporary file first so partial writes are never read
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        pq.write_table(arrow_table, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(
+            cls,
+            path: str
+        ) -> "AggregateCube":
+        """
+        Reads a cube written by save
+
+        Args:
+            path (str): The path of the Parquet file
+
+        Returns:
+            AggregateCube: The cube
+        """
+        arrow_table = pq.read_table(path, memory_map=True)
+        metadata = json.loads(arrow_table.schema.metadata[CUBE_METADATA_KEY])
+        return cls(arrow_table.to_pandas(), metadata['dimensions'], metadata['outcomes'])
+
+def bucket_lower_edges(
+        values: pd.Series,
+        edges: list[float]
+    ) -> np.ndarray:
+    """
+    Labels each value with the lower edge of its bucket
+
+    Args:
+        values (pd.Series): The values to bucket
+        edges (list[float]): The bucket edges
+
+    Returns:
+        np.ndarray: The lower bucket edge of each value, -inf below the
+            first edge and NaN for missing values
+    """
+    values = values.to_numpy(dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.float64)
+    bucket_ids = np.digitize(values, edges)
+    labels = np.where(bucket_ids > 0, edges[np.maximum(bucket_ids - 1, 0)], -np.inf)
+    labels[np.isnan(values)] = np.nan
+    return labels
+
+def build_aggregate_cube(
+        df: pd.DataFrame,
+        outcomes: list[str],
+        dimensions: dict[str, list[float]]=PLAY_CUBE_DIMENSIONS
+    ) -> AggregateCube:
+    """
+    Aggregates plays into a cube over bucketed dimensions in a single
+    grouped pass
+
+    Args:
+        df (pd.DataFrame): The plays to aggregate
+        outcomes (list[str]): The outcome columns to aggregate, where boolean
+            and binary columns aggregate to rates
+        dimensions (dict[str, list[float]]): The bucket edges of each
+            dimension
+
+    Returns:
+        AggregateCube: The aggregate cube
+    """
+    columns = {
+        dimension: bucket_lower_edges(df[dimension], edges)
+        for dimension, edges in dimensions.items()
+    }
+    columns['plays'] = np.ones(len(df), dtype=np.int64)
+    for outcome in outcomes:
+        values = pd.to_numeric(df[outcome].astype(float), errors='coerce').to_numpy(dtype=np.float64)
+        present = ~np.isnan(values)
+        columns[f'{outcome}_count'] = present.astype(np.int64)
+        columns[f'{outcome}_sum'] = np.where(present, values, 0)
+        columns[f'{outcome}_sum_squares'] = np.where(present, values ** 2, 0)
+    cells = pd.DataFrame(columns).groupby(list(dimensions), dropna=False).sum().reset_index()
+    return AggregateCube(
+        cells,
+        {dimension: list(edges) for dimension, edges in dimensions.items()},
+        list(outcomes)
+    )
+
+def skill_cube_dimensions(
+        skills: list[str],
+        dimensions: dict[str, list[float]]=PLAY_CUBE_DIMENSIONS
+    ) -> dict[str, list[float]]:
+    """
+    Adds normalized skill columns to the dimensions of a cube, bucketed at
+    NORM_SKILL_EDGES so that the cube rolls up to any coarser skill bins on
+    the 0.05 grid, e.g. the five equal bins of the EDA scripts
+
+    Args:
+        skills (list[str]): The normalized skill columns, e.g.
+            ['norm_diff_rushing']
+        dimensions (dict[str, list[float]]): The other dimensions
+
+    Returns:
+        dict[str, list[float]]: The bucket edges of each dimension
+    """
+    return {**dimensions, **{skill: NORM_SKILL_EDGES for skill in skills}}
+
+def load_nfl_pbp_dataset_cube(
+        name: str,
+        outcomes: list[str],
+        dimensions: dict[str, list[float]]=PLAY_CUBE_DIMENSIONS,
+        cube_dir: str=CUBE_DIR
+    ) -> AggregateCube:
+    """
+    Loads the aggregate cube of a cleaned dataset written by pbp_data.py,
+    building it from the dataset only if the dataset, dimensions or outcomes
+    changed since it was last built
+
+    Args:
+        name (str): The name of the dataset
+        outcomes (list[str]): The outcome columns to aggregate
+        dimensions (dict[str, list[float]]): The bucket edges of each
+            dimension, e.g. skill_cube_dimensions(['norm_diff_rushing'])
+        cube_dir (str): The directory of the stored cubes
+
+    Returns:
+        AggregateCube: The aggregate cube of the dataset
+    """
+    if name not in NFL_PBP_DATASET_FILES:
+        raise ValueError(f"Unknown dataset: {name}")
+
+    # Key the cube by its definition and the contents of its dataset
+    key = json.dumps({
+        'dataset': read_dataset_metadata(NFL_PBP_DATASET_FILES[name][0])['content_hash'],
+        'dimensions': {dimension: list(edges) for dimension, edges in dimensions.items()},
+        'outcomes': list(outcomes)
+    }, sort_keys=True)
+    path = os.path.join(cube_dir, f'{name}-{hashlib.sha256(key.encode()).hexdigest()[:32]}.parquet')
+    if os.path.exists(path):
+        return AggregateCube.load(path)
+    cube = build_aggregate_cube(load_nfl_pbp_dataset(name), outcomes, dimensions)
+    cube.save(path)
+    return cube
@@ -0,0 +1,338 @@
+import os
+import json
+import hashlib
+import inspect
+import threading
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from functools import partial, wraps
+from typing import Callable
+from data.cache import WORKDIR, cache_nfl_pbp_season
+
+DATASET_METADATA_KEY = b'dataset'
+LOADER_CACHE_DIR = f'{WORKDIR}/cache/loaders'
+LOADER_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# The content hash of each cached play-by-play partition, by path, size and
+# modification time
+PBP_PARTITION_HASHES = {}
+
+# The Parquet path of each cleaned dataset and whether its index is written
+NFL_PBP_DATASET_FILES = {
+    'playcall': (f'{WORKDIR}/playcall.parquet', False),
+    'playresult': (f'{WORKDIR}/playresult.parquet', False),
+    'between_play': (f'{WORKDIR}/between_play.parquet', True),
+    'fieldgoal': (f'{WORKDIR}/fgs.parquet', False),
+    'run': (f'{WORKDIR}/rushing.parquet', True),
+    'pass': (f'{WORKDIR}/passing.parquet', True),
+    'punt': (f'{WORKDIR}/punts.parquet', False),
+    'kickoff': (f'{WORKDIR}/kickoffs.parquet', False)
+}
+
+class DatasetWriter:
+    """
+    Writes a dataset to a typed Parquet file one chunk at a time, embedding
+    the number of rows and a content hash of the rows in the file metadata.
+    The rows are hashed as they are read back, so the hash is the same
+    however the rows are chunked.  The chunks are written to temporary files
+    named per process and thread, so concurrent writers of one path never
+    collide and the last one to close wins.
+    """
+    def __init__(
+            self,
+            path: str,
+            index: bool=False,
+            row_group_size: int=None
+        ) -> "DatasetWriter":
+        """
+        Constructor for the DatasetWriter class
+
+        Args:
+            path (str): The path of the Parquet file
+            index (bool): Whether the index of the dataset is written
+            row_group_size (int): The maximum rows of each row group, one row
+                group per chunk if None
+
+        Returns:
+            DatasetWriter: The instantiated DatasetWriter
+        """
+        self.path = path
+        self.index = index
+        self.row_group_size = row_group_size
+        self.tmp_prefix = f'{path}.{os.getpid()}.{threading.get_ident()}'
+        self.chunks_path = f'{self.tmp_prefix}.chunks'
+        self.writer = None
+        self.hash = hashlib.sha256()
+        self.rows = 0
+
+    def write(
+            self,
+            df: pd.DataFrame
+        ) -> None:
+        """
+        Appends a chunk of rows to the dataset
+
+        Args:
+            df (pd.DataFrame): The rows to append
+        """
+        if self.writer is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=self.index)
+            self.writer = pq.ParquetWriter(self.chunks_path, table.schema)
+        else:
+            table = pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=self.index)
+        self.writer.write_table(table, row_group_size=self.row_group_size)
+        self.hash.update(hash_dataset_rows(table.to_pandas(), index=self.index))
+        self.rows += len(df)
+
+    def close(
+            self
+        ) -> str:
+        """
+        Embeds the metadata and moves the finished dataset into place, so
+        that partial writes are never read
+
+        Returns:
+            str: The content hash of the dataset
+        """
+        content_hash = self.hash.hexdigest()
+        self.writer.close()
+
+        # The hash is only known once every chunk is written, so copy the
+        # chunks one row group at a time under a schema with the metadata
+        chunks = pq.ParquetFile(self.chunks_path, memory_map=True)
+        schema = chunks.schema_arrow.with_metadata({
+            **chunks.schema_arrow.metadata,
+            DATASET_METADATA_KEY: json.dumps({
+                'rows': self.rows,
+                'index': self.index,
+                'content_hash': content_hash
+            }).encode()
+        })
+        tmp_path = f'{self.tmp_prefix}.tmp'
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for row_group in range(chunks.num_row_groups):
+                writer.write_table(chunks.read_row_group(row_group).replace_schema_metadata(schema.metadata))
+        os.replace(tmp_path, self.path)
+        os.remove(self.chunks_path)
+        return content_hash
+
+def hash_dataset_rows(
+        df: pd.DataFrame,
+        index: bool=False
+    ) -> bytes:
+    """
+    Hashes each row of a dataset, so that the hashes of consecutive chunks
+    can be fed into one content hash
+
+    Args:
+        df (pd.DataFrame): The rows to hash
+        index (bool): Whether the index is part of each row
+
+    Returns:
+        bytes: The concatenated 64-bit hash of each row
+    """
+    return pd.util.hash_pandas_object(df, index=index).values.tobytes()
+
+def write_dataset(
+        df: pd.DataFrame,
+        path: str,
+        index: bool=False
+    ) -> str:
+    """
+    Writes a dataset to a typed Parquet file with its content hash
+
+    Args:
+        df (pd.DataFrame): The dataset to write
+        path (str): The path of the Parquet file
+        index (bool): Whether the index of the dataset is written
+
+    Returns:
+        str: The content hash of the dataset
+    """
+    writer = DatasetWriter(path, index=index)
+    writer.write(df)
+    return writer.close()
+
+def read_dataset_metadata(
+        path: str
+    ) -> dict:
+    """
+    Reads the metadata of a dataset written by DatasetWriter, without reading
+    any of its rows
+
+    Args:
+        path (str): The path of the Parquet file
+
+    Returns:
+        dict: The number of rows, whether the index is written and the
+            content hash of the dataset
+    """
+    return json.loads(pq.read_metadata(path).metadata[DATASET_METADATA_KEY])
+
+def read_dataset(
+        path: str,
+        verify: bool=False
+    ) -> pd.DataFrame:
+    """
+    Reads a dataset written by DatasetWriter through a memory map, with the
+    dtypes it was written with
+
+    Args:
+        path (str): The path of the Parquet file
+        verify (bool): Whether to check the rows against the content hash
+
+    Returns:
+        pd.DataFrame: The dataset
+    """
+    df = pq.read_table(path, memory_map=True).to_pandas()
+    if verify:
+        metadata = read_dataset_metadata(path)
+        content_hash = hashlib.sha256(hash_dataset_rows(df, index=metadata['index'])).hexdigest()
+        if content_hash != metadata['content_hash']:
+            raise ValueError(f"Dataset {path} does not match its content hash, rebuild it")
+    return df
+
+def load_nfl_pbp_dataset(
+        name: str,
+        verify: bool=False
+    ) -> pd.DataFrame:
+    """
+    Reads a cleaned dataset written by pbp_data.py
+
+    Args:
+        name (str): The name of the dataset
+        verify (bool): Whether to check the rows against the content hash
+
+    Returns:
+        pd.DataFrame: The cleaned dataset
+    """
+    if name not in NFL_PBP_DATASET_FILES:
+        raise ValueError(f"Unknown dataset: {name}")
+    return read_dataset(NFL_PBP_DATASET_FILES[name][0], verify=verify)
+
+def hash_pbp_partition(
+        year: int
+    ) -> str:
+    """
+    Hashes the contents of a cached play-by-play partition, fetching the
+    season first if it is not cached.  Hashes are remembered for as long as
+    the partition file is unchanged.
+
+    Args:
+        year (int): The season of the partition
+
+    Returns:
+        str: The SHA-256 hash of the partition
+    """
+    path = cache_nfl_pbp_season(year)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in PBP_PARTITION_HASHES:
+        partition_hash = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                partition_hash.update(block)
+        PBP_PARTITION_HASHES[key] = partition_hash.hexdigest()
+    return PBP_PARTITION_HASHES[key]
+
+def evict_loader_cache(
+        cache_dir: str=LOADER_CACHE_DIR,
+        max_bytes: int=LOADER_CACHE_MAX_BYTES,
+        protected: list[str]=[]
+    ) -> None:
+    """
+    Evicts the least recently used cached loader results until the cache
+    fits in the given size, or until only protected results are left
+
+    Args:
+        cache_dir (str): The directory of the loader cache
+        max_bytes (int): The maximum total size of the cached results
+        protected (list[str]): The paths of results which are never evicted,
+            e.g. the result just written
+    """
+    protected = {os.path.abspath(path) for path in protected}
+    paths = [
+        os.path.join(cache_dir, name)
+        for name in os.listdir(cache_dir)
+        if name.endswith('.parquet')
+    ]
+    paths = sorted(paths, key=lambda path: os.stat(path).st_mtime_ns)
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    for path in paths:
+        if total_bytes <= max_bytes:
+            break
+        if os.path.abspath(path) in protected:
+            continue
+        total_bytes -= os.path.getsize(path)
+        os.remove(path)
+
+def invalidate_loader_cache(
+        loader: str=None,
+        cache_dir: str=LOADER_CACHE_DIR
+    ) -> None:
+    """
+    Removes the cached results of a loader, or of every loader
+
+    Args:
+        loader (str): The name of the loader, every loader if None
+        cache_dir (str): The directory of the loader cache
+    """
+    if not os.path.exists(cache_dir):
+        return
+    for name in os.listdir(cache_dir):
+        if name.endswith('.parquet') and (loader is None or name.startswith(f'{loader}-')):
+            os.remove(os.path.join(cache_dir, name))
+
+def cache_loader(
+        version: int
+    ) -> Callable:
+    """
+    Caches the results of a play-by-play data loader on disk, keyed by the
+    loader's version, its arguments and the contents of the raw partitions of
+    the requested years.  Results are memory-mapped when read back, and the
+    least recently used results are evicted once the cache outgrows
+    LOADER_CACHE_MAX_BYTES.  Bump the version whenever the loader's output
+    changes.
+
+    Args:
+        version (int): The version of the loader
+
+    Returns:
+        Callable: The decorator wrapping the loader
+    """
+    def decorator(loader: Callable) -> Callable:
+        signature = inspect.signature(loader)
+
+        @wraps(loader)
+        def cached(*args, **kwargs) -> pd.DataFrame:
+            # Key the result by the loader, its arguments and its raw data
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = json.dumps({
+                'loader': loader.__name__,
+                'version': version,
+                'arguments': arguments.arguments,
+                'partitions': [hash_pbp_partition(year) for year in arguments.arguments['years']]
+            }, sort_keys=True)
+            path = os.path.join(
+                LOADER_CACHE_DIR,
+                f'{loader.__name__}-{hashlib.sha256(key.encode()).hexdigest()[:32]}.parquet'
+            )
+
+            # Run the loader unless its result is cached, otherwise mark the
+            # cached result as recently used
+            if os.path.exists(path):
+                os.utime(path)
+            else:
+                write_dataset(loader(*args, **kwargs), path, index=True)
+                evict_loader_cache(LOADER_CACHE_DIR, LOADER_CACHE_MAX_BYTES, protected=[path])
+
+            # Always return the cached result, so repeated calls see the same
+            # dtypes
+            return read_dataset(path)
+
+        cached.invalidate = partial(invalidate_loader_cache, loader.__name__)
+        return cached
+    return decorator
@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from typing import Iterator
+from data.cache import WORKDIR, load_nfl_pbp_data
+from data.dataset import DatasetWriter
+from data.pbp import NFL_PBP_YEARS
+
+GAME_INDEX_PATH = f'{WORKDIR}/cache/games.parquet'
+
+# Row groups are kept small so that reading one game only decodes the few
+# row groups it spans rather than a whole season
+GAME_INDEX_ROW_GROUP_SIZE = 2048
+
+# The raw columns stored for each play of the game index
+GAME_INDEX_COLUMNS = [
+    'season',
+    'game_id',
+    'play_id',
+    'drive',
+    'home_team',
+    'away_team',
+    'posteam',
+    'defteam',
+    'qtr',
+    'half_seconds_remaining',
+    'game_seconds_remaining',
+    'down',
+    'ydstogo',
+    'yardline_100',
+    'goal_to_go',
+    'posteam_score',
+    'defteam_score',
+    'posteam_timeouts_remaining',
+    'defteam_timeouts_remaining',
+    'play_type',
+    'yards_gained',
+    'kick_distance',
+    'field_goal_result',
+    'desc'
+]
+
+def build_game_index(
+        years: list[int]=NFL_PBP_YEARS,
+        path: str=GAME_INDEX_PATH,
+        columns: list[str]=GAME_INDEX_COLUMNS
+    ) -> str:
+    """
+    Writes the plays of every game to a Parquet file sorted by game_id and
+    play_id, so that the plays of each game are stored contiguously.  Game
+    ids start with their season, so the games of a season are contiguous as
+    well.  Seasons are written one at a time.
+
+    Args:
+        years (list[int]): The seasons to index
+        path (str): The path of the game index
+        columns (list[str]): The raw columns to store for each play
+
+    Returns:
+        str: The content hash of the game index
+    """
+    writer = DatasetWriter(path, row_group_size=GAME_INDEX_ROW_GROUP_SIZE)
+    for year in sorted(years):
+        df = load_nfl_pbp_data([year], columns=columns)
+        writer.write(df.sort_values(['game_id', 'play_id'], ignore_index=True))
+    content_hash = writer.close()
+    print(f"Indexed {len(years)} seasons of games to {path} ({content_hash[:12]})")
+    return content_hash
+
+class GameIndex:
+    """
+    Primary-key lookup of historical plays by game_id and play_id, backed by
+    the game index written by build_game_index.  Only the game_id column is
+    read up front, from which the first and last row of every game are found.
+    Fetching a game then decodes only the row groups it spans, so that its
+    cost follows the size of the game rather than of its season.
+    """
+    def __init__(
+            self,
+            path: str=GAME_INDEX_PATH
+        ) -> "GameIndex":
+        """
+        Constructor for the GameIndex class
+
+        Args:
+            path (str): The path of the game index
+
+        Returns:
+            GameIndex: The instantiated GameIndex
+        """
+        self.file = pq.ParquetFile(path, memory_map=True)
+
+        # Find the rows spanned by each game, which are sorted by game_id
+        game_ids = self.file.read(columns=['game_id']).column('game_id').to_numpy(zero_copy_only=False)
+        ids, starts = np.unique(game_ids, return_index=True)
+        order = np.argsort(starts)
+        self.game_ids = list(ids[order])
+        starts = starts[order]
+        stops = np.append(starts[1:], len(game_ids))
+        self.rows = {
+            game_id: (int(start), int(stop))
+            for game_id, start, stop in zip(self.game_ids, starts, stops)
+        }
+
+        # Find the first row of each row group
+        row_group_rows = [
+            self.file.metadata.row_group(row_group).num_rows
+            for row_group in range(self.file.num_row_groups)
+        ]
+        self.row_group_starts = np.concatenate([[0], np.cumsum(row_group_rows)])
+
+    def read_rows(
+            self,
+            start: int,
+            stop: int
+        ) -> pd.DataFrame:
+        """
+        Reads a contiguous range of plays, decoding only the row groups the
+        range spans
+
+        Args:
+            start (int): The first row of the range
+            stop (int): The row after the last row of the range
+
+        Returns:
+            pd.DataFrame: The plays in the range
+        """
+        first = int(np.searchsorted(self.row_group_starts, start, side='right')) - 1
+        last = int(np.searchsorted(self.row_group_starts, stop, side='left'))
+        offset = start - self.row_group_starts[first]
+        table = self.file.read_row_groups(list(range(first, last)))
+        return table.slice(offset, stop - start).to_pandas()
+
+    def season_game_ids(
+            self,
+            season: int
+        ) -> list[str]:
+        """
+        Lists the games of a season in game_id order
+
+        Args:
+            season (int): The season
+
+        Returns:
+            list[str]: The game ids of the season
+        """
+        return [game_id for game_id in self.game_ids if game_id.startswith(f'{season}_')]
+
+    def game(
+            self,
+            game_id: str
+        ) -> pd.DataFrame:
+        """
+        Fetches the plays of a game in play order
+
+        Args:
+            game_id (str): The game id (e.g. 2023_01_DET_KC)
+
+        Returns:
+            pd.DataFrame: The plays of the game
+        """
+        if game_id not in self.rows:
+            raise ValueError(f"Game is not indexed: {game_id}")
+        return self.read_rows(*self.rows[game_id])
+
+    def drive(
+            self,
+            game_id: str,
+            drive: int
+        ) -> pd.DataFrame:
+        """
+        Fetches the plays of one drive of a game in play order
+
+        Args:
+            game_id (str): The game id
+            drive (int): The drive number within the game
+
+        Returns:
+            pd.DataFrame: The plays of the drive
+        """
+        df = self.game(game_id)
+        return df[df['drive'] == drive]
+
+    def play(
+            self,
+            game_id: str,
+            play_id: int
+        ) -> pd.Series:
+        """
+        Fetches a single play
+
+        Args:
+            game_id (str): The game id
+            play_id (int): The play id within the game
+
+        Returns:
+            pd.Series: The play
+        """
+        df = self.game(game_id)
+        position = int(np.searchsorted(df['play_id'].to_numpy(), play_id))
+        if position == len(df) or df['play_id'].iloc[position] != play_id:
+            raise ValueError(f"Play {play_id} is not indexed in game {game_id}")
+        return df.iloc[position]
+
+    def games(
+            self,
+            season: int
+        ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Iterates over the games of a season in one sequential read of the
+        season's rows
+
+        Args:
+            season (int): The season
+
+        Returns:
+            Iterator[tuple[str, pd.DataFrame]]: The game id and plays of each
+                game of the season
+        """
+        game_ids = self.season_game_ids(season)
+        if len(game_ids) == 0:
+            return
+        start = self.rows[game_ids[0]][0]
+        df = self.read_rows(start, self.rows[game_ids[-1]][1])
+        for game_id in game_ids:
+            game_start, game_stop = self.rows[game_id]
+            yield game_id, df.iloc[game_start - start:game_stop - start]
@@ -0,0 +1,439 @@
+import numpy as np
+import pandas as pd
+from typing import Union
+from data.cache import NFL_PBP_FLAG_COLUMNS
+from data.skill import OFFENSE, DEFENSE
+
+# The number of set bits in each byte
+POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+# The bucket edges of each situational column.  Each bucket spans from one
+# edge up to the next, and the first and last buckets are unbounded.
+SITUATION_BUCKETS = {
+    'qtr': [2, 3, 4, 5],
+    'down': [2, 3, 4],
+    'ydstogo': [2, 3, 4, 5, 7, 10, 11, 15, 20],
+    'yardline_100': [10, 20, 30, 40, 50, 60, 70, 80, 90],
+    'half_seconds_remaining': [60, 120, 300, 600, 900, 1200, 1500],
+    'score_diff': [-16, -8, -3, 0, 1, 4, 9, 17],
+    'posteam_timeouts_remaining': [1, 2, 3],
+    'defteam_timeouts_remaining': [1, 2, 3]
+}
+
+class SituationIndex:
+    """
+    An index of historical plays by game situation.  Each situational column
+    is discretized into buckets, and the row positions of the plays in each
+    bucket are kept as a sorted posting list.  A range query only reads the
+    postings of the buckets the range overlaps, checking exact values in
+    those buckets alone.  A query on several columns reads the postings of
+    its most selective condition, by bucket sizes, and checks the remaining
+    conditions on those plays alone rather than scanning every play.
+    """
+    def __init__(
+            self,
+            df: pd.DataFrame,
+            buckets: dict[str, list[float]]=SITUATION_BUCKETS
+        ) -> "SituationIndex":
+        """
+        Constructor for the SituationIndex class
+
+        Args:
+            df (pd.DataFrame): The plays to index
+            buckets (dict[str, list[float]]): The bucket edges of each
+                situational column to index
+
+        Returns:
+            SituationIndex: The instantiated SituationIndex
+        """
+        self.df = df
+        self.values = {}
+        self.edges = {}
+        self.postings = {}
+        self.offsets = {}
+        for column, edges in buckets.items():
+            values = df[column].to_numpy(dtype=np.float64)
+            edges = np.asarray(edges, dtype=np.float64)
+
+            # Bucket every play, keeping plays with missing values in a
+            # trailing bucket that no range reaches
+            bucket_ids = np.digitize(values, edges)
+            bucket_ids[np.isnan(values)] = len(edges) + 1
+
+            # Group the row positions by bucket, in row order within each
+            postings = np.argsort(bucket_ids, kind='stable')
+            self.values[column] = values
+            self.edges[column] = edges
+            self.postings[column] = postings
+            self.offsets[column] = np.searchsorted(bucket_ids[postings], np.arange(len(edges) + 3))
+
+    def bucket_range(
+            self,
+            column: str,
+            low: float,
+            high: float
+        ) -> tuple[int, int]:
+        """
+        Finds the first and last buckets a range of a situational column
+        overlaps
+
+        Args:
+            column (str): The situational column
+            low (float): The inclusive lower bound
+            high (float): The inclusive upper bound
+
+        Returns:
+            tuple[int, int]: The first and last bucket of the range
+        """
+        edges = self.edges[column]
+        return int(np.digitize(low, edges)), int(np.digitize(high, edges))
+
+    def rows(
+            self,
+            column: str,
+            low: float=None,
+            high: float=None
+        ) -> np.ndarray:
+        """
+        Finds the plays whose value of a situational column is within a range
+
+        Args:
+            column (str): The situational column
+            low (float): The inclusive lower bound, unbounded if None
+            high (float): The inclusive upper bound, unbounded if None
+
+        Returns:
+            np.ndarray: The sorted row positions of the matching plays
+        """
+        if column not in self.postings:
+            raise ValueError(f"Column is not indexed: {column}")
+        low = -np.inf if low is None else low
+        high = np.inf if high is None else high
+        postings = self.postings[column]
+        offsets = self.offsets[column]
+        first, last = self.bucket_range(column, low, high)
+        if first > last:
+            return np.empty(0, dtype=postings.dtype)
+
+        # Buckets strictly between the first and last lie within the range,
+        # so only the plays in the first and last buckets are checked
+        values = self.values[column]
+        first_rows = postings[offsets[first]:offsets[first + 1]]
+        first_rows = first_rows[(values[first_rows] >= low) & (values[first_rows] <= high)]
+        if first == last:
+            return first_rows
+        inner_rows = postings[offsets[first + 1]:offsets[last]]
+        last_rows = postings[offsets[last]:offsets[last + 1]]
+        last_rows = last_rows[(values[last_rows] >= low) & (values[last_rows] <= high)]
+        return np.sort(np.concatenate([first_rows, inner_rows, last_rows]))
+
+    def query(
+            self,
+            **conditions: Union[float, tuple[float, float]]
+        ) -> np.ndarray:
+        """
+        Finds the plays matching every situational condition, e.g.
+        query(down=3, ydstogo=(1, 3), yardline_100=(40, 60), qtr=4,
+        score_diff=(-8, 8))
+
+        Args:
+            conditions (Union[float, tuple[float, float]]): The value of each
+                situational column, or its inclusive (low, high) range where
+                None leaves a side unbounded
+
+        Returns:
+            np.ndarray: The sorted row positions of the matching plays
+        """
+        if len(conditions) == 0:
+            return np.arange(len(self.df))
+        ranges = {}
+        for column, condition in conditions.items():
+            if column not in self.postings:
+                raise ValueError(f"Column is not indexed: {column}")
+            low, high = condition if isinstance(condition, tuple) else (condition, condition)
+            ranges[column] = (
+                -np.inf if low is None else low,
+                np.inf if high is None else high
+            )
+
+        # Read the postings of the condition whose buckets hold fewest plays
+        candidates = {}
+        for column, (low, high) in ranges.items():
+            first, last = self.bucket_range(column, low, high)
+            offsets = self.offsets[column]
+            candidates[column] = offsets[last + 1] - offsets[first] if first <= last else 0
+        selective = min(candidates, key=candidates.get)
+        rows = self.rows(selective, *ranges[selective])
+
+        # Check the remaining conditions on the matching plays alone
+        for column, (low, high) in ranges.items():
+            if column != selective:
+                values = self.values[column][rows]
+                rows = rows[(values >= low) & (values <= high)]
+        return rows
+
+    def plays(
+            self,
+            **conditions: Union[float, tuple[float, float]]
+        ) -> pd.DataFrame:
+        """
+        Selects the plays matching every situational condition
+
+        Args:
+            conditions (Union[float, tuple[float, float]]): The value or inclusive
+                (low, high) range of each situational column
+
+        Returns:
+            pd.DataFrame: The matching plays
+        """
+        return self.df.iloc[self.query(**conditions)]
+
+class Bitmap:
+    """
+    A set of plays stored as a bitmap with one bit per play, packed eight
+    plays to a byte
+    """
+    def __init__(
+            self,
+            bits: np.ndarray,
+            size: int
+        ) -> "Bitmap":
+        """
+        Constructor for the Bitmap class
+
+        Args:
+            bits (np.ndarray): The packed bits of the bitmap
+            size (int): The number of plays the bitmap spans
+
+        Returns:
+            Bitmap: The instantiated Bitmap
+        """
+        self.bits = bits
+        self.size = size
+
+    @classmethod
+    def from_mask(
+            cls,
+            mask: np.ndarray
+        ) -> "Bitmap":
+        """
+        Packs a boolean mask over every play into a bitmap
+
+        Args:
+            mask (np.ndarray): Whether each play is in the set
+
+        Returns:
+            Bitmap: The packed bitmap
+        """
+        return cls(np.packbits(mask), len(mask))
+
+    def __and__(
+            self,
+            other: "Bitmap"
+        ) -> "Bitmap":
+        """
+        Intersects two sets of plays
+
+        Args:
+            other (Bitmap): The other set of plays
+
+        Returns:
+            Bitmap: The plays in both sets
+        """
+        return Bitmap(self.bits & other.bits, self.size)
+
+    def __or__(
+            self,
+            other: "Bitmap"
+        ) -> "Bitmap":
+        """
+        Unites two sets of plays
+
+        Args:
+            other (Bitmap): The other set of plays
+
+        Returns:
+            Bitmap: The plays in either set
+        """
+        return Bitmap(self.bits | other.bits, self.size)
+
+    def __invert__(
+            self
+        ) -> "Bitmap":
+        """
+        Complements the set of plays
+
+        Returns:
+            Bitmap: The plays not in the set
+        """
+        # Clear the padding bits past the last play
+        bits = ~self.bits
+        if self.size % 8 != 0:
+            bits[-1] &= np.uint8(0xFF << (8 - self.size % 8))
+        return Bitmap(bits, self.size)
+
+    def count(
+            self
+        ) -> int:
+        """
+        Counts the plays in the set
+
+        Returns:
+            int: The number of plays in the set
+        """
+        return int(POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    def rows(
+            self
+        ) -> np.ndarray:
+        """
+        Lists the plays in the set
+
+        Returns:
+            np.ndarray: The sorted row positions of the plays in the set
+        """
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.size))
+
+class PlayBitmapIndex:
+    """
+    A bitmap index of historical plays, with one bitmap per binary outcome
+    flag, per play type, per season and per team on each side of the ball.
+    Filters are combined with &, | and ~ on the bitmaps, e.g. the pressures
+    of a defense in a season are
+    (index.flag('tackled_for_loss') | index.flag('sack') | index.flag('qb_hit'))
+    & index.team_season(DEFENSE, 2023, 'KC'), and the result's count and rows
+    are read directly from the bits.
+    """
+    def __init__(
+            self,
+            df: pd.DataFrame,
+            flags: list[str]=NFL_PBP_FLAG_COLUMNS,
+            team_columns: list[str]=[OFFENSE, DEFENSE]
+        ) -> "PlayBitmapIndex":
+        """
+        Constructor for the PlayBitmapIndex class
+
+        Args:
+            df (pd.DataFrame): The plays to index
+            flags (list[str]): The binary flag columns to index, where a
+                missing value is unset
+            team_columns (list[str]): The team columns to index
+
+        Returns:
+            PlayBitmapIndex: The instantiated PlayBitmapIndex
+        """
+        self.df = df
+        self.size = len(df)
+        self.flags = {
+            flag: Bitmap.from_mask(df[flag].fillna(0).to_numpy() == 1)
+            for flag in flags
+            if flag in df.columns
+        }
+        self.values = {}
+        for column in ['season', 'play_type'] + team_columns:
+            if column in df.columns:
+                self.values[column] = self.index_values(df[column])
+
+    def index_values(
+            self,
+            values: pd.Series
+        ) -> dict:
+        """
+        Builds one bitmap per distinct value of a column in a single pass
+
+        Args:
+            values (pd.Series): The values of the column
+
+        Returns:
+            dict: The bitmap of each distinct value
+        """
+        codes, uniques = pd.factorize(values)
+        order = np.argsort(codes, kind='stable')
+        offsets = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        bitmaps = {}
+        for code, value in enumerate(uniques):
+            mask = np.zeros(self.size, dtype=bool)
+            mask[order[offsets[code]:offsets[code + 1]]] = True
+            bitmaps[value] = Bitmap.from_mask(mask)
+        return bitmaps
+
+    def empty(
+            self
+        ) -> Bitmap:
+        """
+        Gets the bitmap of no plays
+
+        Returns:
+            Bitmap: The empty bitmap
+        """
+        return Bitmap(np.zeros((self.size + 7) // 8, dtype=np.uint8), self.size)
+
+    def flag(
+            self,
+            flag: str
+        ) -> Bitmap:
+        """
+        Gets the bitmap of the plays with a binary flag set
+
+        Args:
+            flag (str): The flag column
+
+        Returns:
+            Bitmap: The plays with the flag set
+        """
+        if flag not in self.flags:
+            raise ValueError(f"Flag is not indexed: {flag}")
+        return self.flags[flag]
+
+    def value(
+            self,
+            column: str,
+            value: object
+        ) -> Bitmap:
+        """
+        Gets the bitmap of the plays with a value of an indexed column
+
+        Args:
+            column (str): The indexed column, e.g. season or play_type
+            value (object): The value of the column
+
+        Returns:
+            Bitmap: The plays with the value, empty if no play has it
+        """
+        if column not in self.values:
+            raise ValueError(f"Column is not indexed: {column}")
+        return self.values[column].get(value, self.empty())
+
+    def play_type(
+            self,
+            play_type: str
+        ) -> Bitmap:
+        """
+        Gets the bitmap of the plays of a play type
+
+        Args:
+            play_type (str): The play type, e.g. run or pass
+
+        Returns:
+            Bitmap: The plays of the play type
+        """
+        return self.value('play_type', play_type)
+
+    def team_season(
+            self,
+            side: str,
+            season: int,
+            team: str
+        ) -> Bitmap:
+        """
+        Gets the bitmap of the plays of a team in a season
+
+        Args:
+            side (str): The team column, posteam or defteam
+            season (int): The season
+            team (str): The team abbreviation
+
+        Returns:
+            Bitmap: The plays of the team in the season
+        """
+        return self.value('season', season) & self.value(side, team)
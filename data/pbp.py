@@ -1,7 +1,20 @@
-import nfl_data_py as nfl
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator
 import matplotlib.pyplot as plt
+from data.cache import load_nfl_pbp_data, unify_nfl_pbp_team_categories
+from data.dataset import cache_loader
+from data.skill import (
+    OFFENSE,
+    DEFENSE,
+    MinMaxBounds,
+    ScalerRegistry,
+    TeamSkillMetric,
+    label_team_season_skills,
+    passer_rating
+)
 from sklearn.preprocessing import OneHotEncoder
 
 NFL_PBP_YEARS = [
@@ -17,49 +30,434 @@ NFL_PBP_YEARS = [
     2015
 ]
 
-def load_clean_nfl_pbp_between_play_data(
-        years: list[int]=NFL_PBP_YEARS
-    ) -> pd.DataFrame:
+# The cleaned datasets which can be built from a single load
+NFL_PBP_DATASETS = [
+    'playcall',
+    'playresult',
+    'between_play',
+    'fieldgoal',
+    'run',
+    'pass',
+    'punt',
+    'kickoff'
+]
+
+# Plays on which a punt is returned
+PUNT_RETURN = 'punt_downed == 0 and punt_fair_catch == 0 and touchback == 0 and punt_out_of_bounds == 0'
+
+# Plays on which the quarterback is pressured
+QB_PRESSURE = 'qb_hit == 1 or sack == 1 or tackled_for_loss == 1'
+
+# Plays with a recorded play type (a missing play type never equals itself)
+CALLED_PLAY = 'play_type == play_type'
+
+# The one-hot encoded categories of the play result data, fixed so that the
+# same columns are encoded even if a category never occurs in the plays
+FIELD_GOAL_RESULTS = ['blocked', 'made', 'missed']
+PLAYRESULT_PLAY_TYPES = [
+    'short_pass',
+    'deep_pass',
+    'run_left',
+    'run_middle',
+    'run_right',
+    'kickoff',
+    'punt',
+    'extra_point',
+    'field_goal',
+    'qb_kneel',
+    'qb_spike',
+    'offense_timeout',
+    'defense_timeout'
+]
+
+FIELD_GOAL_SKILL_METRICS = [
+    # Field goal percent for and blocked percent against
+    TeamSkillMetric('field_goal_percent', OFFENSE, numerator='field_goal_result == "made"'),
+    TeamSkillMetric('blocked_percent_against', OFFENSE, numerator='field_goal_result == "blocked"'),
+
+    # Field goal percent against and blocked percent for
+    TeamSkillMetric('field_goal_percent_against', DEFENSE, numerator='field_goal_result == "made"'),
+    TeamSkillMetric('blocked_percent', DEFENSE, numerator='field_goal_result == "blocked"')
+]
+
+RUN_SKILL_METRICS = [
+    # Offensive skill properties
+    TeamSkillMetric('rushing', OFFENSE, value='rushing_yards'),
+    TeamSkillMetric('run_blocking', OFFENSE, numerator='tackled_for_loss == 1', complement=True),
+    TeamSkillMetric('ball_handling', OFFENSE, numerator='fumble == 1', complement=True),
+    TeamSkillMetric('rushing_penalties', OFFENSE, numerator='penalty == 1 and penalty_team == team', complement=True),
+
+    # Defensive skill properties
+    TeamSkillMetric('rush_defense', DEFENSE, value='rushing_yards', invert=True),
+    TeamSkillMetric('rush_blitzing', DEFENSE, numerator='tackled_for_loss == 1'),
+    TeamSkillMetric('forced_fumbles', DEFENSE, numerator='fumble == 1'),
+    TeamSkillMetric('rush_defense_penalties', DEFENSE, numerator='penalty == 1 and penalty_team == team', complement=True)
+]
+
+PASS_SKILL_METRICS = [
+    # Offensive skill properties
+    TeamSkillMetric('pass_blocking', OFFENSE, numerator=QB_PRESSURE, complement=True),
+    TeamSkillMetric('scrambling', OFFENSE, numerator='qb_scramble == 1'),
+    TeamSkillMetric('completion_percentage', OFFENSE, numerator='complete_pass == 1', normalize=False),
+    TeamSkillMetric('yards_per_attempt', OFFENSE, value='passing_yards', normalize=False),
+    TeamSkillMetric('touchdowns_per_attempt', OFFENSE, numerator='complete_pass == 1', value='pass_touchdown', normalize=False),
+    TeamSkillMetric('interceptions_per_attempt', OFFENSE, value='interception', normalize=False),
+    TeamSkillMetric(
+        'passing',
+        OFFENSE,
+        formula=lambda skills: passer_rating(
+            skills['completion_percentage'],
+            skills['yards_per_attempt'],
+            skills['touchdowns_per_attempt'],
+            skills['interceptions_per_attempt']
+        )
+    ),
+    TeamSkillMetric('receiving', OFFENSE, value='yards_after_catch', denominator='complete_pass == 1'),
+    TeamSkillMetric('pass_interceptions', OFFENSE, numerator='interception == 1', complement=True),
+
+    # Defensive skill properties
+    TeamSkillMetric('pass_rushing', DEFENSE, numerator=QB_PRESSURE),
+    TeamSkillMetric('completion_percentage_against', DEFENSE, numerator='complete_pass == 1', normalize=False),
+    TeamSkillMetric('yards_per_attempt_against', DEFENSE, value='passing_yards', normalize=False),
+    TeamSkillMetric('touchdowns_per_attempt_against', DEFENSE, numerator='complete_pass == 1', value='pass_touchdown', normalize=False),
+    TeamSkillMetric('interceptions_per_attempt_against', DEFENSE, value='interception', normalize=False),
+    TeamSkillMetric(
+        'pass_defense',
+        DEFENSE,
+        invert=True,
+        formula=lambda skills: passer_rating(
+            skills['completion_percentage_against'],
+            skills['yards_per_attempt_against'],
+            skills['touchdowns_per_attempt_against'],
+            skills['interceptions_per_attempt_against']
+        )
+    ),
+    TeamSkillMetric('coverage', DEFENSE, value='yards_after_catch', denominator='complete_pass == 1', invert=True),
+    TeamSkillMetric('def_interceptions', DEFENSE, numerator='interception == 1')
+]
+
+PUNT_SKILL_METRICS = [
+    # Punting skill => percentage of punts inside twenty
+    # Return defense skill => Return yards per punt return against
+    TeamSkillMetric('punting', OFFENSE, numerator='punt_inside_twenty == 1', complement=True, invert=True),
+    TeamSkillMetric('return_defense', OFFENSE, numerator=PUNT_RETURN, value='return_yards', denominator=PUNT_RETURN, invert=True),
+
+    # Blitzing skill => Percentage of punts blocked
+    # Returning skill => Return yards per punt return
+    TeamSkillMetric('blitzing', DEFENSE, numerator='punt_blocked == 1', invert=True),
+    TeamSkillMetric('returning', DEFENSE, numerator=PUNT_RETURN, value='return_yards', denominator=PUNT_RETURN)
+]
+
+KICKOFF_SKILL_METRICS = [
+    # Returning skill => Return yards per kickoff
+    TeamSkillMetric('returning', OFFENSE, value='return_yards'),
+
+    # Kicking skill => Percentage of kickoffs for a touchback
+    # Return defense skill => Return yards per kickoff against
+    TeamSkillMetric('kicking', DEFENSE, numerator='touchback == 1'),
+    TeamSkillMetric('return_defense', DEFENSE, value='return_yards', invert=True)
+]
+
+PLAYCALL_SKILL_METRICS = [
+    # Run percent => Percentage of called plays which are runs
+    # Go for it percent => Percentage of fourth downs with a run or pass
+    TeamSkillMetric('run_percent', OFFENSE, numerator='play_type == "run"', denominator=CALLED_PLAY),
+    TeamSkillMetric('go_for_it_percent', OFFENSE, numerator='down == 4 and (play_type == "run" or play_type == "pass")', denominator='down == 4')
+]
+
+BETWEEN_PLAY_SKILL_METRICS = [
+    # Average play duration => Seconds elapsed per play
+    # Up tempo => Seconds elapsed per play, where faster offenses are closer to 1
+    TeamSkillMetric('average_play_duration', OFFENSE, value='play_duration'),
+    TeamSkillMetric('up_tempo', OFFENSE, value='play_duration', invert=True)
+]
+
+# The raw columns read by prepare_nfl_pbp_data and the team-season labels
+NFL_PBP_SHARED_COLUMNS = [
+    'season',
+    'game_id',
+    'posteam',
+    'defteam',
+    'game_seconds_remaining',
+    'posteam_score',
+    'defteam_score',
+    'penalty',
+    'penalty_team'
+]
+
+# The raw columns read by each cleaned dataset, in addition to the shared columns
+NFL_PBP_DATASET_COLUMNS = {
+    'playcall': [
+        'qtr',
+        'half_seconds_remaining',
+        'down',
+        'ydstogo',
+        'yardline_100',
+        'defteam_timeouts_remaining',
+        'posteam_timeouts_remaining',
+        'no_huddle',
+        'play_type',
+        'goal_to_go',
+        'timeout',
+        'timeout_team',
+        'run_location',
+        'pass_length',
+        'desc'
+    ],
+    'playresult': [
+        'qtr',
+        'half_seconds_remaining',
+        'down',
+        'ydstogo',
+        'yardline_100',
+        'defteam_timeouts_remaining',
+        'posteam_timeouts_remaining',
+        'goal_to_go',
+        'play_type',
+        'run_location',
+        'pass_length',
+        'timeout',
+        'timeout_team',
+        'rush_attempt',
+        'pass_attempt',
+        'complete_pass',
+        'qb_scramble',
+        'qb_hit',
+        'sack',
+        'tackled_for_loss',
+        'rushing_yards',
+        'passing_yards',
+        'pass_touchdown',
+        'interception',
+        'yards_after_catch',
+        'fumble',
+        'first_down',
+        'field_goal_attempt',
+        'field_goal_result',
+        'punt_attempt',
+        'kickoff_attempt',
+        'penalty_yards',
+        'yards_gained',
+        'touchdown',
+        'out_of_bounds',
+        'desc'
+    ],
+    'between_play': [
+        'qtr',
+        'half_seconds_remaining',
+        'down',
+        'ydstogo',
+        'yardline_100',
+        'defteam_timeouts_remaining',
+        'posteam_timeouts_remaining',
+        'no_huddle',
+        'goal_to_go',
+        'timeout',
+        'timeout_team',
+        'out_of_bounds',
+        'incomplete_pass',
+        'desc'
+    ],
+    'fieldgoal': [
+        'yardline_100',
+        'field_goal_attempt',
+        'field_goal_result',
+        'return_yards',
+        'desc'
+    ],
+    'run': [
+        'qtr',
+        'half_seconds_remaining',
+        'down',
+        'ydstogo',
+        'yardline_100',
+        'defteam_timeouts_remaining',
+        'posteam_timeouts_remaining',
+        'goal_to_go',
+        'rush_attempt',
+        'rushing_yards',
+        'tackled_for_loss',
+        'fumble',
+        'penalty_yards',
+        'yards_gained',
+        'return_yards',
+        'touchdown'
+    ],
+    'pass': [
+        'yardline_100',
+        'pass_attempt',
+        'complete_pass',
+        'incomplete_pass',
+        'qb_scramble',
+        'qb_hit',
+        'sack',
+        'tackled_for_loss',
+        'passing_yards',
+        'pass_touchdown',
+        'interception',
+        'fumble',
+        'air_yards',
+        'yards_after_catch',
+        'return_yards',
+        'pass_length',
+        'yards_gained',
+        'desc'
+    ],
+    'punt': [
+        'yardline_100',
+        'punt_attempt',
+        'kick_distance',
+        'return_yards',
+        'out_of_bounds',
+        'fumble',
+        'punt_out_of_bounds',
+        'punt_blocked',
+        'punt_in_endzone',
+        'touchback',
+        'punt_inside_twenty',
+        'punt_fair_catch',
+        'punt_downed',
+        'desc'
+    ],
+    'kickoff': [
+        'kickoff_attempt',
+        'kick_distance',
+        'kickoff_inside_twenty',
+        'kickoff_in_endzone',
+        'kickoff_out_of_bounds',
+        'kickoff_downed',
+        'kickoff_fair_catch',
+        'return_yards',
+        'fumble',
+        'touchback',
+        'desc'
+    ]
+}
+
+def nfl_pbp_dataset_columns(
+        datasets: list[str]
+    ) -> list[str]:
     """
-    Loads historical NFL play-by-play data and cleans it for training the
-    between-play model
+    Gets the raw columns read when building the given cleaned datasets
 
     Args:
-        years (list[int]): The years of play-by-play data to load
+        datasets (list[str]): The names of the datasets
 
     Returns:
-        pd.DataFrame: The loaded & cleaned historical NFL play-by-play data
+        list[str]: The shared columns and the columns of each dataset
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(years, cache=False, alt_path=None)
+    columns = list(NFL_PBP_SHARED_COLUMNS)
+    for name in datasets:
+        columns += [column for column in NFL_PBP_DATASET_COLUMNS[name] if column not in columns]
+    return columns
 
-    # Derive play duration and drop outliers
+def prepare_nfl_pbp_data(
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Derives the columns shared by every cleaned dataset on raw NFL
+    play-by-play data
+
+    Args:
+        df (pd.DataFrame): Raw NFL play-by-play data
+
+    Returns:
+        pd.DataFrame: The play-by-play data with the shared columns
+    """
+    # Derive play duration
     df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
     df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+
+    # Derive score differential column
+    df["score_diff"] = df["posteam_score"] - df["defteam_score"]
+
+    # Derive whether the penalty was committed by the posteam
+    df['posteam_penalty'] = 0.0
+    df.loc[(df["penalty"] == True) & (df["penalty_team"] == df["posteam"]), "posteam_penalty"] = 1.0
+    return df
+
+def drop_play_duration_outliers(
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Drops the plays with a negative or outlying play duration
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data
+
+    Returns:
+        pd.DataFrame: The play-by-play data without duration outliers
+    """
+    return df.query('play_duration >= 0 and play_duration < 69.0')
+
+def load_prepared_nfl_pbp_season(
+        year: int,
+        columns: list[str]=None
+    ) -> pd.DataFrame:
+    """
+    Loads a single season of NFL play-by-play data with the columns shared by
+    every cleaned dataset
+
+    Args:
+        year (int): The season of play-by-play data to load
+        columns (list[str]): The raw columns to read, every column if None
+
+    Returns:
+        pd.DataFrame: The prepared play-by-play data for the season
+    """
+    return prepare_nfl_pbp_data(load_nfl_pbp_data([year], columns=columns))
+
+def load_prepared_nfl_pbp_data(
+        years: list[int]=NFL_PBP_YEARS,
+        columns: list[str]=None,
+        workers: int=1
+    ) -> pd.DataFrame:
+    """
+    Loads historical NFL play-by-play data with the columns shared by every
+    cleaned dataset.  The shared columns only depend on the plays of the same
+    game, so with several workers each season is loaded and prepared in its
+    own process.
+
+    Args:
+        years (list[int]): The years of play-by-play data to load
+        columns (list[str]): The raw columns to read, every column if None
+        workers (int): The number of processes preparing seasons in parallel
+
+    Returns:
+        pd.DataFrame: The prepared historical NFL play-by-play data
+    """
+    if workers < 1:
+        raise ValueError(f"Workers must be at least 1, got: {workers}")
+    if workers == 1:
+        return prepare_nfl_pbp_data(load_nfl_pbp_data(years, columns=columns))
+    with ProcessPoolExecutor(max_workers=min(workers, len(years))) as executor:
+        frames = list(executor.map(partial(load_prepared_nfl_pbp_season, columns=columns), years))
+    return unify_nfl_pbp_team_categories(pd.concat(frames, ignore_index=True))
+
+def clean_nfl_pbp_between_play_data(
+        df: pd.DataFrame,
+        skills: dict[str, pd.DataFrame]=None
+    ) -> pd.DataFrame:
+    """
+    Cleans prepared NFL play-by-play data for training the between-play model
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data without duration outliers
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+
+    Returns:
+        pd.DataFrame: The cleaned historical NFL play-by-play data
+    """
+    # Label with the raw and normalized average play duration
+    df = label_team_season_skills(df, BETWEEN_PLAY_SKILL_METRICS, skills=skills)
+
+    # Derive the properties of the previous play
     df['prev_play_duration'] = df['play_duration'].shift(-1)
     df['prev_play_out_of_bounds'] = df['out_of_bounds'].shift(-1)
     df['prev_play_incomplete_pass'] = df['incomplete_pass'].shift(-1)
     df['prev_play_timeout'] = df['timeout'].shift(-1)
 
-    season_posteam_groups = df.groupby(["season", "posteam"])
-    for groups, group in season_posteam_groups:
-        # Average play duration group
-        total_plays = len(group)
-        total_duration = group["play_duration"].sum()
-        average_play_duration = total_duration / total_plays
-        df.loc[
-            (df['season'] == groups[0]) & (df['posteam'] == groups[1]),
-            "average_play_duration"
-        ] = average_play_duration
-
-    # Normalize average play duration
-    min_avg_play_duration = df["average_play_duration"].min()
-    max_avg_play_duration = df["average_play_duration"].max()
-    df["norm_average_play_duration"] = (df["average_play_duration"] - min_avg_play_duration) / \
-        (max_avg_play_duration - min_avg_play_duration)
-
     # Clean the NFL play-by-play data
     df = df[
         [
@@ -68,8 +466,6 @@ def load_clean_nfl_pbp_between_play_data(
             "down",
             "ydstogo",
             "yardline_100",
-            "posteam_score",
-            "defteam_score",
             "defteam_timeouts_remaining",
             "posteam_timeouts_remaining",
             "no_huddle",
@@ -84,14 +480,10 @@ def load_clean_nfl_pbp_between_play_data(
             "prev_play_out_of_bounds",
             "prev_play_incomplete_pass",
             "prev_play_timeout",
-            "desc"
+            "desc",
+            "score_diff"
         ]
     ]
-    # Construct score differential column
-    df["score_diff"] = df["posteam_score"] - df["defteam_score"]
-    df = df.drop("posteam_score", axis=1)
-    df = df.drop("defteam_score", axis=1)
-
     # Clean null values
     df = df[df['half_seconds_remaining'].notna()]
     df = df[df['defteam_timeouts_remaining'].notna()]
@@ -109,12 +501,13 @@ def load_clean_nfl_pbp_between_play_data(
     # Return the cleaned dataframe
     return df
 
-def load_clean_nfl_pbp_playcall_data(
+@cache_loader(version=1)
+def load_clean_nfl_pbp_between_play_data(
         years: list[int]=NFL_PBP_YEARS
     ) -> pd.DataFrame:
     """
     Loads historical NFL play-by-play data and cleans it for training the
-    playcalling model
+    between-play model
 
     Args:
         years (list[int]): The years of play-by-play data to load
@@ -122,37 +515,27 @@ def load_clean_nfl_pbp_playcall_data(
     Returns:
         pd.DataFrame: The loaded & cleaned historical NFL play-by-play data
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(years, cache=False, alt_path=None)
-
-    season_posteam_groups = df.groupby(["season", "posteam"])
-    for groups, group in season_posteam_groups:
-        # Run playcall percent
-        run_percent = group["play_type"].value_counts(normalize=True)["run"]
-        df.loc[
-            (df['season'] == groups[0]) & (df['posteam'] == groups[1]),
-            "run_percent"
-        ] = run_percent
-
-        # Go for it on fourth percent
-        fourth_downs = group[group["down"] == 4]
-        total_fourth_downs = len(fourth_downs)
-        go_for_it_count = len(fourth_downs[(fourth_downs["play_type"] == "run") | (fourth_downs["play_type"] == "pass")])
-        p_go_for_it = go_for_it_count / total_fourth_downs
-        df.loc[
-            (df['season'] == groups[0]) & (df['posteam'] == groups[1]),
-            "go_for_it_percent"
-        ] = p_go_for_it
-
-    # Normalize run percent
-    min_run_percent = df["run_percent"].min()
-    max_run_percent = df["run_percent"].max()
-    df["norm_run_percent"] = (df["run_percent"] - min_run_percent) / \
-        (max_run_percent - min_run_percent)
-    min_go_for_it_percent = df["go_for_it_percent"].min()
-    max_go_for_it_percent = df["go_for_it_percent"].max()
-    df["norm_go_for_it_percent"] = (df["go_for_it_percent"] - min_go_for_it_percent) / \
-        (max_go_for_it_percent - min_go_for_it_percent)
+    columns = nfl_pbp_dataset_columns(['between_play'])
+    df = drop_play_duration_outliers(load_prepared_nfl_pbp_data(years, columns=columns))
+    return clean_nfl_pbp_between_play_data(df)
+
+def clean_nfl_pbp_playcall_data(
+        df: pd.DataFrame,
+        skills: dict[str, pd.DataFrame]=None
+    ) -> pd.DataFrame:
+    """
+    Cleans prepared NFL play-by-play data for training the playcalling model
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data, including outliers
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+
+    Returns:
+        pd.DataFrame: The cleaned historical NFL play-by-play data
+    """
+    # Label with the raw and normalized run and go for it percents
+    df = label_team_season_skills(df, PLAYCALL_SKILL_METRICS, skills=skills)
 
     # Clean the NFL play-by-play data
     df = df[
@@ -162,8 +545,6 @@ def load_clean_nfl_pbp_playcall_data(
             "down",
             "ydstogo",
             "yardline_100",
-            "posteam_score",
-            "defteam_score",
             "defteam_timeouts_remaining",
             "posteam_timeouts_remaining",
             "no_huddle",
@@ -178,14 +559,10 @@ def load_clean_nfl_pbp_playcall_data(
             "timeout_team",
             "run_location",
             "pass_length",
-            "desc"
+            "desc",
+            "score_diff"
         ]
     ]
-    # Construct score differential column
-    df["score_diff"] = df["posteam_score"] - df["defteam_score"]
-    df = df.drop("posteam_score", axis=1)
-    df = df.drop("defteam_score", axis=1)
-
     # Clean null values
     df = df[df['half_seconds_remaining'].notna()]
     df = df[df['defteam_timeouts_remaining'].notna()]
@@ -213,98 +590,64 @@ def load_clean_nfl_pbp_playcall_data(
     # Return the cleaned dataframe
     return df
 
-def load_clean_nfl_pbp_fieldgoal_data(
-        years: list[int]=NFL_PBP_YEARS,
-        clean_columns: bool=True
-    ):
+@cache_loader(version=1)
+def load_clean_nfl_pbp_playcall_data(
+        years: list[int]=NFL_PBP_YEARS
+    ) -> pd.DataFrame:
     """
     Loads historical NFL play-by-play data and cleans it for training the
-    field goal result model
+    playcalling model
 
     Args:
         years (list[int]): The years of play-by-play data to load
+
+    Returns:
+        pd.DataFrame: The loaded & cleaned historical NFL play-by-play data
+    """
+    columns = nfl_pbp_dataset_columns(['playcall'])
+    df = load_prepared_nfl_pbp_data(years, columns=columns)
+    return clean_nfl_pbp_playcall_data(df)
+
+def clean_nfl_pbp_fieldgoal_data(
+        df: pd.DataFrame,
+        clean_columns: bool=True,
+        skills: dict[str, pd.DataFrame]=None,
+        bounds: MinMaxBounds=None
+    ) -> pd.DataFrame:
+    """
+    Cleans prepared NFL play-by-play data for training the field goal result
+    model
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data without duration outliers
         clean_columns (bool): Whether to drop irrelevant columns
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+        bounds (MinMaxBounds): The bounds of the normalized skill diffs,
+            the bounds over the given plays if None
     
     Returns:
-        pd.DataFrame: The loaded & cleaned historicla NFL field goal data
+        pd.DataFrame: The cleaned historical NFL field goal data
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(NFL_PBP_YEARS, cache=False, alt_path=None)
-
-    # Derive play duration and drop outliers
-    df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
-    df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+    bounds = MinMaxBounds() if bounds is None else bounds
 
-    # Derive the field goal kicking and field goal defense properties
+    # Label with the field goal kicking and field goal defense properties
     field_goal_attempts = df.query("field_goal_attempt == 1")
-    season_posteam_groups = field_goal_attempts.groupby(["season", "posteam"])
-    season_defteam_groups = field_goal_attempts.groupby(["season", "defteam"])
-
-    # Loop through each group, get field goal proportion for and against, label
-    for groups, group in season_posteam_groups:
-        # Field goal percent for
-        fg_percent = group["field_goal_result"].value_counts(normalize=True)["made"]
-        field_goal_attempts.loc[
-            (field_goal_attempts['season'] == groups[0]) & (field_goal_attempts['posteam'] == groups[1]),
-            "field_goal_percent"
-        ] = fg_percent
-
-        # Field goal blocked percent against
-        blocked_percent = group["field_goal_result"].value_counts(normalize=True).get("blocked", 0)
-        field_goal_attempts.loc[
-            (field_goal_attempts['season'] == groups[0]) & (field_goal_attempts['posteam'] == groups[1]),
-            "blocked_percent_against"
-        ] = blocked_percent
-    for groups, group in season_defteam_groups:
-        # Field goal percent against
-        fg_percent_against = group["field_goal_result"].value_counts(normalize=True)["made"]
-        field_goal_attempts.loc[
-            (field_goal_attempts['season'] == groups[0]) & (field_goal_attempts['defteam'] == groups[1]),
-            "field_goal_percent_against"
-        ] = fg_percent_against
-
-        # Field goal blocked percent for
-        blocked_percent = group["field_goal_result"].value_counts(normalize=True).get("blocked", 0)
-        field_goal_attempts.loc[
-            (field_goal_attempts['season'] == groups[0]) & (field_goal_attempts['defteam'] == groups[1]),
-            "blocked_percent"
-        ] = blocked_percent
-
-    # Normalize the field goal percent for and field goal percent against column
-    min_fg_percent = field_goal_attempts["field_goal_percent"].min()
-    max_fg_percent = field_goal_attempts["field_goal_percent"].max()
-    field_goal_attempts["norm_field_goal_percent"] = (field_goal_attempts["field_goal_percent"] - min_fg_percent) \
-        / (max_fg_percent - min_fg_percent)
-    min_fg_percent_against = field_goal_attempts["field_goal_percent_against"].min()
-    max_fg_percent_against = field_goal_attempts["field_goal_percent_against"].max()
-    field_goal_attempts["norm_field_goal_percent_against"] = (field_goal_attempts["field_goal_percent_against"] - min_fg_percent_against) \
-        / (max_fg_percent_against - min_fg_percent_against)
-    
-    # Normalize the field goal blocked percent for and against columns
-    min_blocked_percent_against = field_goal_attempts["blocked_percent_against"].min()
-    max_blocked_percent_against = field_goal_attempts["blocked_percent_against"].max()
-    field_goal_attempts["norm_blocked_percent_against"] = (field_goal_attempts["blocked_percent_against"] - min_blocked_percent_against) \
-        / (max_blocked_percent_against - min_blocked_percent_against)
-    min_blocked_percent = field_goal_attempts["blocked_percent"].min()
-    max_blocked_percent = field_goal_attempts["blocked_percent"].max()
-    field_goal_attempts["norm_blocked_percent"] = (field_goal_attempts["blocked_percent"] - min_blocked_percent) \
-        / (max_blocked_percent - min_blocked_percent)
+    field_goal_attempts = label_team_season_skills(field_goal_attempts, FIELD_GOAL_SKILL_METRICS, skills=skills)
 
     # Calculate and normalize the field goal diffs
     field_goal_attempts["diff_field_goal_percent"] = field_goal_attempts["norm_field_goal_percent"] \
         - field_goal_attempts["norm_field_goal_percent_against"]
-    min_diff_fg_percent = field_goal_attempts["diff_field_goal_percent"].min()
-    max_diff_fg_percent = field_goal_attempts["diff_field_goal_percent"].max()
-    field_goal_attempts["norm_diff_field_goal_percent"] = (field_goal_attempts["diff_field_goal_percent"] - min_diff_fg_percent) \
-        / (max_diff_fg_percent - min_diff_fg_percent)
+    field_goal_attempts["norm_diff_field_goal_percent"] = bounds.normalize(
+        "diff_field_goal_percent",
+        field_goal_attempts["diff_field_goal_percent"]
+    )
     field_goal_attempts["diff_blocked_percent"] = field_goal_attempts["norm_blocked_percent_against"] \
         - field_goal_attempts["norm_blocked_percent"]
-    min_diff_blocked_percent = field_goal_attempts["diff_blocked_percent"].min()
-    max_diff_blocked_percent = field_goal_attempts["diff_blocked_percent"].max()
-    field_goal_attempts["norm_diff_blocked_percent"] = (field_goal_attempts["diff_blocked_percent"] - min_diff_blocked_percent) \
-        / (max_diff_blocked_percent - min_diff_blocked_percent)
+    field_goal_attempts["norm_diff_blocked_percent"] = bounds.normalize(
+        "diff_blocked_percent",
+        field_goal_attempts["diff_blocked_percent"]
+    )
 
     # Drop irrelevant columns if requested
     if clean_columns:
@@ -323,179 +666,70 @@ def load_clean_nfl_pbp_fieldgoal_data(
         ]
     return field_goal_attempts
 
-def load_clean_nfl_pbp_run_data(
+@cache_loader(version=1)
+def load_clean_nfl_pbp_fieldgoal_data(
         years: list[int]=NFL_PBP_YEARS,
         clean_columns: bool=True
-    ):
+    ) -> pd.DataFrame:
     """
     Loads historical NFL play-by-play data and cleans it for training the
-    run result model
+    field goal result model
 
     Args:
         years (list[int]): The years of play-by-play data to load
         clean_columns (bool): Whether to drop irrelevant columns
-    
+
     Returns:
-        pd.DataFrame: The loaded & cleaned historicla NFL rushing data
+        pd.DataFrame: The loaded & cleaned historical NFL field goal data
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(years, cache=False, alt_path=None)
-
-    # Derive score differential column
-    df["score_diff"] = df["posteam_score"] - df["defteam_score"]
-
-    # Derive play duration and drop outliers
-    df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
-    df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+    # Read every column unless irrelevant columns are dropped
+    columns = nfl_pbp_dataset_columns(['fieldgoal']) if clean_columns else None
+    df = drop_play_duration_outliers(load_prepared_nfl_pbp_data(years, columns=columns))
+    return clean_nfl_pbp_fieldgoal_data(df, clean_columns=clean_columns)
+
+def clean_nfl_pbp_run_data(
+        df: pd.DataFrame,
+        clean_columns: bool=True,
+        skills: dict[str, pd.DataFrame]=None,
+        bounds: MinMaxBounds=None
+    ) -> pd.DataFrame:
+    """
+    Cleans prepared NFL play-by-play data for training the run result model
 
-    # Derive whether the penalty was committed by the posteam
-    df['posteam_penalty'] = 0.0
-    df.loc[(df["penalty"] == True) & (df["penalty_team"] == df["posteam"]), "posteam_penalty"] = 1.0
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data without duration outliers
+        clean_columns (bool): Whether to drop irrelevant columns
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+        bounds (MinMaxBounds): The bounds of the normalized skill diffs,
+            the bounds over the given plays if None
+    
+    Returns:
+        pd.DataFrame: The cleaned historical NFL rushing data
+    """
+    bounds = MinMaxBounds() if bounds is None else bounds
+    rush_attempts = df.query("rush_attempt == 1")
 
     # Clean null penalty yards values
-    df['penalty_yards'] = df['penalty_yards'].fillna(0)
-    df = df.dropna(subset=['down'])
+    rush_attempts['penalty_yards'] = rush_attempts['penalty_yards'].fillna(0)
+    rush_attempts = rush_attempts.dropna(subset=['down'])
 
-    # Derive the rushing, rush defense, blocking, blitzing, turnover properties
-    rush_attempts = df.query("rush_attempt == 1")
-    season_posteam_groups = rush_attempts.groupby(["season", "posteam"])
-    season_defteam_groups = rush_attempts.groupby(["season", "defteam"])
-
-    # Loop through each group, get rushing, blocking, turnover properties
-    for groups, group in season_posteam_groups:
-        # Rushing
-        total_rush_attempts = len(group)
-        total_rushing_yards = group['rushing_yards'].sum()
-        rushing = total_rushing_yards / total_rush_attempts
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['posteam'] == groups[1]),
-            "rushing"
-        ] = rushing
-
-        # Run blocking
-        tackled_for_loss = len(
-            group.query('tackled_for_loss == 1')
-        )
-        blocking = 1 - (tackled_for_loss / total_rush_attempts)
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['posteam'] == groups[1]),
-            "run_blocking"
-        ] = blocking
-
-        # Ball handling
-        total_rushing_turnovers = len(
-            group.query('fumble == 1')
-        )
-        ball_handling = 1 - (total_rushing_turnovers / total_rush_attempts)
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['posteam'] == groups[1]),
-            "ball_handling"
-        ] = ball_handling
-
-        # Rushing penalties
-        total_rushing_penalties = len(
-            group.query(f'penalty == 1 and penalty_team == "{groups[1]}"')
-        )
-        rushing_penalties = 1 - (total_rushing_penalties / total_rush_attempts)
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['posteam'] == groups[1]),
-            "rushing_penalties"
-        ] = rushing_penalties
-    for groups, group in season_defteam_groups:
-        # Rush defense
-        total_rush_attempts_against = len(group)
-        total_rushing_yards_against = group['rushing_yards'].sum()
-        rush_defense = total_rushing_yards_against / total_rush_attempts_against
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['defteam'] == groups[1]),
-            "rush_defense"
-        ] = rush_defense
-
-        # Rush blitzing
-        rushing_tackle_for_loss = len(
-            group.query('tackled_for_loss == 1')
-        )
-        rush_blitzing = rushing_tackle_for_loss / total_rush_attempts_against
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['defteam'] == groups[1]),
-            "rush_blitzing"
-        ] = rush_blitzing
-
-        # Forced fumbles
-        total_forced_fumbles = len(
-            group.query('fumble == 1')
-        )
-        forced_fumbles = total_forced_fumbles / total_rush_attempts_against
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['defteam'] == groups[1]),
-            "forced_fumbles"
-        ] = forced_fumbles
-
-        # Rush defense penalties
-        total_defensive_penalties = len(
-            group.query(f'penalty == 1 and penalty_team == "{groups[1]}"')
-        )
-        rush_defense_penalties = 1 - (total_defensive_penalties / total_rush_attempts_against)
-        rush_attempts.loc[
-            (rush_attempts['season'] == groups[0]) & (rush_attempts['defteam'] == groups[1]),
-            "rush_defense_penalties"
-        ] = rush_defense_penalties
-    
-    # Normalize each offensive skill property
-    min_rushing = rush_attempts["rushing"].min()
-    max_rushing = rush_attempts["rushing"].max()
-    rush_attempts["norm_rushing"] = (rush_attempts["rushing"] - min_rushing) \
-        / (max_rushing - min_rushing)
-    min_blocking = rush_attempts["run_blocking"].min()
-    max_blocking = rush_attempts["run_blocking"].max()
-    rush_attempts["norm_run_blocking"] = (rush_attempts["run_blocking"] - min_blocking) \
-        / (max_blocking - min_blocking)
-    min_handling = rush_attempts["ball_handling"].min()
-    max_handling = rush_attempts["ball_handling"].max()
-    rush_attempts["norm_ball_handling"] = (rush_attempts["ball_handling"] - min_handling) \
-        / (max_handling - min_handling)
-    min_off_penalties = rush_attempts["rushing_penalties"].min()
-    max_off_penalties = rush_attempts["rushing_penalties"].max()
-    rush_attempts["norm_rushing_penalties"] = (rush_attempts["rushing_penalties"] - min_off_penalties) \
-        / (max_off_penalties - min_off_penalties)
-    
-    # Normalize each defensive skill property
-    min_rush_defense = rush_attempts["rush_defense"].min()
-    max_rush_defense = rush_attempts["rush_defense"].max()
-    rush_attempts["norm_rush_defense"] = 1 \
-        - ((rush_attempts["rush_defense"] - min_rush_defense) \
-        / (max_rush_defense - min_rush_defense))
-    min_blitzing = rush_attempts["rush_blitzing"].min()
-    max_blitzing = rush_attempts["rush_blitzing"].max()
-    rush_attempts["norm_rush_blitzing"] = (rush_attempts["rush_blitzing"] - min_blitzing) \
-        / (max_blitzing - min_blitzing)
-    min_ff = rush_attempts["forced_fumbles"].min()
-    max_ff = rush_attempts["forced_fumbles"].max()
-    rush_attempts["norm_forced_fumbles"] = (rush_attempts["forced_fumbles"] - min_ff) \
-        / (max_ff - min_ff)
-    min_def_penalties = rush_attempts["rush_defense_penalties"].min()
-    max_def_penalties = rush_attempts["rush_defense_penalties"].max()
-    rush_attempts["norm_rush_defense_penalties"] = (rush_attempts["rush_defense_penalties"] - min_def_penalties) \
-        / (max_def_penalties - min_def_penalties)
+    # Label with the rushing, rush defense, blocking, blitzing, turnover properties
+    rush_attempts = label_team_season_skills(rush_attempts, RUN_SKILL_METRICS, skills=skills)
 
     # Calculate the normalized skill diffs for relevant properties
     rush_attempts["diff_rushing"] = rush_attempts["rushing"] - rush_attempts["rush_defense"]
-    min_diff_rushing = rush_attempts["diff_rushing"].min()
-    max_diff_rushing = rush_attempts["diff_rushing"].max()
-    rush_attempts["norm_diff_rushing"] = (rush_attempts["diff_rushing"] - min_diff_rushing) \
-        / (max_diff_rushing - min_diff_rushing)
+    rush_attempts["norm_diff_rushing"] = bounds.normalize("diff_rushing", rush_attempts["diff_rushing"])
     rush_attempts["diff_blocking_blitzing"] = rush_attempts["run_blocking"] - rush_attempts["rush_blitzing"]
-    min_diff_blocking = rush_attempts["diff_blocking_blitzing"].min()
-    max_diff_blocking = rush_attempts["diff_blocking_blitzing"].max()
-    rush_attempts["norm_diff_blocking_blitzing"] = (rush_attempts["diff_blocking_blitzing"] - min_diff_blocking) \
-        / (max_diff_blocking - min_diff_blocking)
+    rush_attempts["norm_diff_blocking_blitzing"] = bounds.normalize(
+        "diff_blocking_blitzing",
+        rush_attempts["diff_blocking_blitzing"]
+    )
     rush_attempts["diff_ball_handling"] = rush_attempts["norm_ball_handling"] - rush_attempts["norm_forced_fumbles"]
-    min_diff_handling = rush_attempts["diff_ball_handling"].min()
-    max_diff_handling = rush_attempts["diff_ball_handling"].max()
-    rush_attempts["norm_diff_ball_handling"] = (rush_attempts["diff_ball_handling"] - min_diff_handling) \
-        / (max_diff_handling - min_diff_handling)
+    rush_attempts["norm_diff_ball_handling"] = bounds.normalize(
+        "diff_ball_handling",
+        rush_attempts["diff_ball_handling"]
+    )
     
     # Drop irrelevant columns if requested
     if clean_columns:
@@ -532,201 +766,68 @@ def load_clean_nfl_pbp_run_data(
         ]
     return rush_attempts
 
-def load_clean_nfl_pbp_pass_data(
+@cache_loader(version=1)
+def load_clean_nfl_pbp_run_data(
         years: list[int]=NFL_PBP_YEARS,
         clean_columns: bool=True
-    ):
-    df = nfl.import_pbp_data(years, cache=False, alt_path=None)
+    ) -> pd.DataFrame:
+    """
+    Loads historical NFL play-by-play data and cleans it for training the
+    run result model
 
-    # Derive play duration and drop outliers
-    df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
-    df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+    Args:
+        years (list[int]): The years of play-by-play data to load
+        clean_columns (bool): Whether to drop irrelevant columns
 
+    Returns:
+        pd.DataFrame: The loaded & cleaned historical NFL rushing data
+    """
+    # Read every column unless irrelevant columns are dropped
+    columns = nfl_pbp_dataset_columns(['run']) if clean_columns else None
+    df = drop_play_duration_outliers(load_prepared_nfl_pbp_data(years, columns=columns))
+    return clean_nfl_pbp_run_data(df, clean_columns=clean_columns)
+
+def clean_nfl_pbp_pass_data(
+        df: pd.DataFrame,
+        clean_columns: bool=True,
+        skills: dict[str, pd.DataFrame]=None,
+        bounds: MinMaxBounds=None
+    ) -> pd.DataFrame:
+    """
+    Cleans prepared NFL play-by-play data for training the pass result model
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data without duration outliers
+        clean_columns (bool): Whether to drop irrelevant columns
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+        bounds (MinMaxBounds): The bounds of the normalized skill diffs,
+            the bounds over the given plays if None
+
+    Returns:
+        pd.DataFrame: The cleaned historical NFL passing data
+    """
+    bounds = MinMaxBounds() if bounds is None else bounds
     pass_attempts = df.query("pass_attempt == 1 or qb_scramble == 1")
 
-    # Label with raw skill levels
-    season_posteam_groups = pass_attempts.groupby(["season", "posteam"])
-    season_defteam_groups = pass_attempts.groupby(["season", "defteam"])
-    for groups, group in season_posteam_groups:
-        # Pass blocking
-        total_pass_attempts = len(group)
-        pressures = len(
-            group.query('qb_hit == 1 or sack == 1 or tackled_for_loss == 1')
-        )
-        blocking = 1 - (pressures / total_pass_attempts)
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['posteam'] == groups[1]),
-            "pass_blocking"
-        ] = blocking
-
-        # Scrambling
-        scrambles = len(
-            group.query('qb_scramble == 1')
-        )
-        scrambling = scrambles / total_pass_attempts
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['posteam'] == groups[1]),
-            "scrambling"
-        ] = scrambling
-
-        # Passing
-        completions = group.query("complete_pass == 1")
-        total_pass_completions = len(completions)
-        total_pass_yards = group['passing_yards'].sum()
-        total_pass_touchdowns = completions['pass_touchdown'].sum()
-        total_pass_interceptions = group['interception'].sum()
-        passing = ((
-            ( # a
-                ((total_pass_completions / total_pass_attempts) - 0.3) * 5
-            ) +
-            ( # b
-                ((total_pass_yards / total_pass_attempts) - 3) * 0.25
-            ) +
-            ( # c
-                (total_pass_touchdowns / total_pass_attempts) * 20
-            ) +
-            ( # d
-                2.375 - ((total_pass_interceptions / total_pass_attempts) * 25)
-            )
-        ) / 6) * 100
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['posteam'] == groups[1]),
-            "passing"
-        ] = passing
-
-        # Receiving
-        total_yac = group["yards_after_catch"].sum()
-        yac_per_completion = total_yac / total_pass_completions
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['posteam'] == groups[1]),
-            "receiving"
-        ] = yac_per_completion
-
-        # Interceptions
-        interceptions = len(group.query("interception == 1"))
-        pass_interceptions = 1 - (interceptions / total_pass_attempts)
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['posteam'] == groups[1]),
-            "pass_interceptions"
-        ] = pass_interceptions
-    for groups, group in season_defteam_groups:
-        # Pass rushing
-        total_pass_attempts_against = len(group)
-        pressures_against = len(
-            group.query('qb_hit == 1 or sack == 1 or tackled_for_loss == 1')
-        )
-        blitzing = pressures_against / total_pass_attempts_against
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['defteam'] == groups[1]),
-            "pass_rushing"
-        ] = blitzing
-
-        # Pass defense
-        completions = group.query("complete_pass == 1")
-        total_pass_completions = len(completions)
-        total_pass_yards = group['passing_yards'].sum()
-        total_pass_touchdowns = completions['pass_touchdown'].sum()
-        total_pass_interceptions = group['interception'].sum()
-        pass_defense = ((
-            ( # a
-                ((total_pass_completions / total_pass_attempts) - 0.3) * 5
-            ) +
-            ( # b
-                ((total_pass_yards / total_pass_attempts) - 3) * 0.25
-            ) +
-            ( # c
-                (total_pass_touchdowns / total_pass_attempts) * 20
-            ) +
-            ( # d
-                2.375 - ((total_pass_interceptions / total_pass_attempts) * 25)
-            )
-        ) / 6) * 100
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['defteam'] == groups[1]),
-            "pass_defense"
-        ] = pass_defense
-
-        # Receiving
-        total_yac_against = group["yards_after_catch"].sum()
-        yac_per_completion_against = total_yac_against / total_pass_completions
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['defteam'] == groups[1]),
-            "coverage"
-        ] = yac_per_completion_against
-
-        # Interceptions
-        interceptions = len(group.query("interception == 1"))
-        def_interceptions = interceptions / total_pass_attempts
-        pass_attempts.loc[
-            (pass_attempts['season'] == groups[0]) & (pass_attempts['defteam'] == groups[1]),
-            "def_interceptions"
-        ] = def_interceptions
-
-    # Label with normalized skill levels
-    min_passing = pass_attempts["passing"].min()
-    max_passing = pass_attempts["passing"].max()
-    pass_attempts["norm_passing"] = (pass_attempts["passing"] - min_passing) \
-        / (max_passing - min_passing)
-    min_receiving = pass_attempts["receiving"].min()
-    max_receiving = pass_attempts["receiving"].max()
-    pass_attempts["norm_receiving"] = (pass_attempts["receiving"] - min_receiving) \
-        / (max_receiving - min_receiving)
-    min_blocking = pass_attempts["pass_blocking"].min()
-    max_blocking = pass_attempts["pass_blocking"].max()
-    pass_attempts["norm_pass_blocking"] = (pass_attempts["pass_blocking"] - min_blocking) \
-        / (max_blocking - min_blocking)
-    min_scrambling = pass_attempts["scrambling"].min()
-    max_scrambling = pass_attempts["scrambling"].max()
-    pass_attempts["norm_scrambling"] = (pass_attempts["scrambling"] - min_scrambling) \
-        / (max_scrambling - min_scrambling)
-    min_pass_int = pass_attempts["pass_interceptions"].min()
-    max_pass_int = pass_attempts["pass_interceptions"].max()
-    pass_attempts["norm_pass_interceptions"] = (pass_attempts["pass_interceptions"] - min_pass_int) \
-        / (max_pass_int - min_pass_int)
-    min_pass_defense = pass_attempts["pass_defense"].min()
-    max_pass_defense = pass_attempts["pass_defense"].max()
-    pass_attempts["norm_pass_defense"] = 1 - (
-        (pass_attempts["pass_defense"] - min_pass_defense) \
-            / (max_pass_defense - min_pass_defense)
-    )
-    min_coverage = pass_attempts["coverage"].min()
-    max_coverage = pass_attempts["coverage"].max()
-    pass_attempts["norm_coverage"] = 1 - (
-        (pass_attempts["coverage"] - min_coverage) \
-            / (max_coverage - min_coverage)
-    )
-    min_blitzing = pass_attempts["pass_rushing"].min()
-    max_blitzing = pass_attempts["pass_rushing"].max()
-    pass_attempts["norm_pass_rushing"] = (pass_attempts["pass_rushing"] - min_blitzing) \
-        / (max_blitzing - min_blitzing)
-    min_def_int = pass_attempts["def_interceptions"].min()
-    max_def_int = pass_attempts["def_interceptions"].max()
-    pass_attempts["norm_def_interceptions"] = (pass_attempts["def_interceptions"] - min_def_int) \
-        / (max_def_int - min_def_int)
+    # Label with raw and normalized skill levels
+    pass_attempts = label_team_season_skills(pass_attempts, PASS_SKILL_METRICS, skills=skills)
 
     # Label with normalized skill differentials
     pass_attempts["diff_passing"] = pass_attempts["norm_passing"] - pass_attempts["norm_pass_defense"]
-    min_diff_passing = pass_attempts["diff_passing"].min()
-    max_diff_passing = pass_attempts["diff_passing"].max()
-    pass_attempts["norm_diff_passing"] = (pass_attempts["diff_passing"] - min_diff_passing) \
-        / (max_diff_passing - min_diff_passing)
+    pass_attempts["norm_diff_passing"] = bounds.normalize("diff_passing", pass_attempts["diff_passing"])
     pass_attempts["diff_receiving"] = pass_attempts["norm_receiving"] - pass_attempts["norm_coverage"]
-    min_diff_receiving = pass_attempts["diff_receiving"].min()
-    max_diff_receiving = pass_attempts["diff_receiving"].max()
-    pass_attempts["norm_diff_receiving"] = (pass_attempts["diff_receiving"] - min_diff_receiving) \
-        / (max_diff_receiving - min_diff_receiving)
+    pass_attempts["norm_diff_receiving"] = bounds.normalize("diff_receiving", pass_attempts["diff_receiving"])
     pass_attempts["diff_pass_blocking_rushing"] = pass_attempts["norm_pass_blocking"] - pass_attempts["norm_pass_rushing"]
-    min_diff_blocking = pass_attempts["diff_pass_blocking_rushing"].min()
-    max_diff_blocking = pass_attempts["diff_pass_blocking_rushing"].max()
-    pass_attempts["norm_diff_pass_blocking_rushing"] = (pass_attempts["diff_pass_blocking_rushing"] - min_diff_blocking) \
-        / (max_diff_blocking - min_diff_blocking)
+    pass_attempts["norm_diff_pass_blocking_rushing"] = bounds.normalize(
+        "diff_pass_blocking_rushing",
+        pass_attempts["diff_pass_blocking_rushing"]
+    )
     pass_attempts["diff_interceptions"] = pass_attempts["norm_pass_interceptions"] - pass_attempts["norm_def_interceptions"]
-    min_diff_int = pass_attempts["diff_interceptions"].min()
-    max_diff_int = pass_attempts["diff_interceptions"].max()
-    pass_attempts["norm_diff_interceptions"] = (pass_attempts["diff_interceptions"] - min_diff_int) \
-        / (max_diff_int - min_diff_int)
+    pass_attempts["norm_diff_interceptions"] = bounds.normalize(
+        "diff_interceptions",
+        pass_attempts["diff_interceptions"]
+    )
 
     # Return the dataframe
     if clean_columns:
@@ -774,105 +875,54 @@ def load_clean_nfl_pbp_pass_data(
         ]
     return pass_attempts
 
-def load_clean_nfl_pbp_punt_data(
-        years: list[int]=NFL_PBP_YEARS
-    ):
+@cache_loader(version=1)
+def load_clean_nfl_pbp_pass_data(
+        years: list[int]=NFL_PBP_YEARS,
+        clean_columns: bool=True
+    ) -> pd.DataFrame:
     """
     Loads historical NFL play-by-play data and cleans it for training the
-    punt result model
+    pass result model
+
+    Args:
+        years (list[int]): The years of play-by-play data to load
+        clean_columns (bool): Whether to drop irrelevant columns
+
+    Returns:
+        pd.DataFrame: The loaded & cleaned historical NFL passing data
+    """
+    # Read every column unless irrelevant columns are dropped
+    columns = nfl_pbp_dataset_columns(['pass']) if clean_columns else None
+    df = drop_play_duration_outliers(load_prepared_nfl_pbp_data(years, columns=columns))
+    return clean_nfl_pbp_pass_data(df, clean_columns=clean_columns)
+
+def clean_nfl_pbp_punt_data(
+        df: pd.DataFrame,
+        skills: dict[str, pd.DataFrame]=None,
+        bounds: MinMaxBounds=None
+    ) -> pd.DataFrame:
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(NFL_PBP_YEARS, cache=False, alt_path=None)
+    Cleans prepared NFL play-by-play data for training the punt result model
 
-    # Derive play duration and drop outliers
-    df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
-    df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data without duration outliers
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+        bounds (MinMaxBounds): The bounds of the normalized skill diffs,
+            the bounds over the given plays if None
 
+    Returns:
+        pd.DataFrame: The cleaned historical NFL punt data
+    """
+    bounds = MinMaxBounds() if bounds is None else bounds
     punt_plays = df.query("punt_attempt == 1")
 
-    # Punting and punt return skill levels
-    # Punting skill => percentage of punts inside twenty
-    # Return defense skill => Return yards per punt return against
-    # Returning skill => Return yards per punt return
-    season_posteam_groups = punt_plays.groupby(["season", "posteam"])
-    season_defteam_groups = punt_plays.groupby(["season", "defteam"])
-    for groups, group in season_posteam_groups:
-        # Derive punting skill
-        total_punt_attempts = len(group)
-        punts_inside_twenty = len(
-            group.query('punt_inside_twenty == 1')
-        )
-        punting = 1 - (punts_inside_twenty / total_punt_attempts)
-        punt_plays.loc[
-            (punt_plays['season'] == groups[0]) & (punt_plays['posteam'] == groups[1]),
-            "punting"
-        ] = punting
-
-        # Derive return defense skill
-        punt_returns = group.query(
-            'punt_downed == 0 and punt_fair_catch == 0 and touchback == 0 and punt_out_of_bounds == 0'
-        )
-        total_punt_returns = len(punt_returns)
-        total_return_yards = punt_returns['return_yards'].sum()
-        return_defense = total_return_yards / total_punt_returns
-        punt_plays.loc[
-            (punt_plays['season'] == groups[0]) & (punt_plays['posteam'] == groups[1]),
-            "return_defense"
-        ] = return_defense
-    for groups, group in season_defteam_groups:
-        # Derive blitzing skill
-        total_punts = len(group)
-        total_punt_blocks = len(group.query('punt_blocked == 1'))
-        blitzing = total_punt_blocks / total_punts
-        punt_plays.loc[
-            (punt_plays['season'] == groups[0]) & (punt_plays['posteam'] == groups[1]),
-            "blitzing"
-        ] = blitzing
-
-        # Derive returning skill
-        punt_returns = group.query(
-            'punt_downed == 0 and punt_fair_catch == 0 and touchback == 0 and punt_out_of_bounds == 0'
-        )
-        total_punt_returns = len(punt_returns)
-        total_return_yards = punt_returns['return_yards'].sum()
-        returning = total_return_yards / total_punt_returns
-        punt_plays.loc[
-            (punt_plays['season'] == groups[0]) & (punt_plays['defteam'] == groups[1]),
-            "returning"
-        ] = returning
-
-    # Normalize punting, returning, return defense
-    min_punting = punt_plays["punting"].min()
-    max_punting = punt_plays["punting"].max()
-    punt_plays["norm_punting"] = 1 - (
-        (punt_plays["punting"] - min_punting) \
-        / (max_punting - min_punting)
-    )
-    min_blitzing = punt_plays["blitzing"].min()
-    max_blitzing = punt_plays["blitzing"].max()
-    punt_plays["norm_blitzing"] = 1 - (
-        (punt_plays["blitzing"] - min_blitzing) \
-        / (max_blitzing - min_blitzing)
-    )
-    min_returning = punt_plays["returning"].min()
-    max_returning = punt_plays["returning"].max()
-    punt_plays["norm_returning"] = (punt_plays["returning"] - min_returning) \
-        / (max_returning - min_returning)
-    min_return_defense = punt_plays["return_defense"].min()
-    max_return_defense = punt_plays["return_defense"].max()
-    punt_plays["norm_return_defense"] = 1 - (
-        (punt_plays["return_defense"] - min_return_defense) \
-        / (max_return_defense - min_return_defense)
-    )
+    # Label with raw and normalized punting and punt return skill levels
+    punt_plays = label_team_season_skills(punt_plays, PUNT_SKILL_METRICS, skills=skills)
 
     # Derive norm diff returning
     punt_plays["diff_returning"] = punt_plays["norm_returning"] - punt_plays["norm_return_defense"]
-    min_diff_returning = punt_plays["diff_returning"].min()
-    max_diff_returning = punt_plays["diff_returning"].max()
-    punt_plays["norm_diff_returning"] = (punt_plays["diff_returning"] - min_diff_returning) \
-        / (max_diff_returning - min_diff_returning)
+    punt_plays["norm_diff_returning"] = bounds.normalize("diff_returning", punt_plays["diff_returning"])
 
     return punt_plays[
         [
@@ -903,81 +953,52 @@ def load_clean_nfl_pbp_punt_data(
         ]
     ]
 
-def load_clean_nfl_pbp_kickoff_data():
+@cache_loader(version=1)
+def load_clean_nfl_pbp_punt_data(
+        years: list[int]=NFL_PBP_YEARS
+    ) -> pd.DataFrame:
     """
     Loads historical NFL play-by-play data and cleans it for training the
-    kickoff result model
+    punt result model
 
     Args:
-        years (list[int]): The years of kickoff data to load
-    
+        years (list[int]): The years of play-by-play data to load
+
     Returns:
-        pd.DataFrame: The loaded & cleaned historical NFL kickoff data
+        pd.DataFrame: The loaded & cleaned historical NFL punt data
+    """
+    columns = nfl_pbp_dataset_columns(['punt'])
+    df = drop_play_duration_outliers(load_prepared_nfl_pbp_data(years, columns=columns))
+    return clean_nfl_pbp_punt_data(df)
+
+def clean_nfl_pbp_kickoff_data(
+        df: pd.DataFrame,
+        skills: dict[str, pd.DataFrame]=None,
+        bounds: MinMaxBounds=None
+    ) -> pd.DataFrame:
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(NFL_PBP_YEARS, cache=False, alt_path=None)
+    Cleans prepared NFL play-by-play data for training the kickoff result
+    model
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data without duration outliers
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+        bounds (MinMaxBounds): The bounds of the normalized skill diffs,
+            the bounds over the given plays if None
     
-    # Derive play duration and drop outliers
-    df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
-    df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+    Returns:
+        pd.DataFrame: The cleaned historical NFL kickoff data
+    """
+    bounds = MinMaxBounds() if bounds is None else bounds
     kickoff_plays = df.query("kickoff_attempt == 1")
 
-    # Kickoff and kick return skill groups
-    season_posteam_groups = kickoff_plays.groupby(["season", "posteam"])
-    season_defteam_groups = kickoff_plays.groupby(["season", "defteam"])
-    for groups, group in season_posteam_groups:
-        # Derive returning skill
-        total_return_attempts = len(group)
-        total_return_yards = group["return_yards"].sum()
-        returning = total_return_yards / total_return_attempts
-        kickoff_plays.loc[
-            (kickoff_plays['season'] == groups[0]) & (kickoff_plays['posteam'] == groups[1]),
-            "returning"
-        ] = returning
-    for groups, group in season_defteam_groups:
-        # Derive kicking skill
-        total_kickoff_attempts = len(group)
-        total_touchbacks = len(
-            group.query('touchback == 1')
-        )
-        kicking = total_touchbacks / total_kickoff_attempts
-        kickoff_plays.loc[
-            (kickoff_plays['season'] == groups[0]) & (kickoff_plays['defteam'] == groups[1]),
-            "kicking"
-        ] = kicking
-
-        # Derive return defense skill
-        total_return_yards_against = group["return_yards"].sum()
-        return_defense = total_return_yards_against / total_kickoff_attempts
-        kickoff_plays.loc[
-            (kickoff_plays['season'] == groups[0]) & (kickoff_plays['defteam'] == groups[1]),
-            "return_defense"
-        ] = return_defense
-
-    # Normalize kicking, returning, return defense
-    min_kicking = kickoff_plays["kicking"].min()
-    max_kicking = kickoff_plays["kicking"].max()
-    kickoff_plays["norm_kicking"] = (kickoff_plays["kicking"] - min_kicking) / \
-        (max_kicking - min_kicking)
-    min_returning = kickoff_plays["returning"].min()
-    max_returning = kickoff_plays["returning"].max()
-    kickoff_plays["norm_returning"] = (kickoff_plays["returning"] - min_returning) / \
-        (max_returning - min_returning)
-    min_return_defense = kickoff_plays["return_defense"].min()
-    max_return_defense = kickoff_plays["return_defense"].max()
-    kickoff_plays["norm_return_defense"] = 1 - (
-        (kickoff_plays["return_defense"] - min_return_defense) / \
-        (max_return_defense - min_return_defense)
-    )
+    # Label with raw and normalized kicking and kick return skill levels
+    kickoff_plays = label_team_season_skills(kickoff_plays, KICKOFF_SKILL_METRICS, skills=skills)
 
     # Calculate norm diff returning
     kickoff_plays["diff_returning"] = kickoff_plays["norm_returning"] - kickoff_plays["norm_return_defense"]
-    min_diff_returning = kickoff_plays["diff_returning"].min()
-    max_diff_returning = kickoff_plays["diff_returning"].max()
-    kickoff_plays["norm_diff_returning"] = (kickoff_plays["diff_returning"] - min_diff_returning) / \
-        (max_diff_returning - min_diff_returning)
+    kickoff_plays["norm_diff_returning"] = bounds.normalize("diff_returning", kickoff_plays["diff_returning"])
     return kickoff_plays[
         [
             # Skill levels
@@ -1001,398 +1022,259 @@ def load_clean_nfl_pbp_kickoff_data():
         ]
     ]
 
-def load_clean_nfl_pbp_playresult_data(
+@cache_loader(version=1)
+def load_clean_nfl_pbp_kickoff_data(
         years: list[int]=NFL_PBP_YEARS
-    ):
+    ) -> pd.DataFrame:
     """
     Loads historical NFL play-by-play data and cleans it for training the
-    play result model
+    kickoff result model
 
     Args:
         years (list[int]): The years of play-by-play data to load
 
     Returns:
-        pd.DataFrame: The loaded & cleaned historical NFL play-by-play data
+        pd.DataFrame: The loaded & cleaned historical NFL kickoff data
     """
-    # Load NFL play-by-play data
-    df = nfl.import_pbp_data(NFL_PBP_YEARS, cache=False, alt_path=None)
-
-    # Loop through each season and team
-    for s in df['season'].unique():
-        print(f"Calculating performance properties for season {s}")
-        for p in df.query(f'season == {s}')['posteam'].unique():
-            if p == None:
-                continue
-
-            # Derive the blocking property
-            total_offensive_plays = len(
-                df.query(f'season == {s} and posteam == "{p}"')
-            )
-            tackled_for_loss = len(
-                df.query(f'season == {s} and posteam == "{p}" and (tackled_for_loss == 1 or sack == 1 or qb_hit == 1)')
-            )
-            blocking = tackled_for_loss / total_offensive_plays
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "blocking"
-            ] = blocking
-
-            # Derive the rushing property
-            rush_att = df.query(f'season == {s} and posteam == "{p}" and rush_attempt == 1')
-            total_rush_attempts = len(rush_att)
-            total_rushing_yards = rush_att['rushing_yards'].sum()
-            rushing = total_rushing_yards / total_rush_attempts
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "rushing"
-            ] = rushing
-
-            # Derive the passing property
-            pass_att = df.query(f'season == {s} and posteam == "{p}" and pass_attempt == 1')
-            completions = df.query(f'season == {s} and posteam == "{p}" and pass_attempt == 1 and complete_pass == 1')
-            total_pass_attempts = len(pass_att)
-            total_pass_completions = len(completions)
-            total_pass_yards = pass_att['passing_yards'].sum()
-            total_pass_touchdowns = completions['pass_touchdown'].sum()
-            total_pass_interceptions = pass_att['interception'].sum()
-            passing = ((
-                ( # a
-                    ((total_pass_completions / total_pass_attempts) - 0.3) * 5
-                ) +
-                ( # b
-                    ((total_pass_yards / total_pass_attempts) - 3) * 0.25
-                ) +
-                ( # c
-                    (total_pass_touchdowns / total_pass_attempts) * 20
-                ) +
-                ( # d
-                    2.375 - ((total_pass_interceptions / total_pass_attempts) * 25)
-                )
-            ) / 6) * 100
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "passing"
-            ] = passing
-
-            # Derive the receiving property
-            total_incompletions = total_pass_attempts - total_pass_completions
-            incompletions_per_attempt = total_incompletions / total_pass_attempts
-            total_yards_after_catch = completions['yards_after_catch'].sum()
-            yac_per_completion = total_yards_after_catch / total_pass_completions
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "incompletions_per_attempt"
-            ] = incompletions_per_attempt
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "yac_per_completion"
-            ] = yac_per_completion
-
-            # Derive the scrambling property
-            scramble_att = df.query(f'season == {s} and posteam == "{p}" and qb_scramble == 1')
-            total_qb_scrambles = len(scramble_att)
-            total_qb_scramble_rushing = scramble_att['rushing_yards'].sum()
-            scrambles_per_play = total_qb_scrambles / total_offensive_plays
-            yards_per_scramble = total_qb_scramble_rushing / total_qb_scrambles
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "scrambles_per_play"
-            ] = scrambles_per_play
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "yards_per_scramble"
-            ] = yards_per_scramble
-
-            # Derive the offensive_turnovers property
-            total_offensive_turnovers = len(
-                df.query(f'season == {s} and posteam == "{p}" and (fumble == 1 or interception == 1)')
-            )
-            offensive_turnovers = total_offensive_turnovers / total_offensive_plays
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "offensive_turnovers"
-            ] = offensive_turnovers
-
-            # Derive the offensive_penalties property
-            total_offensive_penalties = len(
-                df.query(f'season == {s} and posteam == "{p}" and penalty == 1 and penalty_team == "{p}"')
-            )
-            offensive_penalties = total_offensive_penalties / total_offensive_plays
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "offensive_penalties"
-            ] = offensive_penalties
-
-            # Derive the blitzing property
-            total_defensive_plays = len(
-                df.query(f'season == {s} and defteam == "{p}"')
-            )
-            made_tackle_for_loss = len(
-                df.query(f'season == {s} and defteam == "{p}" and (tackled_for_loss == 1 or sack == 1 or qb_hit == 1)')
-            )
-            blitzing = made_tackle_for_loss / total_defensive_plays
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "blitzing"
-            ] = blitzing
-
-            # Derive the rush defense property
-            rush_att_against = df.query(f'season == {s} and defteam == "{p}" and rush_attempt == 1')
-            total_rush_attempts_against = len(rush_att_against)
-            total_rushing_yards_against = rush_att['rushing_yards'].sum()
-            rush_defense = total_rushing_yards_against / total_rush_attempts_against
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "rush_defense"
-            ] = rush_defense
-
-            # Derive the pass defense property
-            pass_att_against = df.query(f'season == {s} and defteam == "{p}" and pass_attempt == 1')
-            completions_against = df.query(f'season == {s} and defteam == "{p}" and pass_attempt == 1 and complete_pass == 1')
-            total_pass_attempts_against = len(pass_att_against)
-            total_pass_completions_against = len(completions_against)
-            total_pass_yards_against = pass_att_against['passing_yards'].sum()
-            total_pass_touchdowns_against = completions_against['pass_touchdown'].sum()
-            total_interceptions_for = pass_att_against['interception'].sum()
-            pass_defense = ((
-                ( # a
-                    ((total_pass_completions_against / total_pass_attempts_against) - 0.3) * 5
-                ) +
-                ( # b
-                    ((total_pass_yards_against / total_pass_attempts_against) - 3) * 0.25
-                ) +
-                ( # c
-                    (total_pass_touchdowns_against / total_pass_attempts_against) * 20
-                ) +
-                ( # d
-                    2.375 - ((total_interceptions_for / total_pass_attempts_against) * 25)
-                )
-            ) / 6) * 100
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "pass_defense"
-            ] = pass_defense
-
-            # Derive the coverage property
-            total_incompletions_against = total_pass_attempts_against - total_pass_completions_against
-            incompletions_per_attempt_against = total_incompletions_against / total_pass_attempts_against
-            total_yards_after_catch_against = completions_against['yards_after_catch'].sum()
-            yac_per_completion_against = total_yards_after_catch_against / total_pass_completions_against
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "incompletions_per_attempt_against"
-            ] = incompletions_per_attempt_against
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "yac_per_completion_against"
-            ] = yac_per_completion_against
-
-            # Derive the defensive_turnovers property
-            total_defensive_turnovers = len(
-                df.query(f'season == {s} and defteam == "{p}" and (fumble == 1 or interception == 1)')
-            )
-            defensive_turnovers = total_defensive_turnovers / total_defensive_plays
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "defensive_turnovers"
-            ] = defensive_turnovers
-
-            # Derive the defensive_penalties property
-            total_defensive_penalties = len(
-                df.query(f'season == {s} and defteam == "{p}" and penalty == 1 and penalty_team == "{p}"')
-            )
-            defensive_penalties = total_defensive_penalties / total_defensive_plays
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "defensive_penalties"
-            ] = defensive_penalties
-
-    # Normalize the blocking property
-    min_blocking = df['blocking'].min()
-    max_blocking = df['blocking'].max()
-    df['norm_blocking'] = 1 - ((df['blocking'] - min_blocking) / (max_blocking - min_blocking))
-
-    # Normalize the rushing property
-    min_rushing = df['rushing'].min()
-    max_rushing = df['rushing'].max()
-    df['norm_rushing'] = (df['rushing'] - min_rushing) / (max_rushing - min_rushing)
-
-    # Normalize the passing property
-    min_passing = df['passing'].min()
-    max_passing = df['passing'].max()
-    df['norm_passing'] = (df['passing'] - min_passing) / (max_passing - min_passing)
+    columns = nfl_pbp_dataset_columns(['kickoff'])
+    df = drop_play_duration_outliers(load_prepared_nfl_pbp_data(years, columns=columns))
+    return clean_nfl_pbp_kickoff_data(df)
+
+def derive_team_season_totals(
+        df: pd.DataFrame,
+        team_column: str,
+        keys: list[str]=['season']
+    ) -> pd.DataFrame:
+    """
+    Aggregates the play counts and yardage totals from which team skill
+    properties are derived, in a single pass grouped by season and team
+
+    Args:
+        df (pd.DataFrame): Raw NFL play-by-play data
+        team_column (str): posteam for offensive totals, defteam for defensive
+        keys (list[str]): The columns grouped by ahead of the team, e.g.
+            season and week for weekly totals
+
+    Returns:
+        pd.DataFrame: The totals, indexed by the keys and team
+    """
+    rush_attempt = df['rush_attempt'] == 1
+    pass_attempt = df['pass_attempt'] == 1
+    completion = pass_attempt & (df['complete_pass'] == 1)
+    scramble = df['qb_scramble'] == 1
+    totals = pd.DataFrame({
+        **{key: df[key] for key in keys},
+        'team': df[team_column],
+        'plays': 1,
+        'pressures': ((df['tackled_for_loss'] == 1) | (df['sack'] == 1) | (df['qb_hit'] == 1)).astype(int),
+        'rush_attempts': rush_attempt.astype(int),
+        'rushing_yards': df['rushing_yards'].where(rush_attempt).astype(np.float64),
+        'pass_attempts': pass_attempt.astype(int),
+        'completions': completion.astype(int),
+        'passing_yards': df['passing_yards'].where(pass_attempt).astype(np.float64),
+        'pass_touchdowns': df['pass_touchdown'].where(completion).astype(np.float64),
+        'interceptions': df['interception'].where(pass_attempt).astype(np.float64),
+        'yards_after_catch': df['yards_after_catch'].where(completion).astype(np.float64),
+        'scrambles': scramble.astype(int),
+        'scramble_yards': df['rushing_yards'].where(scramble).astype(np.float64),
+        'turnovers': ((df['fumble'] == 1) | (df['interception'] == 1)).astype(int),
+        'penalties': ((df['penalty'] == 1) & (df['penalty_team'] == df[team_column])).astype(int)
+    })
+    return totals.groupby(keys + ['team'], observed=True).sum()
+
+def aggregate_team_season_playresult_totals(
+        df: pd.DataFrame,
+        keys: list[str]=['season']
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Aggregates the offensive and defensive totals from which the play result
+    skill properties are derived
+
+    Args:
+        df (pd.DataFrame): Raw NFL play-by-play data
+        keys (list[str]): The columns grouped by ahead of the team
+
+    Returns:
+        dict[str, pd.DataFrame]: The offensive (posteam) and defensive
+            (defteam) totals, indexed by the keys and team
+    """
+    return {
+        OFFENSE: derive_team_season_totals(df, OFFENSE, keys=keys),
+        DEFENSE: derive_team_season_totals(df, DEFENSE, keys=keys)
+    }
+
+def derive_team_season_playresult_skills_from_totals(
+        totals: dict[str, pd.DataFrame],
+        registry: ScalerRegistry=None
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Derives the raw and normalized offensive and defensive skill properties
+    of the play result model from the aggregated totals
+
+    Args:
+        totals (dict[str, pd.DataFrame]): The offensive and defensive totals
+        registry (ScalerRegistry): Records the scale of each normalized
+            property, discarded if None
+
+    Returns:
+        dict[str, pd.DataFrame]: The offensive (posteam) and defensive
+            (defteam) skill properties, indexed by season and team
+    """
+    registry = ScalerRegistry() if registry is None else registry
+    off_totals = totals[OFFENSE]
+    def_totals = totals[DEFENSE]
+    off = pd.DataFrame(index=off_totals.index)
+    defense = pd.DataFrame(index=def_totals.index)
+
+    # Derive the offensive properties
+    off['blocking'] = off_totals['pressures'] / off_totals['plays']
+    off['rushing'] = off_totals['rushing_yards'] / off_totals['rush_attempts']
+    off['passing'] = passer_rating(
+        off_totals['completions'] / off_totals['pass_attempts'],
+        off_totals['passing_yards'] / off_totals['pass_attempts'],
+        off_totals['pass_touchdowns'] / off_totals['pass_attempts'],
+        off_totals['interceptions'] / off_totals['pass_attempts']
+    )
+    off['incompletions_per_attempt'] = (off_totals['pass_attempts'] - off_totals['completions']) \
+        / off_totals['pass_attempts']
+    off['yac_per_completion'] = off_totals['yards_after_catch'] / off_totals['completions']
+    off['scrambles_per_play'] = off_totals['scrambles'] / off_totals['plays']
+    off['yards_per_scramble'] = off_totals['scramble_yards'] / off_totals['scrambles']
+    off['offensive_turnovers'] = off_totals['turnovers'] / off_totals['plays']
+    off['offensive_penalties'] = off_totals['penalties'] / off_totals['plays']
+
+    # Derive the defensive properties
+    # Rush defense divides the team's own rushing yards by its rush attempts
+    # against, as the original loop did, so the fitted models stay compatible
+    defense['blitzing'] = def_totals['pressures'] / def_totals['plays']
+    defense['rush_defense'] = off_totals['rushing_yards'].reindex(def_totals.index) \
+        / def_totals['rush_attempts']
+    defense['pass_defense'] = passer_rating(
+        def_totals['completions'] / def_totals['pass_attempts'],
+        def_totals['passing_yards'] / def_totals['pass_attempts'],
+        def_totals['pass_touchdowns'] / def_totals['pass_attempts'],
+        def_totals['interceptions'] / def_totals['pass_attempts']
+    )
+    defense['incompletions_per_attempt_against'] = (def_totals['pass_attempts'] - def_totals['completions']) \
+        / def_totals['pass_attempts']
+    defense['yac_per_completion_against'] = def_totals['yards_after_catch'] / def_totals['completions']
+    defense['defensive_turnovers'] = def_totals['turnovers'] / def_totals['plays']
+    defense['defensive_penalties'] = def_totals['penalties'] / def_totals['plays']
+
+    # Normalize the offensive properties
+    off['norm_blocking'] = registry.record('blocking', off['blocking'], invert=True)
+    off['norm_rushing'] = registry.record('rushing', off['rushing'])
+    off['norm_passing'] = registry.record('passing', off['passing'])
+    off['norm_offensive_turnovers'] = registry.record('offensive_turnovers', off['offensive_turnovers'], invert=True)
+    off['norm_offensive_penalties'] = registry.record('offensive_penalties', off['offensive_penalties'], invert=True)
 
     # Normalize the receiving properties and derive normalized receiving
-    min_incompletions_per_attempt = df['incompletions_per_attempt'].min()
-    max_incompletions_per_attempt = df['incompletions_per_attempt'].max()
-    df['norm_incompletions_per_attempt'] = 1 - ((df['incompletions_per_attempt'] - min_incompletions_per_attempt) / (max_incompletions_per_attempt - min_incompletions_per_attempt))
-    min_yac_per_completion = df['yac_per_completion'].min()
-    max_yac_per_completion = df['yac_per_completion'].max()
-    df['norm_yac_per_completion'] = (df['yac_per_completion'] - min_yac_per_completion) / (max_yac_per_completion - min_yac_per_completion)
-    df['receiving'] = (df['norm_yac_per_completion'] + df['norm_incompletions_per_attempt']) / 2
-    min_receiving = df['receiving'].min()
-    max_receiving = df['receiving'].max()
-    df['norm_receiving'] = (df['receiving'] - min_receiving) / (max_receiving - min_receiving)
+    off['norm_incompletions_per_attempt'] = registry.record('incompletions_per_attempt', off['incompletions_per_attempt'], invert=True)
+    off['norm_yac_per_completion'] = registry.record('yac_per_completion', off['yac_per_completion'])
+    off['receiving'] = (off['norm_yac_per_completion'] + off['norm_incompletions_per_attempt']) / 2
+    off['norm_receiving'] = registry.record('receiving', off['receiving'])
 
     # Normalize the scrambling properties and derive normalized scrambling
-    min_scrambles_per_play = df['scrambles_per_play'].min()
-    max_scrambles_per_play = df['scrambles_per_play'].max()
-    df['norm_scrambles_per_play'] = (df['scrambles_per_play'] - min_scrambles_per_play) / (max_scrambles_per_play - min_scrambles_per_play)
-    min_yards_per_scramble = df['yards_per_scramble'].min()
-    max_yards_per_scramble = df['yards_per_scramble'].max()
-    df['norm_yards_per_scramble'] = (df['yards_per_scramble'] - min_yards_per_scramble) / (max_yards_per_scramble - min_yards_per_scramble)
-    df['scrambling'] = (df['norm_scrambles_per_play'] + df['norm_yards_per_scramble']) / 2
-    min_scrambling = df['scrambling'].min()
-    max_scrambling = df['scrambling'].max()
-    df['norm_scrambling'] = (df['scrambling'] - min_scrambling) / (max_scrambling - min_scrambling)
-
-    # Normalize the offensive turnovers property
-    min_offensive_turnovers = df['offensive_turnovers'].min()
-    max_offensive_turnovers = df['offensive_turnovers'].max()
-    df['norm_offensive_turnovers'] = 1 - ((df['offensive_turnovers'] - min_offensive_turnovers) / (max_offensive_turnovers - min_offensive_turnovers))
-
-    # Normalize the offensive penalties property
-    min_offensive_penalties = df['offensive_penalties'].min()
-    max_offensive_penalties = df['offensive_penalties'].max()
-    df['norm_offensive_penalties'] = 1 - ((df['offensive_penalties'] - min_offensive_penalties) / (max_offensive_penalties - min_offensive_penalties))
-
-    # Normalize the blitzing property
-    min_blitzing = df['blitzing'].min()
-    max_blitzing = df['blitzing'].max()
-    df['norm_blitzing'] = (df['blitzing'] - min_blitzing) / (max_blitzing - min_blitzing)
-
-    # Normalize the rush_defense property
-    min_rush_defense = df['rush_defense'].min()
-    max_rush_defense = df['rush_defense'].max()
-    df['norm_rush_defense'] = 1 - ((df['rush_defense'] - min_rush_defense) / (max_rush_defense - min_rush_defense))
-
-    # Normalize the pass_defense property
-    min_pass_defense = df['pass_defense'].min()
-    max_pass_defense = df['pass_defense'].max()
-    df['norm_pass_defense'] = 1 - ((df['pass_defense'] - min_pass_defense) / (max_pass_defense - min_pass_defense))
+    off['norm_scrambles_per_play'] = registry.record('scrambles_per_play', off['scrambles_per_play'])
+    off['norm_yards_per_scramble'] = registry.record('yards_per_scramble', off['yards_per_scramble'])
+    off['scrambling'] = (off['norm_scrambles_per_play'] + off['norm_yards_per_scramble']) / 2
+    off['norm_scrambling'] = registry.record('scrambling', off['scrambling'])
+
+    # Normalize the defensive properties
+    defense['norm_blitzing'] = registry.record('blitzing', defense['blitzing'])
+    defense['norm_rush_defense'] = registry.record('rush_defense', defense['rush_defense'], invert=True)
+    defense['norm_pass_defense'] = registry.record('pass_defense', defense['pass_defense'], invert=True)
+    defense['norm_defensive_turnovers'] = registry.record('defensive_turnovers', defense['defensive_turnovers'])
+    defense['norm_defensive_penalties'] = registry.record('defensive_penalties', defense['defensive_penalties'], invert=True)
 
     # Normalize the coverage properties and derive normalized coverage
-    min_incompletions_per_attempt_against = df['incompletions_per_attempt_against'].min()
-    max_incompletions_per_attempt_against = df['incompletions_per_attempt_against'].max()
-    df['norm_incompletions_per_attempt_against'] = (df['incompletions_per_attempt_against'] - min_incompletions_per_attempt_against) / (max_incompletions_per_attempt_against - min_incompletions_per_attempt_against)
-    min_yac_per_completion_against = df['yac_per_completion_against'].min()
-    max_yac_per_completion_against = df['yac_per_completion_against'].max()
-    df['norm_yac_per_completion_against'] = 1 - ((df['yac_per_completion_against'] - min_yac_per_completion_against) / (max_yac_per_completion_against - min_yac_per_completion_against))
-    df['coverage'] = (df['norm_yac_per_completion_against'] + df['norm_incompletions_per_attempt_against']) / 2
-    min_coverage = df['coverage'].min()
-    max_coverage = df['coverage'].max()
-    df['norm_coverage'] = (df['coverage'] - min_coverage) / (max_coverage - min_coverage)
-
-    # Normalize the defensive turnovers property
-    min_defensive_turnovers = df['defensive_turnovers'].min()
-    max_defensive_turnovers = df['defensive_turnovers'].max()
-    df['norm_defensive_turnovers'] = (df['defensive_turnovers'] - min_defensive_turnovers) / (max_defensive_turnovers - min_defensive_turnovers)
-
-    # Normalize the defensive penalties property
-    min_defensive_penalties = df['defensive_penalties'].min()
-    max_defensive_penalties = df['defensive_penalties'].max()
-    df['norm_defensive_penalties'] = 1 - ((df['defensive_penalties'] - min_defensive_penalties) / (max_defensive_penalties - min_defensive_penalties))
-
-    # Loop through each season and team again
-    grouped_off = df.groupby(['season', 'posteam'])
-    grouped_def = df.groupby(['season', 'defteam'])
-    for s in df['season'].unique():
-        print(f"Calculating unit overall properties for season {s}")
-        for p in df.query(f'season == {s}')['posteam'].unique():
-            if p == None:
-                continue
-
-            # Calculate the team's offensive overall rating
-            norm_blocking = grouped_off.get_group((s, p))['norm_blocking'].mean()
-            norm_rushing = grouped_off.get_group((s, p))['norm_rushing'].mean()
-            norm_passing = grouped_off.get_group((s, p))['norm_passing'].mean()
-            norm_receiving = grouped_off.get_group((s, p))['norm_receiving'].mean()
-            norm_offensive_turnovers = grouped_off.get_group((s, p))['norm_offensive_turnovers'].mean()
-            norm_offensive_penalties = grouped_off.get_group((s, p))['norm_offensive_penalties'].mean()
-            offense_overall = np.average(
-                [
-                    norm_blocking,
-                    norm_rushing,
-                    norm_passing,
-                    norm_receiving,
-                    norm_offensive_turnovers,
-                    norm_offensive_penalties
-                ]
-            )
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "offense_overall"
-            ] = offense_overall
-
-            # Calculate the team's defensive overall rating
-            norm_blitzing = grouped_def.get_group((s, p))['norm_blitzing'].mean()
-            norm_rush_defense = grouped_def.get_group((s, p))['norm_rush_defense'].mean()
-            norm_pass_defense = grouped_def.get_group((s, p))['norm_pass_defense'].mean()
-            norm_coverage = grouped_def.get_group((s, p))['norm_coverage'].mean()
-            norm_defensive_turnovers = grouped_def.get_group((s, p))['norm_defensive_turnovers'].mean()
-            norm_defensive_penalties = grouped_def.get_group((s, p))['norm_defensive_penalties'].mean()
-            defense_overall = np.average(
-                [
-                    norm_blitzing,
-                    norm_rush_defense,
-                    norm_pass_defense,
-                    norm_coverage,
-                    norm_defensive_turnovers,
-                    norm_defensive_penalties
-                ]
-            )
-            df.loc[
-                (df['season'] == s) & (df['defteam'] == p),
-                "defense_overall"
-            ] = defense_overall
-
-    # Normalize the offensive and defensive overall properties
-    min_offense_overall = df['offense_overall'].min()
-    max_offense_overall = df['offense_overall'].max()
-    df['norm_offense_overall'] = (df['offense_overall'] - min_offense_overall) / (max_offense_overall - min_offense_overall)
-    min_defense_overall = df['defense_overall'].min()
-    max_defense_overall = df['defense_overall'].max()
-    df['norm_defense_overall'] = (df['defense_overall'] - min_defense_overall) / (max_defense_overall - min_defense_overall)
-
-    # Loop through each season and team a third time
-    grouped_off = df.groupby(['season', 'posteam'])
-    grouped_def = df.groupby(['season', 'defteam'])
-    for s in df['season'].unique():
-        print(f"Calculating overall properties for season {s}")
-        for p in df.query(f'season == {s}')['posteam'].unique():
-            if p == None:
-                continue
-
-            # Get the team's offense and defense overall
-            offense_overall = grouped_off.get_group((s, p))['norm_offense_overall'].mean()
-            defense_overall = grouped_def.get_group((s, p))['norm_defense_overall'].mean()
-
-            # Calculate the team's overall rating
-            overall = np.average(
-                [
-                    offense_overall,
-                    defense_overall
-                ]
-            )
-            df.loc[
-                (df['season'] == s) & (df['posteam'] == p),
-                "overall"
-            ] = overall
+    defense['norm_incompletions_per_attempt_against'] = registry.record('incompletions_per_attempt_against', defense['incompletions_per_attempt_against'])
+    defense['norm_yac_per_completion_against'] = registry.record('yac_per_completion_against', defense['yac_per_completion_against'], invert=True)
+    defense['coverage'] = (defense['norm_yac_per_completion_against'] + defense['norm_incompletions_per_attempt_against']) / 2
+    defense['norm_coverage'] = registry.record('coverage', defense['coverage'])
+
+    # Derive and normalize the offensive and defensive overall properties
+    off['offense_overall'] = off[
+        [
+            'norm_blocking',
+            'norm_rushing',
+            'norm_passing',
+            'norm_receiving',
+            'norm_offensive_turnovers',
+            'norm_offensive_penalties'
+        ]
+    ].mean(axis=1, skipna=False)
+    off['norm_offense_overall'] = registry.record('offense_overall', off['offense_overall'])
+    defense['defense_overall'] = defense[
+        [
+            'norm_blitzing',
+            'norm_rush_defense',
+            'norm_pass_defense',
+            'norm_coverage',
+            'norm_defensive_turnovers',
+            'norm_defensive_penalties'
+        ]
+    ].mean(axis=1, skipna=False)
+    defense['norm_defense_overall'] = registry.record('defense_overall', defense['defense_overall'])
+
+    # Derive and normalize the team overall property
+    off['overall'] = (
+        off['norm_offense_overall'] + \
+        defense['norm_defense_overall'].reindex(off.index)
+    ) / 2
+    off['norm_overall'] = registry.record('overall', off['overall'])
+
+    return {
+        OFFENSE: off,
+        DEFENSE: defense
+    }
+
+def derive_team_season_playresult_skills(
+        df: pd.DataFrame
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Derives the raw and normalized offensive and defensive skill properties
+    of the play result model for every team and season
+
+    Args:
+        df (pd.DataFrame): Raw NFL play-by-play data
+
+    Returns:
+        dict[str, pd.DataFrame]: The offensive (posteam) and defensive
+            (defteam) skill properties, indexed by season and team
+    """
+    return derive_team_season_playresult_skills_from_totals(aggregate_team_season_playresult_totals(df))
 
-    # Normalize the team overall properties
-    min_overall = df['overall'].min()
-    max_overall = df['overall'].max()
-    df['norm_overall'] = (df['overall'] - min_overall) / (max_overall - min_overall)
+def clean_nfl_pbp_playresult_data(
+        df: pd.DataFrame,
+        skills: dict[str, pd.DataFrame]=None
+    ) -> pd.DataFrame:
+    """
+    Cleans prepared NFL play-by-play data for training the play result model
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data, including outliers
+        skills (dict[str, pd.DataFrame]): Previously derived team-season
+            skills for each side, derived over the given plays if None
+
+    Returns:
+        pd.DataFrame: The cleaned historical NFL play-by-play data
+    """
+    # Derive the team-season skill properties
+    if skills is None:
+        print("Calculating team-season skill properties")
+        skills = derive_team_season_playresult_skills(df)
+
+    # Join the team-season properties back onto each play
+    df = df.join(skills[OFFENSE], on=['season', OFFENSE])
+    df = df.join(skills[DEFENSE], on=['season', DEFENSE])
 
     ###
     # Model outputs
     ###
 
-    # Derive play duration and drop outliers
-    df['game_seconds_next'] = df.groupby('game_id')['game_seconds_remaining'].shift(-1)
-    df['play_duration'] = df['game_seconds_remaining'] - df['game_seconds_next']
-    df = df.query('play_duration < 69.0')
-    df = df.query('play_duration >= 0')
+    # Drop play duration outliers
+    df = drop_play_duration_outliers(df)
 
     # Derive change of possession
     df['change_of_possession'] = 0.0
@@ -1415,27 +1297,24 @@ def load_clean_nfl_pbp_playresult_data(
         'change_of_possession'
     ] = 1.0
 
-    # Derive whether the penalty was committed by the posteam
-    df['posteam_penalty'] = 0.0
-    df.loc[(df["penalty"] == True) & (df["penalty_team"] == df["posteam"]), "posteam_penalty"] = 1.0
-
     # Derive whether the timeout was called by the posteam
     df['posteam_timeout'] = 0.0
     df.loc[(df["timeout"] == True) & (df["timeout_team"] == df["posteam"]), "posteam_timeout"] = 1.0
 
     # One-hot encode field goal result
-    encoder = OneHotEncoder(handle_unknown='ignore', sparse_output=False)
+    encoder = OneHotEncoder(categories=[FIELD_GOAL_RESULTS], handle_unknown='ignore', sparse_output=False)
     encoded_fg_results = encoder.fit_transform(df[['field_goal_result']])
-    encoded_fg_result_df = pd.DataFrame(encoded_fg_results, columns=encoder.get_feature_names_out(['field_goal_result']))
+    encoded_fg_result_df = pd.DataFrame(
+        encoded_fg_results,
+        columns=encoder.get_feature_names_out(['field_goal_result']),
+        index=df.index
+    )
     df = pd.concat([df.drop('field_goal_result', axis=1), encoded_fg_result_df], axis=1)
 
     ###
     # Game context
     ###
 
-    # Derive score differential column
-    df["score_diff"] = df["posteam_score"] - df["defteam_score"]
-
     # Clean null values
     df = df[df['half_seconds_remaining'].notna()]
     df = df[df['defteam_timeouts_remaining'].notna()]
@@ -1470,9 +1349,13 @@ def load_clean_nfl_pbp_playresult_data(
     )
 
     # One-hot encode play type
-    encoder = OneHotEncoder(handle_unknown='ignore', sparse_output=False)
+    encoder = OneHotEncoder(categories=[PLAYRESULT_PLAY_TYPES], handle_unknown='ignore', sparse_output=False)
     encoded_play_types = encoder.fit_transform(df[['play_type']])
-    encoded_play_type_df = pd.DataFrame(encoded_play_types, columns=encoder.get_feature_names_out(['play_type']))
+    encoded_play_type_df = pd.DataFrame(
+        encoded_play_types,
+        columns=encoder.get_feature_names_out(['play_type']),
+        index=df.index
+    )
     df = pd.concat([df.drop('play_type', axis=1), encoded_play_type_df], axis=1)
 
     # Drop & clean null values
@@ -1573,6 +1456,74 @@ def load_clean_nfl_pbp_playresult_data(
     ]
     return df
 
+@cache_loader(version=2)
+def load_clean_nfl_pbp_playresult_data(
+        years: list[int]=NFL_PBP_YEARS
+    ) -> pd.DataFrame:
+    """
+    Loads historical NFL play-by-play data and cleans it for training the
+    play result model
+
+    Args:
+        years (list[int]): The years of play-by-play data to load
+
+    Returns:
+        pd.DataFrame: The loaded & cleaned historical NFL play-by-play data
+    """
+    columns = nfl_pbp_dataset_columns(['playresult'])
+    df = load_prepared_nfl_pbp_data(years, columns=columns)
+    return clean_nfl_pbp_playresult_data(df)
+
+def build_clean_nfl_pbp_data(
+        years: list[int]=NFL_PBP_YEARS,
+        datasets: list[str]=NFL_PBP_DATASETS,
+        workers: int=1
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Builds several cleaned datasets from a single load of historical NFL
+    play-by-play data, deriving the shared columns and dropping duration
+    outliers only once.  Each dataset is yielded as soon as it is built so
+    that the caller can write it out and release it before the next one.
+
+    Args:
+        years (list[int]): The years of play-by-play data to load
+        datasets (list[str]): The names of the datasets to build
+        workers (int): The number of processes preparing seasons in parallel
+
+    Returns:
+        Iterator[tuple[str, pd.DataFrame]]: The name and cleaned data of each
+            requested dataset
+    """
+    for name in datasets:
+        if name not in NFL_PBP_DATASETS:
+            raise ValueError(f"Unknown dataset: {name}")
+    df = load_prepared_nfl_pbp_data(
+        years,
+        columns=nfl_pbp_dataset_columns(datasets),
+        workers=workers
+    )
+
+    # Build the datasets which span every play
+    if 'playcall' in datasets:
+        yield 'playcall', clean_nfl_pbp_playcall_data(df)
+    if 'playresult' in datasets:
+        yield 'playresult', clean_nfl_pbp_playresult_data(df)
+
+    # Build the datasets which exclude duration outliers
+    df = drop_play_duration_outliers(df)
+    if 'between_play' in datasets:
+        yield 'between_play', clean_nfl_pbp_between_play_data(df)
+    if 'fieldgoal' in datasets:
+        yield 'fieldgoal', clean_nfl_pbp_fieldgoal_data(df)
+    if 'run' in datasets:
+        yield 'run', clean_nfl_pbp_run_data(df)
+    if 'pass' in datasets:
+        yield 'pass', clean_nfl_pbp_pass_data(df)
+    if 'punt' in datasets:
+        yield 'punt', clean_nfl_pbp_punt_data(df)
+    if 'kickoff' in datasets:
+        yield 'kickoff', clean_nfl_pbp_kickoff_data(df)
+
 def visualize_nfl_pbp_playresult_data(
         df: pd.DataFrame
     ):
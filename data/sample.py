@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+from typing import Union
+from data.dataset import load_nfl_pbp_dataset
+
+SAMPLE_SEED = 337
+
+# Bucket edges of normalized skills and skill diffs, matching the five equal
+# bins the EDA scripts group them into
+NORM_STRATA_EDGES = [0.2, 0.4, 0.6, 0.8]
+YARDLINE_STRATA_EDGES = [10, 20, 30, 40, 50, 60, 70, 80, 90]
+
+# The columns each dataset's samples are stratified by, with their edges
+NFL_PBP_DATASET_STRATA = {
+    'run': {
+        'norm_diff_rushing': NORM_STRATA_EDGES,
+        'norm_diff_ball_handling': NORM_STRATA_EDGES,
+        'yardline_100': YARDLINE_STRATA_EDGES
+    },
+    'pass': {
+        'norm_diff_passing': NORM_STRATA_EDGES,
+        'norm_diff_pass_blocking_rushing': NORM_STRATA_EDGES,
+        'yardline_100': YARDLINE_STRATA_EDGES
+    },
+    'punt': {
+        'norm_punting': NORM_STRATA_EDGES,
+        'norm_diff_returning': NORM_STRATA_EDGES,
+        'yardline_100': YARDLINE_STRATA_EDGES
+    }
+}
+
+def stratified_sample(
+        df: pd.DataFrame,
+        fraction: float,
+        strata: dict[str, list[float]],
+        seed: int=SAMPLE_SEED
+    ) -> pd.DataFrame:
+    """
+    Draws a reproducible stratified subsample of plays.  Plays are bucketed
+    by every stratum column, and the same fraction of plays is drawn from
+    each combination of buckets, at least one play from each, so the sample
+    keeps the distribution of the plays across the buckets.  Each sampled
+    play is weighted by the number of plays it stands for.
+
+    Args:
+        df (pd.DataFrame): The plays to sample
+        fraction (float): The fraction of plays to sample, e.g. 0.05
+        strata (dict[str, list[float]]): The bucket edges of each column to
+            stratify by, where missing values form their own bucket
+        seed (int): The random seed of the sample
+
+    Returns:
+        pd.DataFrame: The sampled plays in their original order, with the
+            sample_weight of each play
+    """
+    if fraction <= 0 or fraction > 1:
+        raise ValueError(f"Fraction must be between 0-1, got: {fraction}")
+
+    # Number the stratum of every play
+    buckets = {}
+    for column, edges in strata.items():
+        values = df[column].to_numpy(dtype=np.float64)
+        bucket_ids = np.digitize(values, edges)
+        bucket_ids[np.isnan(values)] = len(edges) + 1
+        buckets[column] = bucket_ids
+    stratum = pd.DataFrame(buckets).groupby(list(strata)).ngroup().to_numpy()
+
+    # Rank the plays of each stratum in random order and keep the first
+    # fraction of each
+    sizes = np.bincount(stratum)
+    targets = np.maximum(np.round(sizes * fraction), 1).astype(np.int64)
+    keys = np.random.default_rng(seed).random(len(df))
+    order = np.lexsort((keys, stratum))
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    ranks = np.arange(len(df)) - offsets[stratum[order]]
+    rows = np.sort(order[ranks < targets[stratum[order]]])
+    return df.iloc[rows].assign(sample_weight=(sizes / targets)[stratum[rows]])
+
+def sample_nfl_pbp_dataset(
+        name: str,
+        fraction: float,
+        strata: dict[str, list[float]]=None,
+        seed: int=SAMPLE_SEED,
+        verify: bool=False
+    ) -> pd.DataFrame:
+    """
+    Reads a reproducible stratified subsample of a cleaned dataset written by
+    pbp_data.py, for fast exploratory fits
+
+    Args:
+        name (str): The name of the dataset
+        fraction (float): The fraction of plays to sample, e.g. 0.05
+        strata (dict[str, list[float]]): The bucket edges of each column to
+            stratify by, the dataset's default strata if None
+        seed (int): The random seed of the sample
+        verify (bool): Whether to check the rows against the content hash
+
+    Returns:
+        pd.DataFrame: The sampled plays, with the sample_weight of each play
+    """
+    if strata is None:
+        if name not in NFL_PBP_DATASET_STRATA:
+            raise ValueError(f"No default strata for dataset: {name}")
+        strata = NFL_PBP_DATASET_STRATA[name]
+    return stratified_sample(load_nfl_pbp_dataset(name, verify=verify), fraction, strata, seed=seed)
+
+def estimate_binned_statistics(
+        sample: pd.DataFrame,
+        value: str,
+        by: Union[str, pd.Series]
+    ) -> pd.DataFrame:
+    """
+    Estimates the mean and standard deviation of a value in each bin from a
+    stratified sample, along with the standard error of each estimate.  The
+    error of the mean includes the finite population correction for the
+    sampled fraction, and is approximated as if the plays of each bin were
+    drawn at random.  For binary values the mean is a rate.
+
+    Args:
+        sample (pd.DataFrame): Plays from stratified_sample
+        value (str): The column to estimate
+        by (Union[str, pd.Series]): The column or bins to group by, e.g.
+            pd.cut(sample['norm_diff_rushing'], bins=5)
+
+    Returns:
+        pd.DataFrame: The sampled and estimated number of plays, the mean,
+            the standard deviation and their standard errors of each bin
+    """
+    by = sample[by] if isinstance(by, str) else by
+    sample = sample[sample[value].notna()]
+    weighted = pd.DataFrame({
+        'value': sample[value].astype(np.float64),
+        'weight': sample['sample_weight'],
+        'weighted_value': sample[value].astype(np.float64) * sample['sample_weight'],
+        'bin': by.reindex(sample.index)
+    })
+    grouped = weighted.groupby('bin', observed=True)
+    table = pd.DataFrame({
+        'count': grouped['value'].count(),
+        'plays': grouped['weight'].sum(),
+        'mean': grouped['weighted_value'].sum() / grouped['weight'].sum(),
+        'std': grouped['value'].std()
+    })
+    correction = np.sqrt(np.maximum(1 - table['count'] / table['plays'], 0))
+    table['mean_error'] = table['std'] / np.sqrt(table['count']) * correction
+    table['std_error'] = table['std'] / np.sqrt(2 * (table['count'] - 1))
+    return table.rename_axis(by.name)
@@ -0,0 +1,464 @@
+import json
+import numpy as np
+import pandas as pd
+from typing import Callable, Union
+
+OFFENSE = 'posteam'
+DEFENSE = 'defteam'
+
+class TeamSkillMetric:
+    """
+    A declarative team-season skill metric.  Unless a formula is given, the
+    metric is the ratio of a numerator to a denominator over the plays of a
+    team in a season, where the numerator counts (or sums a value column over)
+    the plays matching a filter and the denominator counts the plays matching
+    another filter.  Filters are query expressions in which `team` refers to
+    the team on the metric's side of the ball.
+    """
+    def __init__(
+            self,
+            name: str,
+            side: str,
+            numerator: str=None,
+            value: str=None,
+            denominator: str=None,
+            complement: bool=False,
+            invert: bool=False,
+            normalize: bool=True,
+            formula: Callable[[pd.DataFrame], pd.Series]=None
+        ) -> "TeamSkillMetric":
+        """
+        Constructor for the TeamSkillMetric class
+
+        Args:
+            name (str): The name of the derived column
+            side (str): OFFENSE (posteam) or DEFENSE (defteam)
+            numerator (str): Filter for the numerator plays, all plays if None
+            value (str): Column summed over the numerator plays, counted if None
+            denominator (str): Filter for the denominator plays, all plays if None
+            complement (bool): Whether the metric is 1 - the ratio
+            invert (bool): Whether lower raw values should normalize closer to 1
+            normalize (bool): Whether to derive the norm_<name> column
+            formula (Callable): Derives the metric from the side's previously
+                derived metrics instead of a ratio
+
+        Returns:
+            TeamSkillMetric: The instantiated TeamSkillMetric
+        """
+        if side not in (OFFENSE, DEFENSE):
+            raise ValueError(f"Side must be {OFFENSE} or {DEFENSE}, got: {side}")
+        self.name = name
+        self.side = side
+        self.numerator = numerator
+        self.value = value
+        self.denominator = denominator
+        self.complement = complement
+        self.invert = invert
+        self.normalize = normalize
+        self.formula = formula
+
+class MinMaxBounds:
+    """
+    The min-max normalization bounds of derived columns.  Fixed bounds
+    normalize every chunk of plays the same way.  Otherwise each chunk is
+    normalized by its own bounds, which are accumulated across chunks so that
+    they can later be fixed.
+    """
+    def __init__(
+            self,
+            bounds: dict[str, tuple[float, float]]=None
+        ) -> "MinMaxBounds":
+        """
+        Constructor for the MinMaxBounds class
+
+        Args:
+            bounds (dict[str, tuple[float, float]]): The fixed min and max of
+                each column, accumulated from each chunk if None
+
+        Returns:
+            MinMaxBounds: The instantiated MinMaxBounds
+        """
+        self.fixed = bounds is not None
+        self.bounds = {} if bounds is None else dict(bounds)
+
+    def normalize(
+            self,
+            name: str,
+            values: pd.Series
+        ) -> pd.Series:
+        """
+        Min-max normalizes a derived column to the range 0 - 1
+
+        Args:
+            name (str): The name of the derived column
+            values (pd.Series): The values of the derived column
+
+        Returns:
+            pd.Series: The normalized values
+        """
+        if self.fixed:
+            low, high = self.bounds[name]
+        else:
+            low, high = values.min(), values.max()
+            if name in self.bounds:
+                self.bounds[name] = (
+                    np.fmin(self.bounds[name][0], low),
+                    np.fmax(self.bounds[name][1], high)
+                )
+            else:
+                self.bounds[name] = (low, high)
+        return (values - low) / (high - low)
+
+class ScalerRegistry:
+    """
+    A serializable registry of the min-max scale of each raw skill, recording
+    its bounds and whether lower raw values normalize closer to 1.  Raw
+    values of new or hypothetical teams are rated against the recorded scale
+    without re-normalizing any historical data, and normalized values map
+    back to raw values.
+    """
+    def __init__(
+            self,
+            bounds: dict[str, dict]=None
+        ) -> "ScalerRegistry":
+        """
+        Constructor for the ScalerRegistry class
+
+        Args:
+            bounds (dict[str, dict]): The min, max, and whether the
+                normalization is inverted for each raw skill
+
+        Returns:
+            ScalerRegistry: The instantiated ScalerRegistry
+        """
+        self.bounds = {} if bounds is None else dict(bounds)
+
+    def record(
+            self,
+            name: str,
+            values: pd.Series,
+            invert: bool=False
+        ) -> pd.Series:
+        """
+        Records the scale of a raw skill and min-max normalizes it to the
+        range 0 - 1.  A skill without any value has no scale, and is left
+        unrecorded and missing.
+
+        Args:
+            name (str): The name of the raw skill
+            values (pd.Series): The raw values
+            invert (bool): Whether lower raw values should normalize closer to 1
+
+        Returns:
+            pd.Series: The normalized values
+        """
+        if values.isna().all():
+            return values.copy()
+        self.bounds[name] = {
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'invert': invert
+        }
+        return self.transform(name, values)
+
+    def transform(
+            self,
+            name: str,
+            values: Union[float, np.ndarray, pd.Series],
+            clip: bool=False
+        ) -> Union[float, np.ndarray, pd.Series]:
+        """
+        Normalizes raw values of a skill against its recorded scale
+
+        Args:
+            name (str): The name of the raw skill
+            values (Union[float, np.ndarray, pd.Series]): The raw values
+            clip (bool): Whether to clip values outside the recorded scale
+                to 0 - 1
+
+        Returns:
+            Union[float, np.ndarray, pd.Series]: The normalized values
+        """
+        if name not in self.bounds:
+            raise ValueError(f"No scale recorded for skill: {name}")
+        bound = self.bounds[name]
+        norm = (values - bound['min']) / (bound['max'] - bound['min'])
+        if bound['invert']:
+            norm = 1 - norm
+        return np.clip(norm, 0, 1) if clip else norm
+
+    def inverse_transform(
+            self,
+            name: str,
+            values: Union[float, np.ndarray, pd.Series]
+        ) -> Union[float, np.ndarray, pd.Series]:
+        """
+        Maps normalized values of a skill back to raw values
+
+        Args:
+            name (str): The name of the raw skill
+            values (Union[float, np.ndarray, pd.Series]): The normalized values
+
+        Returns:
+            Union[float, np.ndarray, pd.Series]: The raw values
+        """
+        if name not in self.bounds:
+            raise ValueError(f"No scale recorded for skill: {name}")
+        bound = self.bounds[name]
+        if bound['invert']:
+            values = 1 - values
+        return bound['min'] + values * (bound['max'] - bound['min'])
+
+    def transform_table(
+            self,
+            table: pd.DataFrame,
+            clip: bool=False
+        ) -> pd.DataFrame:
+        """
+        Normalizes every raw skill of a table with a recorded scale into its
+        norm_<skill> column
+
+        Args:
+            table (pd.DataFrame): Raw skills, one row per team
+            clip (bool): Whether to clip values outside the recorded scales
+
+        Returns:
+            pd.DataFrame: The table with the normalized skills
+        """
+        table = table.copy()
+        for name in self.bounds:
+            if name in table.columns:
+                table[f'norm_{name}'] = self.transform(name, table[name], clip=clip)
+        return table
+
+    def save(
+            self,
+            path: str
+        ) -> str:
+        """
+        Writes the recorded scales to a JSON file
+
+        Args:
+            path (str): The path of the JSON file
+
+        Returns:
+            str: The path of the JSON file
+        """
+        with open(path, 'w') as file:
+            json.dump(self.bounds, file, indent=2, sort_keys=True)
+        return path
+
+    @classmethod
+    def load(
+            cls,
+            path: str
+        ) -> "ScalerRegistry":
+        """
+        Reads scales written by save
+
+        Args:
+            path (str): The path of the JSON file
+
+        Returns:
+            ScalerRegistry: The recorded scales
+        """
+        with open(path) as file:
+            return cls(json.load(file))
+
+def passer_rating(
+        completion_percentage: pd.Series,
+        yards_per_attempt: pd.Series,
+        touchdowns_per_attempt: pd.Series,
+        interceptions_per_attempt: pd.Series
+    ) -> pd.Series:
+    """
+    Derives the passer rating from per-attempt passing rates
+
+    Args:
+        completion_percentage (pd.Series): Completions per attempt
+        yards_per_attempt (pd.Series): Passing yards per attempt
+        touchdowns_per_attempt (pd.Series): Passing touchdowns per attempt
+        interceptions_per_attempt (pd.Series): Interceptions per attempt
+
+    Returns:
+        pd.Series: The passer rating
+    """
+    return ((
+        ( # a
+            (completion_percentage - 0.3) * 5
+        ) +
+        ( # b
+            (yards_per_attempt - 3) * 0.25
+        ) +
+        ( # c
+            touchdowns_per_attempt * 20
+        ) +
+        ( # d
+            2.375 - (interceptions_per_attempt * 25)
+        )
+    ) / 6) * 100
+
+def evaluate_play_filter(
+        df: pd.DataFrame,
+        expr: str,
+        side: str
+    ) -> pd.Series:
+    """
+    Evaluates a play filter over every play at once
+
+    Args:
+        df (pd.DataFrame): The play-by-play data
+        expr (str): The query expression, or None to match every play
+        side (str): The team column which `team` refers to in the expression
+
+    Returns:
+        pd.Series: Whether each play matches the filter
+    """
+    if expr is None:
+        return pd.Series(True, index=df.index)
+    return df.eval(expr, resolvers=({'team': df[side]},)).fillna(False).astype(bool)
+
+def team_season_denominator_columns(
+        metrics: list[TeamSkillMetric]
+    ) -> dict[str, str]:
+    """
+    Names the denominator total of each distinct denominator filter
+
+    Args:
+        metrics (list[TeamSkillMetric]): The metric definitions of one side
+
+    Returns:
+        dict[str, str]: The total column of each denominator filter
+    """
+    denominators = {}
+    for metric in metrics:
+        if metric.formula is None and metric.denominator not in denominators:
+            denominators[metric.denominator] = f'denominator_{len(denominators)}'
+    return denominators
+
+def aggregate_team_season_totals(
+        df: pd.DataFrame,
+        metrics: list[TeamSkillMetric],
+        keys: list[str]=['season']
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Aggregates the numerator and denominator of each ratio metric for every
+    team and season.  All ratio metrics on a side of the ball are aggregated
+    in a single grouped pass, and the totals of disjoint sets of plays can be
+    summed.
+
+    Args:
+        df (pd.DataFrame): The play-by-play data the metrics are derived over
+        metrics (list[TeamSkillMetric]): The metric definitions
+        keys (list[str]): The columns grouped by ahead of the team, e.g.
+            season and week for weekly totals
+
+    Returns:
+        dict[str, pd.DataFrame]: The totals for each side, indexed by the keys
+            and team
+    """
+    totals = {}
+    for side in (OFFENSE, DEFENSE):
+        side_metrics = [metric for metric in metrics if metric.side == side]
+        if len(side_metrics) == 0:
+            continue
+
+        # Build the numerator and denominator of every ratio metric, sharing
+        # denominators between metrics with the same filter
+        columns = {key: df[key] for key in keys}
+        columns['team'] = df[side]
+        denominators = team_season_denominator_columns(side_metrics)
+        for metric in side_metrics:
+            if metric.formula is not None:
+                continue
+            matches = evaluate_play_filter(df, metric.numerator, side)
+            if metric.value is None:
+                columns[f'{metric.name}_numerator'] = matches.astype(int)
+            else:
+                columns[f'{metric.name}_numerator'] = df[metric.value].where(matches).astype(float)
+        for denominator, denominator_column in denominators.items():
+            columns[denominator_column] = evaluate_play_filter(df, denominator, side).astype(int)
+
+        # Aggregate every numerator and denominator in one pass
+        totals[side] = pd.DataFrame(columns).groupby(keys + ['team'], observed=True).sum()
+    return totals
+
+def derive_team_season_skills_from_totals(
+        totals: dict[str, pd.DataFrame],
+        metrics: list[TeamSkillMetric],
+        registry: ScalerRegistry=None
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Derives each metric and its min-max normalization from the aggregated
+    numerator and denominator totals
+
+    Args:
+        totals (dict[str, pd.DataFrame]): The totals for each side
+        metrics (list[TeamSkillMetric]): The metric definitions
+        registry (ScalerRegistry): Records the scale of each normalized
+            metric, discarded if None
+
+    Returns:
+        dict[str, pd.DataFrame]: The derived metrics for each side, indexed by
+            season and team
+    """
+    registry = ScalerRegistry() if registry is None else registry
+    skills = {}
+    for side, side_totals in totals.items():
+        side_metrics = [metric for metric in metrics if metric.side == side]
+        denominators = team_season_denominator_columns(side_metrics)
+
+        # Derive the metrics, then their normalizations
+        table = pd.DataFrame(index=side_totals.index)
+        for metric in side_metrics:
+            if metric.formula is not None:
+                table[metric.name] = metric.formula(table)
+                continue
+            ratio = side_totals[f'{metric.name}_numerator'] / side_totals[denominators[metric.denominator]]
+            table[metric.name] = 1 - ratio if metric.complement else ratio
+        for metric in side_metrics:
+            if metric.normalize:
+                table[f'norm_{metric.name}'] = registry.record(metric.name, table[metric.name], invert=metric.invert)
+        skills[side] = table
+    return skills
+
+def derive_team_season_skills(
+        df: pd.DataFrame,
+        metrics: list[TeamSkillMetric]
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Derives each metric for every team and season, along with the min-max
+    normalization of each metric
+
+    Args:
+        df (pd.DataFrame): The play-by-play data the metrics are derived over
+        metrics (list[TeamSkillMetric]): The metric definitions
+
+    Returns:
+        dict[str, pd.DataFrame]: The derived metrics for each side, indexed by
+            season and team
+    """
+    return derive_team_season_skills_from_totals(aggregate_team_season_totals(df, metrics), metrics)
+
+def label_team_season_skills(
+        df: pd.DataFrame,
+        metrics: list[TeamSkillMetric],
+        skills: dict[str, pd.DataFrame]=None
+    ) -> pd.DataFrame:
+    """
+    Labels each play with the team-season metrics of its offense and defense
+
+    Args:
+        df (pd.DataFrame): The play-by-play data the metrics are derived over
+        metrics (list[TeamSkillMetric]): The metric definitions
+        skills (dict[str, pd.DataFrame]): Previously derived metrics for each
+            side, derived over the given plays if None
+
+    Returns:
+        pd.DataFrame: The play-by-play data labeled with the derived metrics
+    """
+    if skills is None:
+        skills = derive_team_season_skills(df, metrics)
+    for side, table in skills.items():
+        df = df.join(table, on=['season', side])
+    return df
@@ -0,0 +1,352 @@
+import io
+import os
+import time
+import queue
+import hashlib
+import threading
+import http.client
+import urllib.parse
+import nfl_data_py as nfl
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+# The nflverse release files that nfl_data_py reads, which any HTTP mirror of
+# them must serve under the same names
+NFLVERSE_PBP_URL = 'https://github.com/nflverse/nflverse-data/releases/download/pbp'
+
+# The location of the play-by-play source, overridable per node, e.g. a local
+# mirror (http://mirror:8000/pbp) or directory (/data/nflverse/pbp)
+NFL_PBP_SOURCE = os.environ.get('NFL_PBP_SOURCE', 'nfl_data_py')
+
+HTTP_CONNECTIONS = 8
+HTTP_RETRIES = 3
+HTTP_BACKOFF_SECONDS = 0.5
+HTTP_TIMEOUT_SECONDS = 60
+HTTP_MAX_REDIRECTS = 5
+PARQUET_MAGIC = b'PAR1'
+
+def pbp_release_file(
+        year: int
+    ) -> str:
+    """
+    Gets the file name of a season's nflverse play-by-play release
+
+    Args:
+        year (int): The season
+
+    Returns:
+        str: The file name of the release, e.g. play_by_play_2023.parquet
+    """
+    return f'play_by_play_{year}.parquet'
+
+def finish_nfl_pbp_release(
+        df: pd.DataFrame,
+        year: int
+    ) -> pd.DataFrame:
+    """
+    Mirrors the nfl_data_py post-processing of a season's release file, so
+    that every source yields the same data
+
+    Args:
+        df (pd.DataFrame): The release file of the season
+        year (int): The season
+
+    Returns:
+        pd.DataFrame: The raw play-by-play data for the season
+    """
+    df['season'] = year
+    float_cols = df.select_dtypes(include=[np.float64]).columns
+    df[float_cols] = df[float_cols].astype(np.float32)
+    return df
+
+class NflDataPySource:
+    """
+    Fetches seasons through nfl_data_py, which downloads each release file
+    over a fresh connection
+    """
+    def fetch(
+            self,
+            year: int
+        ) -> pd.DataFrame:
+        """
+        Fetches a single season of raw play-by-play data
+
+        Args:
+            year (int): The season to fetch
+
+        Returns:
+            pd.DataFrame: The raw play-by-play data for the season
+        """
+        return nfl.import_pbp_data([year], cache=False, alt_path=None)
+
+class LocalDirectorySource:
+    """
+    Reads seasons from a local directory of nflverse release files
+    """
+    def __init__(
+            self,
+            directory: str
+        ) -> "LocalDirectorySource":
+        """
+        Constructor for the LocalDirectorySource class
+
+        Args:
+            directory (str): The directory of the release files
+
+        Returns:
+            LocalDirectorySource: The instantiated LocalDirectorySource
+        """
+        self.directory = directory
+
+    def fetch(
+            self,
+            year: int
+        ) -> pd.DataFrame:
+        """
+        Reads a single season of raw play-by-play data
+
+        Args:
+            year (int): The season to read
+
+        Returns:
+            pd.DataFrame: The raw play-by-play data for the season
+        """
+        df = pd.read_parquet(os.path.join(self.directory, pbp_release_file(year)))
+        return finish_nfl_pbp_release(df, year)
+
+class HttpConnectionPool:
+    """
+    A bounded pool of persistent HTTP connections.  At most a fixed number of
+    connections are open across every host at once, and idle connections are
+    kept alive and reused, so that concurrent downloads share a few TCP and
+    TLS handshakes rather than paying for one per request.
+    """
+    def __init__(
+            self,
+            connections: int=HTTP_CONNECTIONS,
+            timeout: float=HTTP_TIMEOUT_SECONDS
+        ) -> "HttpConnectionPool":
+        """
+        Constructor for the HttpConnectionPool class
+
+        Args:
+            connections (int): The most connections open at once
+            timeout (float): The socket timeout of each connection in seconds
+
+        Returns:
+            HttpConnectionPool: The instantiated HttpConnectionPool
+        """
+        if connections < 1:
+            raise ValueError(f"Connections must be at least 1, got: {connections}")
+        self.connections = connections
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(connections)
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def acquire(
+            self,
+            scheme: str,
+            host: str
+        ) -> http.client.HTTPConnection:
+        """
+        Takes an idle connection to a host, or opens one, waiting while every
+        connection of the pool is in use
+
+        Args:
+            scheme (str): The URL scheme, http or https
+            host (str): The host and optional port
+
+        Returns:
+            http.client.HTTPConnection: The connection
+        """
+        if scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        self.slots.acquire()
+        with self.lock:
+            idle = self.idle.setdefault((scheme, host), queue.LifoQueue())
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            if scheme == 'https':
+                return http.client.HTTPSConnection(host, timeout=self.timeout)
+            return http.client.HTTPConnection(host, timeout=self.timeout)
+
+    def release(
+            self,
+            scheme: str,
+            host: str,
+            connection: http.client.HTTPConnection,
+            reuse: bool=True
+        ) -> None:
+        """
+        Returns a connection to the pool, closing it unless it can be reused
+
+        Args:
+            scheme (str): The URL scheme the connection was acquired for
+            host (str): The host the connection was acquired for
+            connection (http.client.HTTPConnection): The connection
+            reuse (bool): Whether the connection is left in a reusable state
+        """
+        if reuse:
+            self.idle[(scheme, host)].put(connection)
+        else:
+            connection.close()
+        self.slots.release()
+
+    def get(
+            self,
+            url: str
+        ) -> bytes:
+        """
+        Downloads the body of a URL, following redirects
+
+        Args:
+            url (str): The URL
+
+        Returns:
+            bytes: The body of the response
+        """
+        for _ in range(HTTP_MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = parts.path + (f'?{parts.query}' if parts.query else '')
+            connection = self.acquire(parts.scheme, parts.netloc)
+            reuse = False
+            try:
+                connection.request('GET', path or '/')
+                response = connection.getresponse()
+                body = response.read()
+                reuse = not response.will_close
+            finally:
+                self.release(parts.scheme, parts.netloc, connection, reuse=reuse)
+
+            if response.status in (301, 302, 303, 307, 308):
+                url = urllib.parse.urljoin(url, response.getheader('Location'))
+                continue
+            if response.status != 200:
+                raise ConnectionError(f"GET {url} failed with HTTP {response.status}")
+
+            # Catch truncated bodies which the server did not report
+            length = response.getheader('Content-Length')
+            if length is not None and int(length) != len(body):
+                raise ConnectionError(f"GET {url} returned {len(body)} of {length} bytes")
+            return body
+        raise ConnectionError(f"GET {url} exceeded {HTTP_MAX_REDIRECTS} redirects")
+
+    def close(
+            self
+        ) -> None:
+        """
+        Closes every idle connection of the pool
+        """
+        with self.lock:
+            for idle in self.idle.values():
+                while not idle.empty():
+                    idle.get_nowait().close()
+
+class HttpMirrorSource:
+    """
+    Downloads seasons from an HTTP mirror of the nflverse release files over
+    a bounded pool of persistent connections.  Failed downloads are retried
+    with exponential backoff, and every download is checked to be a complete
+    Parquet file, and against its SHA-256 checksum when one is known, before
+    it is parsed.
+    """
+    def __init__(
+            self,
+            base_url: str=NFLVERSE_PBP_URL,
+            connections: int=HTTP_CONNECTIONS,
+            retries: int=HTTP_RETRIES,
+            backoff: float=HTTP_BACKOFF_SECONDS,
+            checksums: dict[int, str]=None
+        ) -> "HttpMirrorSource":
+        """
+        Constructor for the HttpMirrorSource class
+
+        Args:
+            base_url (str): The URL of the directory of release files
+            connections (int): The most connections open at once
+            retries (int): The number of times a failed download is retried
+            backoff (float): The wait in seconds before the first retry,
+                doubling after each retry
+            checksums (dict[int, str]): The SHA-256 checksum of the release
+                file of any season, none if None
+
+        Returns:
+            HttpMirrorSource: The instantiated HttpMirrorSource
+        """
+        if retries < 0:
+            raise ValueError(f"Retries must be at least 0, got: {retries}")
+        self.base_url = base_url.rstrip('/')
+        self.pool = HttpConnectionPool(connections)
+        self.retries = retries
+        self.backoff = backoff
+        self.checksums = {} if checksums is None else checksums
+
+    def download(
+            self,
+            year: int
+        ) -> bytes:
+        """
+        Downloads and checks the release file of a single season, retrying
+        failed and corrupt downloads
+
+        Args:
+            year (int): The season to download
+
+        Returns:
+            bytes: The release file of the season
+        """
+        url = f'{self.base_url}/{pbp_release_file(year)}'
+        for attempt in range(self.retries + 1):
+            try:
+                body = self.pool.get(url)
+                if len(body) < 2 * len(PARQUET_MAGIC) or \
+                        body[:len(PARQUET_MAGIC)] != PARQUET_MAGIC or \
+                        body[-len(PARQUET_MAGIC):] != PARQUET_MAGIC:
+                    raise ConnectionError(f"GET {url} did not return a complete Parquet file")
+                if year in self.checksums and hashlib.sha256(body).hexdigest() != self.checksums[year]:
+                    raise ConnectionError(f"GET {url} does not match its checksum")
+                return body
+            except (ConnectionError, OSError, http.client.HTTPException) as error:
+                if attempt == self.retries:
+                    raise ConnectionError(f"Failed to fetch season {year} after {attempt + 1} attempts: {error}") from error
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def fetch(
+            self,
+            year: int
+        ) -> pd.DataFrame:
+        """
+        Downloads a single season of raw play-by-play data
+
+        Args:
+            year (int): The season to download
+
+        Returns:
+            pd.DataFrame: The raw play-by-play data for the season
+        """
+        df = pq.read_table(io.BytesIO(self.download(year))).to_pandas()
+        return finish_nfl_pbp_release(df, year)
+
+def open_nfl_pbp_source(
+        location: str=NFL_PBP_SOURCE
+    ) -> object:
+    """
+    Opens the play-by-play source at a location
+
+    Args:
+        location (str): nfl_data_py, the URL of an HTTP mirror, or a local
+            directory of release files
+
+    Returns:
+        object: The source, which fetches a season with fetch(year)
+    """
+    if location == 'nfl_data_py':
+        return NflDataPySource()
+    if location.startswith(('http://', 'https://')):
+        return HttpMirrorSource(location)
+    if os.path.isdir(location):
+        return LocalDirectorySource(location)
+    raise ValueError(f"Unknown play-by-play source: {location}")
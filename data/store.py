@@ -0,0 +1,769 @@
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data.cache import WORKDIR, cache_nfl_pbp_seasons, load_nfl_pbp_data
+from data.pbp import (
+    NFL_PBP_YEARS,
+    NFL_PBP_DATASETS,
+    FIELD_GOAL_SKILL_METRICS,
+    RUN_SKILL_METRICS,
+    PASS_SKILL_METRICS,
+    PUNT_SKILL_METRICS,
+    KICKOFF_SKILL_METRICS,
+    PLAYCALL_SKILL_METRICS,
+    BETWEEN_PLAY_SKILL_METRICS,
+    aggregate_team_season_playresult_totals,
+    derive_team_season_playresult_skills_from_totals,
+    drop_play_duration_outliers,
+    load_prepared_nfl_pbp_season,
+    nfl_pbp_dataset_columns,
+    prepare_nfl_pbp_data
+)
+from data.skill import (
+    OFFENSE,
+    DEFENSE,
+    ScalerRegistry,
+    aggregate_team_season_totals,
+    derive_team_season_skills_from_totals
+)
+from team.coach import CoachSkill
+from team.defense import DefensiveSkill
+from team.offense import OffensiveSkill
+
+SKILL_STORE_PATH = f'{WORKDIR}/cache/team_skills.parquet'
+SKILL_TOTALS_PATH = f'{WORKDIR}/cache/team_skill_totals.parquet'
+ROLLING_SKILL_STORE_PATH = f'{WORKDIR}/cache/team_week_skills.parquet'
+SKILL_STORE_SCHEMA_VERSION = 3
+SKILL_STORE_METADATA_KEY = b'team_skills'
+
+# The stored normalized skills averaged into each OffensiveSkill property
+OFFENSIVE_SKILL_COLUMNS = {
+    'blocking': ['norm_playresult_blocking'],
+    'rushing': ['norm_playresult_rushing'],
+    'passing': ['norm_playresult_passing'],
+    'receiving': ['norm_playresult_receiving'],
+    'scrambling': ['norm_playresult_scrambling'],
+    'turnovers': ['norm_playresult_offensive_turnovers'],
+    'penalties': ['norm_playresult_offensive_penalties'],
+    'field_goals': ['norm_field_goal_field_goal_percent'],
+    'punting': ['norm_punt_punting'],
+    'kickoffs': ['norm_kickoff_kicking'],
+    'kick_return_defense': ['norm_punt_return_defense', 'norm_kickoff_return_defense']
+}
+
+# The stored normalized skills averaged into each DefensiveSkill property
+DEFENSIVE_SKILL_COLUMNS = {
+    'blitzing': ['norm_playresult_blitzing'],
+    'rush_defense': ['norm_playresult_rush_defense'],
+    'pass_defense': ['norm_playresult_pass_defense'],
+    'coverage': ['norm_playresult_coverage'],
+    'turnovers': ['norm_playresult_defensive_turnovers'],
+    'penalties': ['norm_playresult_defensive_penalties'],
+    'field_goal_defense': ['norm_field_goal_blocked_percent'],
+    'kick_returning': ['norm_punt_returning', 'norm_kickoff_returning']
+}
+
+# The stored normalized skills averaged into each CoachSkill property
+COACH_SKILL_COLUMNS = {
+    'risk_taking': ['norm_playcall_go_for_it_percent'],
+    'run_pass': ['norm_playcall_run_percent'],
+    'up_tempo': ['norm_between_play_up_tempo']
+}
+
+# The metrics of each skill group, where the play result skills are instead
+# derived by derive_team_season_playresult_skills_from_totals
+TEAM_SKILL_GROUPS = {
+    'playresult': None,
+    'playcall': PLAYCALL_SKILL_METRICS,
+    'between_play': BETWEEN_PLAY_SKILL_METRICS,
+    'field_goal': FIELD_GOAL_SKILL_METRICS,
+    'run': RUN_SKILL_METRICS,
+    'pass': PASS_SKILL_METRICS,
+    'punt': PUNT_SKILL_METRICS,
+    'kickoff': KICKOFF_SKILL_METRICS
+}
+
+def team_season_index(
+        table: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Re-indexes a team-season table by plain season and team values, so that
+    tables aggregated from separate loads align with each other
+
+    Args:
+        table (pd.DataFrame): A table indexed by season (and optionally week)
+            and team
+
+    Returns:
+        pd.DataFrame: The table indexed by integer season (and week) and
+            string team
+    """
+    levels = table.index.nlevels
+    table.index = pd.MultiIndex.from_arrays(
+        [table.index.get_level_values(level).astype(int) for level in range(levels - 1)]
+            + [table.index.get_level_values(levels - 1).astype(str)],
+        names=table.index.names[:levels - 1] + ['team']
+    )
+    return table
+
+def prefix_team_season_skills(
+        skills: dict[str, pd.DataFrame],
+        group: str
+    ) -> pd.DataFrame:
+    """
+    Combines the offensive and defensive skills of a skill group into a single
+    table indexed by season and team, prefixing each skill with its group so
+    that skills from different groups never collide (e.g. rushing becomes
+    run_rushing and norm_rushing becomes norm_run_rushing)
+
+    Args:
+        skills (dict[str, pd.DataFrame]): The skills of each side of the ball
+        group (str): The name of the skill group
+
+    Returns:
+        pd.DataFrame: The prefixed skills, indexed by season and team
+    """
+    tables = []
+    for table in skills.values():
+        table = table.rename_axis(list(table.index.names[:-1]) + ['team'])
+        table.columns = [
+            f'norm_{group}_{column[len("norm_"):]}' if column.startswith('norm_') else f'{group}_{column}'
+            for column in table.columns
+        ]
+        tables.append(table)
+    return pd.concat(tables, axis=1)
+
+def aggregate_team_skill_totals(
+        df: pd.DataFrame,
+        keys: list[str]=['season']
+    ) -> pd.DataFrame:
+    """
+    Aggregates the totals from which every team skill is derived, over the
+    same plays each of the data loaders derives them over.  Totals are sums,
+    so the totals of disjoint sets of games can be added together.
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data, including outliers
+        keys (list[str]): The columns grouped by ahead of the team, e.g.
+            season and week for weekly totals
+
+    Returns:
+        pd.DataFrame: One row of totals per team and season (or per key),
+            with each total named <group>.<side>.<total>
+    """
+    timed = drop_play_duration_outliers(df)
+    group_plays = {
+        'playresult': df,
+        'playcall': df,
+        'between_play': timed,
+        'field_goal': timed.query('field_goal_attempt == 1'),
+        'run': timed.dropna(subset=['down']).query('rush_attempt == 1'),
+        'pass': timed.query('pass_attempt == 1 or qb_scramble == 1'),
+        'punt': timed.query('punt_attempt == 1'),
+        'kickoff': timed.query('kickoff_attempt == 1')
+    }
+    tables = []
+    for group, metrics in TEAM_SKILL_GROUPS.items():
+        if metrics is None:
+            totals = aggregate_team_season_playresult_totals(group_plays[group], keys=keys)
+        else:
+            totals = aggregate_team_season_totals(group_plays[group], metrics, keys=keys)
+        for side, side_totals in totals.items():
+            tables.append(team_season_index(side_totals.add_prefix(f'{group}.{side}.')))
+    return pd.concat(tables, axis=1).sort_index()
+
+def derive_team_skill_group(
+        totals: pd.DataFrame,
+        group: str,
+        registry: ScalerRegistry=None
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Derives the raw and normalized team skills of a single group for every
+    team and season from the aggregated totals
+
+    Args:
+        totals (pd.DataFrame): The totals from aggregate_team_skill_totals
+        group (str): The name of the skill group in TEAM_SKILL_GROUPS
+        registry (ScalerRegistry): Records the scale of each normalized
+            skill under its prefixed name (e.g. run_rushing), discarded if
+            None
+
+    Returns:
+        dict[str, pd.DataFrame]: The group's skills for each side, indexed by
+            season and team
+    """
+    # Split out the totals of each side, dropping teams without plays
+    group_totals = {}
+    for side in (OFFENSE, DEFENSE):
+        prefix = f'{group}.{side}.'
+        columns = [column for column in totals.columns if column.startswith(prefix)]
+        if len(columns) > 0:
+            group_totals[side] = totals[columns].dropna(how='all').rename(
+                columns=lambda column: column[len(prefix):]
+            )
+
+    # Derive the group's skills, recording their scales as they are
+    # normalized
+    metrics = TEAM_SKILL_GROUPS[group]
+    group_registry = ScalerRegistry()
+    if metrics is None:
+        skills = derive_team_season_playresult_skills_from_totals(group_totals, registry=group_registry)
+    else:
+        skills = derive_team_season_skills_from_totals(group_totals, metrics, registry=group_registry)
+    if registry is not None:
+        registry.bounds.update({f'{group}_{name}': bound for name, bound in group_registry.bounds.items()})
+    return skills
+
+def derive_team_skill_table(
+        totals: pd.DataFrame,
+        registry: ScalerRegistry=None
+    ) -> pd.DataFrame:
+    """
+    Derives every raw and normalized team skill for every team and season
+    from the aggregated totals
+
+    Args:
+        totals (pd.DataFrame): The totals from aggregate_team_skill_totals
+        registry (ScalerRegistry): Records the scale of each normalized
+            skill, discarded if None
+
+    Returns:
+        pd.DataFrame: One row of skills per team and season
+    """
+    tables = [
+        prefix_team_season_skills(derive_team_skill_group(totals, group, registry=registry), group)
+        for group in TEAM_SKILL_GROUPS
+    ]
+    return pd.concat(tables, axis=1).sort_index()
+
+def build_team_season_skill_table(
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Derives every raw and normalized team skill for every team and season,
+    over the same plays each of the data loaders derives them over
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data, including outliers
+
+    Returns:
+        pd.DataFrame: One row of skills per team and season
+    """
+    return derive_team_skill_table(aggregate_team_skill_totals(df))
+
+def write_parquet_with_metadata(
+        df: pd.DataFrame,
+        path: str,
+        metadata: dict
+    ) -> str:
+    """
+    Writes a table to Parquet with JSON metadata embedded alongside the
+    pandas schema
+
+    Args:
+        df (pd.DataFrame): The table to write
+        path (str): The path of the Parquet file
+        metadata (dict): The JSON-serializable metadata
+
+    Returns:
+        str: The path of the Parquet file
+    """
+    arrow_table = pa.Table.from_pandas(df)
+    arrow_table = arrow_table.replace_schema_metadata({
+        **arrow_table.schema.metadata,
+        SKILL_STORE_METADATA_KEY: json.dumps(metadata).encode()
+    })
+
+    # Write to a temporary file first so partial writes are never read
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    pq.write_table(arrow_table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+def read_parquet_with_metadata(
+        path: str
+    ) -> tuple[pd.DataFrame, dict]:
+    """
+    Reads a table written by write_parquet_with_metadata, validating its
+    schema version
+
+    Args:
+        path (str): The path of the Parquet file
+
+    Returns:
+        pd.DataFrame: The table
+        dict: The embedded metadata
+    """
+    arrow_table = pq.read_table(path)
+    metadata = json.loads(arrow_table.schema.metadata[SKILL_STORE_METADATA_KEY])
+    if metadata['schema_version'] != SKILL_STORE_SCHEMA_VERSION:
+        raise ValueError(
+            f"Skill store schema version {metadata['schema_version']} does not match " \
+            f"{SKILL_STORE_SCHEMA_VERSION}, rebuild the skill store"
+        )
+    return arrow_table.to_pandas(), metadata
+
+def write_team_season_skill_store(
+        totals: pd.DataFrame,
+        games: list[str],
+        years: list[int],
+        path: str=SKILL_STORE_PATH,
+        totals_path: str=SKILL_TOTALS_PATH
+    ) -> tuple[pd.DataFrame, ScalerRegistry]:
+    """
+    Derives the team skills from their totals and writes both the skill
+    store and the totals it was derived from
+
+    Args:
+        totals (pd.DataFrame): The totals from aggregate_team_skill_totals
+        games (list[str]): The IDs of the games the totals span
+        years (list[int]): The years the totals span
+        path (str): The path of the skill store
+        totals_path (str): The path of the skill totals
+
+    Returns:
+        pd.DataFrame: The derived team skills
+        ScalerRegistry: The scales of the normalized skills
+    """
+    registry = ScalerRegistry()
+    table = derive_team_skill_table(totals, registry=registry)
+    write_parquet_with_metadata(
+        totals,
+        totals_path,
+        {
+            'schema_version': SKILL_STORE_SCHEMA_VERSION,
+            'games': sorted(games)
+        }
+    )
+    write_parquet_with_metadata(
+        table.astype(np.float32),
+        path,
+        {
+            'schema_version': SKILL_STORE_SCHEMA_VERSION,
+            'years': sorted(years),
+            'bounds': registry.bounds
+        }
+    )
+    return table, registry
+
+def aggregate_season_team_skill_totals(
+        year: int
+    ) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Loads a single season of play-by-play data and aggregates its team skill
+    totals
+
+    Args:
+        year (int): The season to aggregate
+
+    Returns:
+        tuple[pd.DataFrame, list[str]]: The season's totals from
+            aggregate_team_skill_totals and the IDs of its games
+    """
+    df = load_prepared_nfl_pbp_season(year, columns=nfl_pbp_dataset_columns(NFL_PBP_DATASETS))
+    return aggregate_team_skill_totals(df), list(df['game_id'].unique())
+
+def build_team_season_skill_store(
+        years: list[int]=NFL_PBP_YEARS,
+        path: str=SKILL_STORE_PATH,
+        totals_path: str=SKILL_TOTALS_PATH,
+        workers: int=1
+    ) -> str:
+    """
+    Builds the team-season skill store, a Parquet file with one row of raw
+    and normalized skills per team and season.  The normalization bounds and
+    the schema version are stored in the file metadata.  The totals the
+    skills are derived from are stored alongside, so that new games can be
+    appended by update_team_season_skill_store.
+
+    The totals of a team and season only depend on the plays of that season,
+    so each season is loaded and aggregated separately, in its own process
+    when there are several workers.  Only the normalization spans every
+    season, and it is derived once from the merged totals.
+
+    Args:
+        years (list[int]): The years of play-by-play data to derive skills from
+        path (str): The path of the skill store
+        totals_path (str): The path of the skill totals
+        workers (int): The number of processes aggregating seasons in parallel
+
+    Returns:
+        str: The path of the skill store
+    """
+    if workers < 1:
+        raise ValueError(f"Workers must be at least 1, got: {workers}")
+    if workers == 1:
+        seasons = [aggregate_season_team_skill_totals(year) for year in years]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(years))) as executor:
+            seasons = list(executor.map(aggregate_season_team_skill_totals, years))
+
+    # Merge the season-local totals, which never share a team-season
+    write_team_season_skill_store(
+        pd.concat([totals for totals, _ in seasons]).sort_index(),
+        [game for _, games in seasons for game in games],
+        years,
+        path=path,
+        totals_path=totals_path
+    )
+    return path
+
+def update_team_season_skill_store(
+        years: list[int],
+        path: str=SKILL_STORE_PATH,
+        totals_path: str=SKILL_TOTALS_PATH
+    ) -> str:
+    """
+    Appends the games played since the skill store was last built or updated.
+    The given seasons are re-fetched, only the games which are not yet in the
+    stored totals are aggregated, and their totals are added to the stored
+    totals.  A re-fetch which fails or lacks any cached game raises and
+    keeps the cached season.  Every skill and normalization is then re-derived from the
+    totals, which spans one row per team and season rather than every play.
+
+    Args:
+        years (list[int]): The seasons to check for new games, typically the
+            current season
+        path (str): The path of the skill store
+        totals_path (str): The path of the skill totals
+
+    Returns:
+        str: The path of the skill store
+    """
+    if not os.path.exists(totals_path) or not os.path.exists(path):
+        return build_team_season_skill_store(years, path=path, totals_path=totals_path)
+    totals, totals_metadata = read_parquet_with_metadata(totals_path)
+    _, store_metadata = read_parquet_with_metadata(path)
+
+    # Re-fetch the seasons and keep only the games which are not yet stored
+    cache_nfl_pbp_seasons(years, refresh=True)
+    df = load_nfl_pbp_data(years, columns=nfl_pbp_dataset_columns(NFL_PBP_DATASETS))
+    df = df[~df['game_id'].isin(totals_metadata['games'])].reset_index(drop=True)
+    if len(df) == 0:
+        print("No new games to append to the skill store")
+        return path
+    df = prepare_nfl_pbp_data(df)
+    new_games = list(df['game_id'].unique())
+
+    # Add the totals of the new games to the stored totals
+    new_totals = aggregate_team_skill_totals(df)
+    totals = totals.add(new_totals, fill_value=0)
+    _, registry = write_team_season_skill_store(
+        totals,
+        totals_metadata['games'] + new_games,
+        sorted(set(store_metadata['years']) | set(years)),
+        path=path,
+        totals_path=totals_path
+    )
+
+    # Report the skills whose normalization bounds moved
+    moved = [skill for skill, bound in registry.bounds.items() if store_metadata['bounds'].get(skill) != bound]
+    print(
+        f"Appended {len(new_games)} games to {len(new_totals)} team-seasons, " \
+        f"normalization bounds moved for {len(moved)} skills"
+    )
+    return path
+
+def aggregate_season_team_week_skill_totals(
+        year: int
+    ) -> pd.DataFrame:
+    """
+    Loads a single season of play-by-play data and aggregates its team skill
+    totals for every week
+
+    Args:
+        year (int): The season to aggregate
+
+    Returns:
+        pd.DataFrame: The season's totals, indexed by season, week and team
+    """
+    columns = nfl_pbp_dataset_columns(NFL_PBP_DATASETS) + ['week']
+    df = load_prepared_nfl_pbp_season(year, columns=columns)
+    return aggregate_team_skill_totals(df, keys=['season', 'week'])
+
+def derive_rolling_team_skill_totals(
+        totals: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Accumulates weekly team skill totals into the totals of every game a team
+    played before each week of the season.  Every team of a season gets a
+    row for every week of the season, including its bye week, and the whole
+    table is accumulated in one cumulative sum per team and season, shifted
+    by one week so that a week never includes its own games.
+
+    Args:
+        totals (pd.DataFrame): The weekly totals from aggregate_team_skill_totals,
+            indexed by season, week and team
+
+    Returns:
+        pd.DataFrame: The totals before each week, indexed by season, week and
+            team, where each team's first week has no prior games
+    """
+    # Fill every week of each season for every team of the season
+    grid = []
+    for season, season_totals in totals.groupby(level='season'):
+        grid.append(pd.MultiIndex.from_product(
+            [
+                [season],
+                season_totals.index.unique(level='week').sort_values(),
+                season_totals.index.unique(level='team').sort_values()
+            ],
+            names=['season', 'week', 'team']
+        ))
+    if len(grid) == 0:
+        return totals.reindex(pd.MultiIndex.from_tuples([], names=['season', 'week', 'team']))
+    totals = totals.reindex(grid[0].append(grid[1:])).fillna(0).sort_index()
+
+    # Sum each team's prior weeks in one pass
+    cumulative = totals.groupby(level=['season', 'team']).cumsum()
+    return cumulative.groupby(level=['season', 'team']).shift(1, fill_value=0)
+
+def build_rolling_team_skill_table(
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Derives every raw and normalized team skill for every team and week of
+    each season, using only the games played before that week
+
+    Args:
+        df (pd.DataFrame): Prepared play-by-play data with the week of each
+            play, including outliers
+
+    Returns:
+        pd.DataFrame: One row of skills per season, week and team
+    """
+    totals = aggregate_team_skill_totals(df, keys=['season', 'week'])
+    return derive_team_skill_table(derive_rolling_team_skill_totals(totals))
+
+def build_rolling_team_skill_store(
+        years: list[int]=NFL_PBP_YEARS,
+        path: str=ROLLING_SKILL_STORE_PATH,
+        workers: int=1
+    ) -> str:
+    """
+    Builds the rolling team skill store, a Parquet file with one row of raw
+    and normalized skills per season, week and team, each derived only from
+    the team's earlier games that season.  This gives point-in-time ratings
+    which never see the games they are used to simulate.  The skills are
+    normalized over every season, week and team, and the normalization
+    bounds are stored in the file metadata.
+
+    Args:
+        years (list[int]): The years of play-by-play data to derive skills from
+        path (str): The path of the rolling skill store
+        workers (int): The number of processes aggregating seasons in parallel
+
+    Returns:
+        str: The path of the rolling skill store
+    """
+    if workers < 1:
+        raise ValueError(f"Workers must be at least 1, got: {workers}")
+    if workers == 1:
+        seasons = [aggregate_season_team_week_skill_totals(year) for year in years]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(years))) as executor:
+            seasons = list(executor.map(aggregate_season_team_week_skill_totals, years))
+
+    # Accumulate and derive the skills of every week at once
+    registry = ScalerRegistry()
+    table = derive_team_skill_table(derive_rolling_team_skill_totals(pd.concat(seasons)), registry=registry)
+    write_parquet_with_metadata(
+        table.astype(np.float32),
+        path,
+        {
+            'schema_version': SKILL_STORE_SCHEMA_VERSION,
+            'years': sorted(years),
+            'bounds': registry.bounds
+        }
+    )
+    return path
+
+def average_skill_properties(
+        skills: dict[str, float],
+        columns: dict[str, list[str]]
+    ) -> dict[str, float]:
+    """
+    Averages normalized skills into skill object properties.  Properties
+    without any value fall back to the league average of 0.5.
+
+    Args:
+        skills (dict[str, float]): The normalized skills
+        columns (dict[str, list[str]]): The skills of each property
+
+    Returns:
+        dict[str, float]: The skill object properties
+    """
+    properties = {}
+    for name, skill_columns in columns.items():
+        values = [skills[column] for column in skill_columns if not pd.isna(skills.get(column, np.nan))]
+        properties[name] = float(np.mean(values)) if len(values) > 0 else 0.5
+    return properties
+
+class TeamSkillStore:
+    """
+    Read-only lookup of historical team skills from the team-season skill
+    store, or of point-in-time team skills from the rolling skill store by
+    also passing the week.  The store is read once, after which each lookup
+    is a dictionary access.
+    """
+    def __init__(
+            self,
+            path: str=SKILL_STORE_PATH
+        ) -> "TeamSkillStore":
+        """
+        Constructor for the TeamSkillStore class
+
+        Args:
+            path (str): The path of the skill store or the rolling skill store
+
+        Returns:
+            TeamSkillStore: The instantiated TeamSkillStore
+        """
+        self.table, metadata = read_parquet_with_metadata(path)
+        self.years = metadata['years']
+        self.bounds = metadata['bounds']
+        self.scalers = ScalerRegistry(self.bounds)
+        self.records = self.table.to_dict('index')
+
+    def skills(
+            self,
+            season: int,
+            team: str,
+            week: int=None
+        ) -> dict[str, float]:
+        """
+        Looks up every stored skill of a team in a season
+
+        Args:
+            season (int): The season
+            team (str): The team abbreviation (e.g. KC)
+            week (int): The week of a rolling skill store, before which the
+                skills are derived
+
+        Returns:
+            dict[str, float]: The raw and normalized skills of the team
+        """
+        key = (season, team) if week is None else (season, week, team)
+        if key not in self.records:
+            if week is None:
+                raise ValueError(f"No skills stored for {team} in {season}")
+            raise ValueError(f"No skills stored for {team} in week {week} of {season}")
+        return self.records[key]
+
+    def skill_properties(
+            self,
+            season: int,
+            team: str,
+            columns: dict[str, list[str]],
+            week: int=None
+        ) -> dict[str, float]:
+        """
+        Averages the stored normalized skills into skill object properties.
+        Properties without any stored value (e.g. a team which never
+        attempted a field goal, or any team before its first game of a
+        season) fall back to the league average of 0.5.
+
+        Args:
+            season (int): The season
+            team (str): The team abbreviation (e.g. KC)
+            columns (dict[str, list[str]]): The stored skills of each property
+            week (int): The week of a rolling skill store, before which the
+                skills are derived
+
+        Returns:
+            dict[str, float]: The skill object properties
+        """
+        return average_skill_properties(self.skills(season, team, week=week), columns)
+
+    def rate(
+            self,
+            raw: dict[str, float]
+        ) -> tuple[OffensiveSkill, DefensiveSkill, CoachSkill]:
+        """
+        Rates a new or hypothetical team from its raw skills against the
+        scale of the stored skills, without re-normalizing the store.  Raw
+        skills are named as stored (e.g. playresult_rushing), values outside
+        the stored scale are clipped, and skills which are not given fall
+        back to the league average of 0.5.
+
+        Args:
+            raw (dict[str, float]): The raw skills of the team
+
+        Returns:
+            tuple[OffensiveSkill, DefensiveSkill, CoachSkill]: The skills of
+                the team
+        """
+        skills = dict(raw)
+        for name, value in raw.items():
+            if name in self.scalers.bounds:
+                skills[f'norm_{name}'] = float(self.scalers.transform(name, value, clip=True))
+        return (
+            OffensiveSkill(**average_skill_properties(skills, OFFENSIVE_SKILL_COLUMNS)),
+            DefensiveSkill(**average_skill_properties(skills, DEFENSIVE_SKILL_COLUMNS)),
+            CoachSkill(**average_skill_properties(skills, COACH_SKILL_COLUMNS))
+        )
+
+    def offensive_skill(
+            self,
+            season: int,
+            team: str,
+            week: int=None
+        ) -> OffensiveSkill:
+        """
+        Looks up the offensive skill of a team in a season
+
+        Args:
+            season (int): The season
+            team (str): The team abbreviation (e.g. KC)
+            week (int): The week of a rolling skill store, before which the
+                skills are derived
+
+        Returns:
+            OffensiveSkill: The offensive skill of the team
+        """
+        return OffensiveSkill(**self.skill_properties(season, team, OFFENSIVE_SKILL_COLUMNS, week=week))
+
+    def defensive_skill(
+            self,
+            season: int,
+            team: str,
+            week: int=None
+        ) -> DefensiveSkill:
+        """
+        Looks up the defensive skill of a team in a season
+
+        Args:
+            season (int): The season
+            team (str): The team abbreviation (e.g. KC)
+            week (int): The week of a rolling skill store, before which the
+                skills are derived
+
+        Returns:
+            DefensiveSkill: The defensive skill of the team
+        """
+        return DefensiveSkill(**self.skill_properties(season, team, DEFENSIVE_SKILL_COLUMNS, week=week))
+
+    def coach_skill(
+            self,
+            season: int,
+            team: str,
+            week: int=None
+        ) -> CoachSkill:
+        """
+        Looks up the coaching tendencies of a team in a season
+
+        Args:
+            season (int): The season
+            team (str): The team abbreviation (e.g. KC)
+            week (int): The week of a rolling skill store, before which the
+                skills are derived
+
+        Returns:
+            CoachSkill: The coaching tendencies of the team
+        """
+        return CoachSkill(**self.skill_properties(season, team, COACH_SKILL_COLUMNS, week=week))
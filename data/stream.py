@@ -0,0 +1,136 @@
+import pandas as pd
+from typing import Iterator
+from data.pbp import (
+    NFL_PBP_YEARS,
+    NFL_PBP_DATASETS,
+    clean_nfl_pbp_between_play_data,
+    clean_nfl_pbp_fieldgoal_data,
+    clean_nfl_pbp_kickoff_data,
+    clean_nfl_pbp_pass_data,
+    clean_nfl_pbp_playcall_data,
+    clean_nfl_pbp_playresult_data,
+    clean_nfl_pbp_punt_data,
+    clean_nfl_pbp_run_data,
+    drop_play_duration_outliers,
+    load_prepared_nfl_pbp_season,
+    nfl_pbp_dataset_columns
+)
+from data.skill import MinMaxBounds
+from data.store import aggregate_season_team_skill_totals, derive_team_skill_group
+
+# The skill group in the skill store of each dataset
+NFL_PBP_DATASET_SKILL_GROUPS = {
+    'playcall': 'playcall',
+    'playresult': 'playresult',
+    'between_play': 'between_play',
+    'fieldgoal': 'field_goal',
+    'run': 'run',
+    'pass': 'pass',
+    'punt': 'punt',
+    'kickoff': 'kickoff'
+}
+
+# The datasets with normalized skill diffs, which need their own bounds pass
+NFL_PBP_DIFF_DATASETS = ['fieldgoal', 'run', 'pass', 'punt', 'kickoff']
+
+def clean_nfl_pbp_season_data(
+        df: pd.DataFrame,
+        datasets: list[str],
+        skills: dict[str, dict[str, pd.DataFrame]],
+        bounds: dict[str, MinMaxBounds]
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Cleans a single season of prepared NFL play-by-play data into each of the
+    requested datasets, labeling it with previously derived skills and
+    normalizing its skill diffs with the given bounds
+
+    Args:
+        df (pd.DataFrame): A season of prepared play-by-play data
+        datasets (list[str]): The names of the datasets to clean
+        skills (dict[str, dict[str, pd.DataFrame]]): The team-season skills
+            of each dataset
+        bounds (dict[str, MinMaxBounds]): The skill diff bounds of each
+            dataset with skill diffs
+
+    Returns:
+        Iterator[tuple[str, pd.DataFrame]]: The name and cleaned season of
+            each requested dataset
+    """
+    # Clean the datasets which span every play
+    if 'playcall' in datasets:
+        yield 'playcall', clean_nfl_pbp_playcall_data(df, skills=skills['playcall'])
+    if 'playresult' in datasets:
+        yield 'playresult', clean_nfl_pbp_playresult_data(df, skills=skills['playresult'])
+
+    # Clean the datasets which exclude duration outliers
+    df = drop_play_duration_outliers(df)
+    if 'between_play' in datasets:
+        yield 'between_play', clean_nfl_pbp_between_play_data(df, skills=skills['between_play'])
+    if 'fieldgoal' in datasets:
+        yield 'fieldgoal', clean_nfl_pbp_fieldgoal_data(
+            df,
+            skills=skills['fieldgoal'],
+            bounds=bounds['fieldgoal']
+        )
+    if 'run' in datasets:
+        yield 'run', clean_nfl_pbp_run_data(df, skills=skills['run'], bounds=bounds['run'])
+    if 'pass' in datasets:
+        yield 'pass', clean_nfl_pbp_pass_data(df, skills=skills['pass'], bounds=bounds['pass'])
+    if 'punt' in datasets:
+        yield 'punt', clean_nfl_pbp_punt_data(df, skills=skills['punt'], bounds=bounds['punt'])
+    if 'kickoff' in datasets:
+        yield 'kickoff', clean_nfl_pbp_kickoff_data(df, skills=skills['kickoff'], bounds=bounds['kickoff'])
+
+def stream_clean_nfl_pbp_data(
+        years: list[int]=NFL_PBP_YEARS,
+        datasets: list[str]=NFL_PBP_DATASETS
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Builds the cleaned datasets one season at a time, so that peak memory is
+    bounded by the largest season rather than every season at once.
+
+    The first pass aggregates the team skill totals of each season, from
+    which the skills and their normalizations over every season are derived.
+    If any dataset has skill diffs, a second pass accumulates the bounds of
+    the diffs.  The last pass cleans each season with the global skills and
+    bounds and yields it, so that the caller can append it to an on-disk
+    output and release it before the next season.
+
+    Unlike build_clean_nfl_pbp_data, values derived from neighbouring plays
+    never cross seasons, and the play result passes without a recorded length
+    are split into short and deep passes by the proportion in their season.
+
+    Args:
+        years (list[int]): The years of play-by-play data to load
+        datasets (list[str]): The names of the datasets to build
+
+    Returns:
+        Iterator[tuple[str, pd.DataFrame]]: The name and cleaned season of
+            each requested dataset, for every season in order
+    """
+    for name in datasets:
+        if name not in NFL_PBP_DATASETS:
+            raise ValueError(f"Unknown dataset: {name}")
+    columns = nfl_pbp_dataset_columns(datasets)
+
+    # Derive the skills over every season from the totals of each season
+    totals = pd.concat([aggregate_season_team_skill_totals(year)[0] for year in years]).sort_index()
+    skills = {
+        name: derive_team_skill_group(totals, NFL_PBP_DATASET_SKILL_GROUPS[name])
+        for name in datasets
+    }
+
+    # Accumulate the bounds of the skill diffs over every season
+    diff_datasets = [name for name in datasets if name in NFL_PBP_DIFF_DATASETS]
+    bounds = {name: MinMaxBounds() for name in diff_datasets}
+    if len(diff_datasets) > 0:
+        for year in years:
+            df = load_prepared_nfl_pbp_season(year, columns=columns)
+            for _ in clean_nfl_pbp_season_data(df, diff_datasets, skills, bounds):
+                pass
+    bounds = {name: MinMaxBounds(bounds[name].bounds) for name in diff_datasets}
+
+    # Clean each season with the global skills and bounds
+    for year in years:
+        df = load_prepared_nfl_pbp_season(year, columns=columns)
+        yield from clean_nfl_pbp_season_data(df, datasets, skills, bounds)
@@ -0,0 +1,312 @@
+import numpy as np
+import pandas as pd
+from data.pbp import FIELD_GOAL_RESULTS
+
+# Slack on range checks, since normalized columns are stored as float32
+VALIDATION_TOLERANCE = 1e-5
+
+# A schema maps each checked column to its rule.  A rule may bound the values
+# with min and max, restrict them to a domain of allowed values, and forbid
+# missing values with nullable=False.  Columns without a rule are unchecked,
+# and every column with a rule must be present.
+FLAG_RULE = {'domain': [0, 1]}
+NORM_RULE = {'min': 0, 'max': 1}
+YARDS_RULE = {'min': -100, 'max': 110}
+PLAY_DURATION_RULE = {'min': 0, 'max': 69, 'nullable': False}
+
+# The game context, within the bounds of PlayContext.validate_static except
+# for the quarter, since overtime plays are kept for training
+GAME_CONTEXT_SCHEMA = {
+    'qtr': {'min': 1, 'max': 5, 'nullable': False},
+    'half_seconds_remaining': {'min': 0, 'max': 1800, 'nullable': False},
+    'down': {'min': 0, 'max': 4, 'nullable': False},
+    'ydstogo': {'min': 0, 'max': 100, 'nullable': False},
+    'yardline_100': {'min': 0, 'max': 100, 'nullable': False},
+    'defteam_timeouts_remaining': {'min': 0, 'max': 3, 'nullable': False},
+    'posteam_timeouts_remaining': {'min': 0, 'max': 3, 'nullable': False},
+    'score_diff': {'min': -100, 'max': 100},
+    'goal_to_go': FLAG_RULE
+}
+
+# The play types left after the playcall cleaning drops no_play
+PLAYCALL_PLAY_TYPES = [
+    'pass',
+    'run',
+    'punt',
+    'field_goal',
+    'kickoff',
+    'extra_point',
+    'qb_kneel',
+    'qb_spike'
+]
+
+NFL_PBP_DATASET_SCHEMAS = {
+    'playcall': {
+        **GAME_CONTEXT_SCHEMA,
+        'no_huddle': FLAG_RULE,
+        'play_type': {'domain': PLAYCALL_PLAY_TYPES, 'nullable': False},
+        'run_percent': NORM_RULE,
+        'norm_run_percent': NORM_RULE,
+        'go_for_it_percent': NORM_RULE,
+        'norm_go_for_it_percent': NORM_RULE
+    },
+    'playresult': {
+        **GAME_CONTEXT_SCHEMA,
+        **{
+            column: FLAG_RULE
+            for column in [
+                'play_type_short_pass',
+                'play_type_deep_pass',
+                'play_type_run_left',
+                'play_type_run_middle',
+                'play_type_run_right',
+                'play_type_kickoff',
+                'play_type_punt',
+                'play_type_extra_point',
+                'play_type_field_goal',
+                'play_type_qb_kneel',
+                'play_type_qb_spike',
+                'play_type_offense_timeout',
+                'play_type_defense_timeout',
+                'first_down',
+                'touchdown',
+                'complete_pass',
+                'out_of_bounds',
+                'qb_scramble',
+                'qb_hit',
+                'sack',
+                'tackled_for_loss',
+                'fumble',
+                'interception',
+                'field_goal_result_blocked',
+                'field_goal_result_made',
+                'field_goal_result_missed',
+                'penalty',
+                'posteam_penalty',
+                'timeout',
+                'posteam_timeout'
+            ]
+        },
+        'norm_rushing': {**NORM_RULE, 'nullable': False},
+        **{
+            column: NORM_RULE
+            for column in [
+                'norm_blocking',
+                'norm_passing',
+                'norm_receiving',
+                'norm_scrambling',
+                'norm_offensive_turnovers',
+                'norm_offensive_penalties',
+                'norm_blitzing',
+                'norm_rush_defense',
+                'norm_pass_defense',
+                'norm_coverage',
+                'norm_defensive_turnovers',
+                'norm_defensive_penalties'
+            ]
+        },
+        'play_duration': PLAY_DURATION_RULE,
+        'yards_gained': YARDS_RULE,
+        'penalty_yards': {'min': 0, 'max': 100, 'nullable': False}
+    },
+    'between_play': {
+        **GAME_CONTEXT_SCHEMA,
+        'no_huddle': FLAG_RULE,
+        'timeout': FLAG_RULE,
+        'norm_average_play_duration': NORM_RULE,
+        'play_duration': PLAY_DURATION_RULE,
+        'prev_play_duration': {'min': 0, 'max': 69}
+    },
+    'fieldgoal': {
+        'yardline_100': {'min': 0, 'max': 100, 'nullable': False},
+        'norm_field_goal_percent': NORM_RULE,
+        'norm_diff_field_goal_percent': NORM_RULE,
+        'norm_diff_blocked_percent': NORM_RULE,
+        'field_goal_attempt': {'domain': [1], 'nullable': False},
+        'field_goal_result': {'domain': FIELD_GOAL_RESULTS},
+        'return_yards': YARDS_RULE,
+        'play_duration': PLAY_DURATION_RULE
+    },
+    'run': {
+        **GAME_CONTEXT_SCHEMA,
+        'norm_diff_rushing': NORM_RULE,
+        'norm_diff_blocking_blitzing': NORM_RULE,
+        'norm_diff_ball_handling': NORM_RULE,
+        'norm_rushing_penalties': NORM_RULE,
+        'norm_rush_defense_penalties': NORM_RULE,
+        'play_duration': PLAY_DURATION_RULE,
+        'yards_gained': YARDS_RULE,
+        'penalty': FLAG_RULE,
+        'posteam_penalty': FLAG_RULE,
+        'penalty_yards': {'min': 0, 'max': 100, 'nullable': False},
+        'fumble': FLAG_RULE,
+        'return_yards': YARDS_RULE,
+        'touchdown': FLAG_RULE
+    },
+    'pass': {
+        'yardline_100': {'min': 0, 'max': 100, 'nullable': False},
+        **{
+            column: NORM_RULE
+            for column in [
+                'norm_passing',
+                'norm_receiving',
+                'norm_pass_blocking',
+                'norm_scrambling',
+                'norm_pass_interceptions',
+                'norm_pass_defense',
+                'norm_coverage',
+                'norm_pass_rushing',
+                'norm_def_interceptions',
+                'norm_diff_passing',
+                'norm_diff_receiving',
+                'norm_diff_pass_blocking_rushing',
+                'norm_diff_interceptions'
+            ]
+        },
+        **{
+            column: FLAG_RULE
+            for column in [
+                'qb_hit',
+                'sack',
+                'tackled_for_loss',
+                'qb_scramble',
+                'pass_attempt',
+                'incomplete_pass',
+                'interception',
+                'fumble'
+            ]
+        },
+        'air_yards': YARDS_RULE,
+        'yards_after_catch': YARDS_RULE,
+        'return_yards': YARDS_RULE,
+        'pass_length': {'domain': ['short', 'deep']},
+        'play_duration': PLAY_DURATION_RULE,
+        'yards_gained': YARDS_RULE
+    },
+    'punt': {
+        'yardline_100': {'min': 0, 'max': 100, 'nullable': False},
+        'norm_blitzing': NORM_RULE,
+        'norm_punting': NORM_RULE,
+        'norm_diff_returning': NORM_RULE,
+        'kick_distance': YARDS_RULE,
+        'return_yards': YARDS_RULE,
+        **{
+            column: FLAG_RULE
+            for column in [
+                'out_of_bounds',
+                'fumble',
+                'punt_out_of_bounds',
+                'punt_blocked',
+                'punt_in_endzone',
+                'touchback',
+                'punt_inside_twenty',
+                'punt_fair_catch',
+                'punt_downed'
+            ]
+        },
+        'play_duration': PLAY_DURATION_RULE
+    },
+    'kickoff': {
+        'norm_kicking': NORM_RULE,
+        'norm_diff_returning': NORM_RULE,
+        'kick_distance': YARDS_RULE,
+        **{
+            column: FLAG_RULE
+            for column in [
+                'kickoff_inside_twenty',
+                'kickoff_in_endzone',
+                'kickoff_out_of_bounds',
+                'kickoff_downed',
+                'kickoff_fair_catch',
+                'fumble',
+                'touchback'
+            ]
+        },
+        'return_yards': YARDS_RULE,
+        'play_duration': PLAY_DURATION_RULE
+    }
+}
+
+def find_violations(
+        df: pd.DataFrame,
+        schema: dict[str, dict]
+    ) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Checks every row of a table against a schema in one vectorized pass over
+    the checked columns
+
+    Args:
+        df (pd.DataFrame): The table to check
+        schema (dict[str, dict]): The rule of each checked column, with any
+            of min, max, domain and nullable
+
+    Returns:
+        pd.DataFrame: The violation report, with one row per failed check
+            holding the column, the check, the number of violating rows and
+            an example violating value
+        np.ndarray: Whether each row violates any check
+    """
+    invalid = np.zeros(len(df), dtype=bool)
+    report = []
+    for column, rule in schema.items():
+        if column not in df.columns:
+            report.append((column, 'missing', len(df), None))
+            invalid[:] = True
+            continue
+        values = df[column]
+        missing = values.isna().to_numpy()
+        checks = {}
+        if not rule.get('nullable', True):
+            checks['nullable'] = missing
+        if 'domain' in rule:
+            checks['domain'] = ~values.isin(rule['domain']).to_numpy() & ~missing
+        if 'min' in rule or 'max' in rule:
+            numbers = pd.to_numeric(values.astype(object), errors='coerce').to_numpy(dtype=np.float64)
+            outside = np.zeros(len(df), dtype=bool)
+            if 'min' in rule:
+                outside |= numbers < rule['min'] - VALIDATION_TOLERANCE
+            if 'max' in rule:
+                outside |= numbers > rule['max'] + VALIDATION_TOLERANCE
+
+            # Values which are present but not numbers are out of range too
+            checks['range'] = outside | (np.isnan(numbers) & ~missing)
+
+        # Record each failed check with the first violating value
+        for check, violating in checks.items():
+            count = int(violating.sum())
+            if count > 0:
+                report.append((column, check, count, values.iloc[int(np.argmax(violating))]))
+                invalid |= violating
+    report = pd.DataFrame(report, columns=['column', 'check', 'violations', 'example'])
+    return report, invalid
+
+def validate_nfl_pbp_dataset(
+        name: str,
+        df: pd.DataFrame,
+        drop: bool=False
+    ) -> pd.DataFrame:
+    """
+    Validates a cleaned dataset against its schema before it is written, so
+    that bad rows are caught while building rather than while simulating
+
+    Args:
+        name (str): The name of the dataset
+        df (pd.DataFrame): The cleaned dataset, or a chunk of it
+        drop (bool): Whether to drop and report the violating rows rather
+            than raise
+
+    Returns:
+        pd.DataFrame: The valid rows of the dataset
+    """
+    if name not in NFL_PBP_DATASET_SCHEMAS:
+        raise ValueError(f"Unknown dataset: {name}")
+    report, invalid = find_violations(df, NFL_PBP_DATASET_SCHEMAS[name])
+    if len(report) == 0:
+        return df
+    table = report.to_string(index=False)
+
+    # A missing column is a bug in the cleaning rather than a bad row
+    if not drop or (report['check'] == 'missing').any():
+        raise ValueError(f"{invalid.sum()} of {len(df)} {name} rows are invalid:\n{table}")
+    print(f"Dropped {invalid.sum()} of {len(df)} invalid {name} rows:\n{table}")
+    return df[~invalid]
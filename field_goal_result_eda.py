@@ -1,11 +1,12 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 
 # Load data
-df = pd.read_csv("./data/fgs.csv")
+df = load_nfl_pbp_dataset('fieldgoal')
 
 ###
 # Field goal model flow
@@ -1,49 +1,40 @@
+import numpy as np
 import pandas as pd
-from context.context import PlayContext
 from playresult.fieldgoal.model import FieldGoalResultModel
 from team.offense import OffensiveSkill
 from team.defense import DefensiveSkill
 
 def generate_fg_result_data():
-    df = pd.DataFrame(
+    # Sweep every combination of kicking skill, field goal defense skill and
+    # yard line, with 10 kicks each
+    fg_skill, fg_def_skill, yard_line, _ = np.meshgrid(
+        1 - (np.arange(10) * (1/10)),
+        1 - (np.arange(10) * (1/10)),
+        np.arange(10) * 10,
+        np.arange(10),
+        indexing='ij'
+    )
+    fg_skill = fg_skill.ravel()
+    fg_def_skill = fg_def_skill.ravel()
+    yard_line = yard_line.ravel()
+
+    # Simulate the whole sweep in one batch, with even blocking and blitzing
+    offense = OffensiveSkill()
+    defense = DefensiveSkill()
+    model = FieldGoalResultModel()
+    results = model.sim_batch(
+        yard_line=yard_line,
+        norm_diff_blocking_blitzing=0.5 + ((defense.blitzing - offense.blocking) / 2),
+        norm_kicking=fg_skill
+    )
+    return pd.DataFrame(
         {
-            "norm_diff_fg_skill": [],
-            "yard_line": [],
-            "fg_made": []
+            "norm_diff_fg_skill": 0.5 + ((fg_skill - fg_def_skill) / 2),
+            "yard_line": yard_line,
+            "fg_made": results.field_goal_made.astype(int),
+            "fg_blocked": results.field_goal_blocked.astype(int)
         }
     )
-    model = FieldGoalResultModel()
-    for i in range(10):
-        fg_skill = 1-(i * (1/10))
-        offense = OffensiveSkill(
-            field_goals=fg_skill
-        )
-        for j in range(10):
-            fg_def_skill = 1-(j * (1/10))
-            defense = DefensiveSkill(
-                field_goal_defense=fg_def_skill
-            )
-            for k in range(10):
-                yard_line = k * 10
-                context = PlayContext(
-                    yard_line=yard_line
-                )
-                for l in range(10):
-                    result = model.sim(
-                        offense=offense,
-                        defense=defense,
-                        context=context
-                    )
-                    result_df = pd.DataFrame(
-                        {
-                            "norm_diff_fg_skill": [0.5 + ((fg_skill - fg_def_skill) / 2)],
-                            "yard_line": [yard_line],
-                            "fg_made": [int(result.field_goal_made)],
-                            "fg_blocked": [int(result.field_goal_blocked)]
-                        }
-                    )
-                    df = pd.concat([df, result_df])
-    return df
 
 df = generate_fg_result_data()
 grouped_yardline = df.groupby("yard_line")
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from data.dataset import load_nfl_pbp_dataset
 from data.pbp import load_clean_nfl_pbp_fieldgoal_data
 from keras.models import Sequential, save_model
 from keras.layers import Dense
@@ -9,7 +10,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 
 # Load data
-df = pd.read_csv("./data/fgs.csv")
+df = load_nfl_pbp_dataset('fieldgoal')
 
 # Prepare the dataset features
 x = df.drop(
@@ -0,0 +1,9 @@
+import sys
+from data.game import build_game_index
+
+# Index every season unless specific seasons are named, e.g.
+# python game_index_data.py 2022 2023
+if len(sys.argv) > 1:
+    build_game_index([int(year) for year in sys.argv[1:]])
+else:
+    build_game_index()
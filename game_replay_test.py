@@ -0,0 +1,14 @@
+import sys
+import time
+from replay.replay import GameReplay, score_replay
+
+# Replay every game of a season, e.g. python game_replay_test.py 2023
+season = int(sys.argv[1]) if len(sys.argv) > 1 else 2023
+print(f"Replaying the {season} season")
+replay = GameReplay()
+start = time.time()
+replayed = replay.replay_season(season, seed=337)
+print(f"Replayed {len(replayed)} plays in {time.time() - start:.1f}s")
+
+# Score the simulated play calls and results against the actual plays
+print(score_replay(replayed))
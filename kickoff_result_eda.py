@@ -1,9 +1,10 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
 from sklearn.linear_model import LinearRegression
 
-df = pd.read_csv('./data/kickoffs.csv')
+df = load_nfl_pbp_dataset('kickoff')
 
 ###
 # Kickoff model flow
@@ -1,11 +1,23 @@
+import sys
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
+from data.sample import estimate_binned_statistics, sample_nfl_pbp_dataset
 import matplotlib.pyplot as plt
 from scipy.stats import skewnorm
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 
-df = pd.read_csv("./data/passing.csv")
+# Load passing data, or a stratified sample of it for a quick look, e.g.
+# python pass_result_eda.py 0.05
+fraction = float(sys.argv[1]) if len(sys.argv) > 1 else None
+if fraction is None:
+    df = load_nfl_pbp_dataset('pass')
+else:
+    df = sample_nfl_pbp_dataset('pass', fraction)
+    print(f"Sampled {len(df)} plays, estimated error of the binned statistics:")
+    print(estimate_binned_statistics(df, 'yards_gained', pd.cut(df['norm_diff_passing'], bins=5)))
+    print()
 
 ###
 # Flow
@@ -0,0 +1,35 @@
+import os
+import sys
+from data.dataset import NFL_PBP_DATASET_FILES, DatasetWriter
+from data.pbp import NFL_PBP_DATASETS, build_clean_nfl_pbp_data
+from data.stream import stream_clean_nfl_pbp_data
+from data.validate import validate_nfl_pbp_dataset
+
+# Guard the entry point, since the worker processes may re-import this script
+if __name__ == '__main__':
+    # Build every dataset unless specific datasets are named, e.g.
+    # python pbp_data.py run pass
+    # With --stream, each dataset is built and appended one season at a time
+    # With --drop-invalid, rows failing validation are dropped rather than
+    # failing the build
+    stream = '--stream' in sys.argv[1:]
+    drop_invalid = '--drop-invalid' in sys.argv[1:]
+    datasets = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    datasets = datasets if len(datasets) > 0 else NFL_PBP_DATASETS
+    if stream:
+        chunks = stream_clean_nfl_pbp_data(datasets=datasets)
+    else:
+        chunks = build_clean_nfl_pbp_data(datasets=datasets, workers=os.cpu_count())
+
+    # Validate and write each dataset to Parquet, one chunk at a time when
+    # streaming
+    writers = {}
+    for name, df in chunks:
+        df = validate_nfl_pbp_dataset(name, df, drop=drop_invalid)
+        if name not in writers:
+            path, index = NFL_PBP_DATASET_FILES[name]
+            writers[name] = DatasetWriter(path, index=index)
+        writers[name].write(df)
+    for name, writer in writers.items():
+        content_hash = writer.close()
+        print(f"Wrote {name} data to {writer.path} ({content_hash[:12]})")
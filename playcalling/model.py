@@ -78,6 +78,109 @@ class PlayCallingModel:
             return self.clock_management_playcall(context)
         return self.normal_play_call(context, coach.run_pass)
 
+    def sim_batch(
+            self,
+            contexts: pd.DataFrame,
+            run_pass: np.ndarray,
+            risk_taking: np.ndarray,
+            rng: np.random.Generator=None
+        ) -> np.ndarray:
+        """
+        Generates the play calls of a batch of play contexts with the same
+        rules as sim.  Each rule is evaluated for every context at once as a
+        mask, and each random decision is drawn for every context at once.
+
+        Args:
+            contexts (pd.DataFrame): One row per play context, with the
+                quarter, half_seconds, down, distance, yard_line, score_diff
+                and off_timeouts of each, as in PlayContext
+            run_pass (np.ndarray): The run-pass playcall tendency of each
+                context's coach
+            risk_taking (np.ndarray): The risk-taking tendency of each
+                context's coach
+            rng (np.random.Generator): The random generator, a fresh one if None
+
+        Returns:
+            np.ndarray: The PlayCall value of each context, e.g. PlayCall(codes[0])
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        columns = {
+            column: np.asarray(contexts[column], dtype=np.float64)
+            for column in ['quarter', 'half_seconds', 'down', 'distance', 'yard_line', 'score_diff', 'off_timeouts']
+        }
+        n = len(columns['down'])
+        run_pass = np.broadcast_to(np.asarray(run_pass, dtype=np.float64), n)
+        risk_taking = np.broadcast_to(np.asarray(risk_taking, dtype=np.float64), n)
+        down = columns['down']
+        yard_line = columns['yard_line']
+        draws = rng.random((3, n))
+        playcalls = np.full(n, PlayCall.PASS.value, dtype=np.int64)
+
+        # Route every context to the rule that calls its play
+        fourth_down = down == 4
+        clock_management = ~fourth_down & self.is_clock_management_situation_batch(columns)
+        last_play = (fourth_down & self.is_must_score_scenario_batch(columns)) | \
+            (clock_management & (columns['half_seconds'] < 5))
+        fourth_down &= ~last_play
+        clock_management &= ~last_play
+        normal = ~(fourth_down | clock_management | last_play)
+
+        # Last plays are passes unless a field goal is enough and called
+        last_play_need_td = (columns['score_diff'] <= -4) & \
+            ((columns['score_diff'] > -8) | (draws[0] < 0.2))
+        field_goal = last_play & ~last_play_need_td & (draws[1] < self.p_field_goal_yardline_batch(yard_line))
+        playcalls[field_goal] = PlayCall.FIELD_GOAL.value
+
+        # Clock management runs are rarer without timeouts
+        p_run = np.where(
+            columns['off_timeouts'] > 0,
+            self.p_run_clock_management,
+            self.p_run_clock_management_no_timeouts
+        )
+        playcalls[clock_management & (draws[0] < p_run)] = PlayCall.RUN.value
+
+        # Normal play calls by down and distance, where down 0 takes the 4th
+        # down regression as in normal_play_call
+        p_run_call = np.select(
+            [down == 1, down == 2, down == 3],
+            [
+                self.p_run_first_down_intr + (self.p_run_first_down_coef * run_pass),
+                self.p_run_second_down_intr + (self.p_run_second_down_coef * run_pass),
+                self.p_run_third_down_intr + (self.p_run_third_down_coef * run_pass)
+            ],
+            self.p_run_fourth_down_intr + (self.p_run_fourth_down_coef * run_pass)
+        )
+        p_run = ((self.p_run_dist_intr + (self.p_run_dist_coef * columns['distance'])) * 0.3) + (p_run_call * 0.7)
+        playcalls[normal & (draws[0] < p_run)] = PlayCall.RUN.value
+
+        # On 4th down, punt unless in field goal range or a go-for-it scenario
+        in_field_goal_range = yard_line >= 50
+        is_go_for_it_scenario = self.is_go_for_it_scenario_batch(columns)
+        p_go_for_it = self.p_go_for_it_intr + (self.p_go_for_it_coef * risk_taking)
+        p_field_goal = (0.4 * (self.p_field_goal_risk_intr + (self.p_field_goal_risk_coef * risk_taking))) + \
+            (0.6 * (self.p_field_goal_yard_line_intr + \
+                (self.p_field_goal_yard_line_coef_1 * yard_line) + \
+                (self.p_field_goal_yard_line_coef_2 * pow(yard_line, 2))))
+        go_for_it_scenario = fourth_down & is_go_for_it_scenario
+        field_goal = go_for_it_scenario & in_field_goal_range & (draws[0] < p_field_goal)
+
+        # Going for it takes the next draw after each decision before it
+        go_for_it_draws = np.where(in_field_goal_range & (yard_line < 80), draws[2], draws[1])
+        go_for_it = go_for_it_scenario & ~field_goal & np.where(
+            in_field_goal_range,
+            (yard_line >= 80) | (draws[1] < p_go_for_it),
+            draws[0] < p_go_for_it
+        )
+        playcalls[fourth_down] = PlayCall.PUNT.value
+        playcalls[field_goal] = PlayCall.FIELD_GOAL.value
+
+        # Go for it play calls, where the distance regression takes the yard
+        # line as in fourth_down_go_for_it_playcall
+        p_run_call = self.p_run_fourth_down_intr + (self.p_run_fourth_down_coef * run_pass)
+        p_run = ((self.p_run_dist_intr + (self.p_run_dist_coef * yard_line)) * 0.3) + (p_run_call * 0.7)
+        playcalls[go_for_it] = np.where(go_for_it_draws < p_run, PlayCall.RUN.value, PlayCall.PASS.value)[go_for_it]
+        return playcalls
+
     def is_clock_management_situation(self, context: PlayContext) -> bool:
         """
         Determines whether the current context is a clock management situation
@@ -91,6 +194,20 @@ class PlayCallingModel:
         return (context.quarter >= 4) and (context.half_seconds <= 180) \
             and (context.score_diff < 0) and (context.score_diff >= -17)
 
+    def is_clock_management_situation_batch(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Determines whether each of a batch of contexts is a clock management
+        situation
+
+        Args:
+            columns (dict[str, np.ndarray]): The play context columns
+        
+        Returns:
+            np.ndarray: Whether each context is a clock management situation
+        """
+        return (columns['quarter'] >= 4) & (columns['half_seconds'] <= 180) \
+            & (columns['score_diff'] < 0) & (columns['score_diff'] >= -17)
+
     def last_play_need_td(self, context: PlayContext) -> bool:
         """
         Determines whether the offense needs a touchdown in a clock management
@@ -137,6 +254,24 @@ class PlayCallingModel:
             0
         )
 
+    def p_field_goal_yardline_batch(self, yard_line: np.ndarray) -> np.ndarray:
+        """
+        Generates the probability a field goal is called by yard line for a
+        batch of yard lines
+
+        Args:
+            yard_line (np.ndarray): The current yard lines
+        
+        Returns:
+            np.ndarray: Probability a field goal is called at each yard line
+        """
+        return np.maximum(
+            self.p_field_goal_yard_line_intr + \
+                (self.p_field_goal_yard_line_coef_1 * yard_line) + \
+                (self.p_field_goal_yard_line_coef_2 * pow(yard_line, 2)),
+            0
+        )
+
     def last_play_playcall(self, context: PlayContext) -> PlayCall:
         """
         Generates the playcall for the last play of the game
@@ -233,6 +368,28 @@ class PlayCallingModel:
             return True
         return False
 
+    def is_must_score_scenario_batch(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Generates whether each of a batch of contexts is a must-score scenario
+        on 4th down
+
+        Args:
+            columns (dict[str, np.ndarray]): The play context columns
+        
+        Returns:
+            np.ndarray: Whether each context is a must score scenario
+        """
+        scores_needed = np.abs(np.round(columns['score_diff'] / 8))
+        timeout_drive_time = (42 * (3 - columns['off_timeouts'])) + 8
+        non_timeout_drive_time = (42 * 3) + 8
+        non_timeout_drives_remaining = np.ceil(
+            (columns['half_seconds'] - timeout_drive_time) / non_timeout_drive_time
+        )
+        return (columns['score_diff'] < 0) & (
+            (columns['half_seconds'] <= timeout_drive_time) | \
+            ((1 + non_timeout_drives_remaining) <= scores_needed)
+        )
+
     def is_go_for_it_scenario(self, context: PlayContext) -> bool:
         """
         Determines whether this is a go-for-it on 4th scenario
@@ -246,6 +403,20 @@ class PlayCallingModel:
         return (context.yard_line >= 40 and context.yard_line <= 60 and context.distance <=4) or \
             (context.yard_line >= 80 and context.distance <= 4)
 
+    def is_go_for_it_scenario_batch(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Determines whether each of a batch of contexts is a go-for-it on 4th
+        scenario
+
+        Args:
+            columns (dict[str, np.ndarray]): The play context columns
+        
+        Returns:
+            np.ndarray: Whether each context is a go-for-it scenario
+        """
+        yard_line = columns['yard_line']
+        return (((yard_line >= 40) & (yard_line <= 60)) | (yard_line >= 80)) & (columns['distance'] <= 4)
+
     def fourth_down_go_for_it_playcall(self, run_pass: float, yard_line: int) -> PlayCall:
         """
         Generates the play call on fourth down if going for it
@@ -1,11 +1,12 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
 from data.pbp import load_clean_nfl_pbp_playcall_data
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 
-df = pd.read_csv('./data/playcall.csv')
+df = load_nfl_pbp_dataset('playcall')
 df["norm_run_percent_group"] = pd.cut(df["norm_run_percent"], bins=4)
 df["norm_go_for_it_percent_group"] = pd.cut(df["norm_go_for_it_percent"], bins=4)
 df["is_run_play"] = 0
@@ -1,16 +1,44 @@
+import time
+import numpy as np
+import pandas as pd
 from data.pbp import load_clean_nfl_pbp_playcall_data
 from playcalling.model import PlayCallingModel
-from sklearn.model_selection import train_test_split
+from playcalling.playcall import PlayCall
+from sklearn.metrics import classification_report, confusion_matrix
 
-# Load the NFL data and split into training and test data
+# Load the NFL data, keeping the plays the playcalling model calls
 print("Loading NFL play-by-play data")
 df = load_clean_nfl_pbp_playcall_data()
-train, test = train_test_split(df, random_state=337)
+df = df[df["play_type"].isin(["run", "pass", "field_goal", "punt"])]
 
-# Load the playcalling model
-print("Loading the playcalling model")
-model = PlayCallingModel(from_file=True)
+# Convert every historical situation into a play context column
+contexts = pd.DataFrame(
+    {
+        "quarter": df["qtr"].to_numpy(),
+        "half_seconds": df["half_seconds_remaining"].to_numpy(),
+        "down": df["down"].to_numpy(),
+        "distance": df["ydstogo"].to_numpy(),
+        "yard_line": 100 - df["yardline_100"].to_numpy(),
+        "score_diff": df["score_diff"].fillna(0).to_numpy(),
+        "off_timeouts": df["posteam_timeouts_remaining"].to_numpy()
+    }
+)
 
-# Test the playcalling model
+# Call every historical situation at once with each coach's tendencies
 print("Testing the playcalling model")
-model.test(test)
+model = PlayCallingModel()
+start = time.time()
+playcalls = model.sim_batch(
+    contexts,
+    run_pass=df["norm_run_percent"].fillna(0.5).to_numpy(),
+    risk_taking=df["norm_go_for_it_percent"].fillna(0.5).to_numpy(),
+    rng=np.random.default_rng(337)
+)
+print(f"Called {len(playcalls)} plays in {time.time() - start:.3f}s")
+
+# Score the simulated play calls against the actual ones
+actual = df["play_type"].str.upper().to_numpy()
+simulated = np.array([playcall.name for playcall in PlayCall])[playcalls]
+labels = [PlayCall.RUN.name, PlayCall.PASS.name, PlayCall.FIELD_GOAL.name, PlayCall.PUNT.name]
+print(classification_report(actual, simulated, labels=labels, zero_division=0))
+print(confusion_matrix(actual, simulated, labels=labels))
@@ -2,10 +2,11 @@ import numpy as np
 import os
 import random
 from context.context import PlayContext
-from playresult.fieldgoal.result import FieldGoalResult
+from playresult.fieldgoal.result import FieldGoalResult, FieldGoalResultBatch
 from scipy.stats import skewnorm
 from team.offense import OffensiveSkill
 from team.defense import DefensiveSkill
+from typing import Union
 
 WORKDIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -92,6 +93,66 @@ class FieldGoalResultModel:
             play_duration=play_duration
         )
 
+    def sim_batch(
+            self,
+            yard_line: np.ndarray,
+            norm_diff_blocking_blitzing: np.ndarray,
+            norm_kicking: np.ndarray,
+            is_extra_point: np.ndarray=False,
+            rng: np.random.Generator=None
+        ) -> FieldGoalResultBatch:
+        """
+        Simulates a batch of field goal plays with the same outcomes as sim.
+        Blocks, makes and durations are each drawn for every play at once,
+        the durations in a single skewed normal draw whose parameters depend
+        on whether each kick was blocked.
+
+        Args:
+            yard_line (np.ndarray): The yard line (0-100) of each kick, where
+                > 50 is in the opponent's territory
+            norm_diff_blocking_blitzing (np.ndarray): The blitzing skill diff
+                of each kick, 0.5 + (defense blitzing - offense blocking) / 2
+            norm_kicking (np.ndarray): The field goal kicking skill of each kick
+            is_extra_point (np.ndarray): Whether each kick is an extra point,
+                which takes no time off the clock
+            rng (np.random.Generator): The random generator, a fresh one if None
+
+        Returns:
+            FieldGoalResultBatch: The results of the kicks
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        yard_line, norm_diff_blocking_blitzing, norm_kicking, is_extra_point = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(yard_line, dtype=np.float64)),
+            np.atleast_1d(np.asarray(norm_diff_blocking_blitzing, dtype=np.float64)),
+            np.atleast_1d(np.asarray(norm_kicking, dtype=np.float64)),
+            np.atleast_1d(np.asarray(is_extra_point, dtype=bool))
+        )
+        n = len(yard_line)
+        yard_line = 100 - yard_line
+
+        # Is the field goal blocked, otherwise is it made?
+        blocked = rng.random(n) < self.p_field_goal_blocked(norm_diff_blocking_blitzing, yard_line)
+        made = ~blocked & (rng.random(n) < self.p_field_goal_made(norm_kicking))
+        return_yards = np.where(blocked, rng.exponential(scale=1, size=n).astype(np.int64), 0)
+
+        # Draw the duration of every kick from the blocked or not blocked
+        # distribution, extra points taking no time
+        skew, mean, std = self.field_goal_duration_params(blocked)
+        play_duration = np.round(skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=n,
+            random_state=rng
+        )).astype(np.int64)
+        return FieldGoalResultBatch(
+            field_goal_made=made,
+            field_goal_blocked=blocked,
+            field_goal_block_return_yards=return_yards,
+            field_goal_distance=(yard_line + 10).astype(np.int64),
+            play_duration=np.where(is_extra_point, 0, play_duration)
+        )
+
     def is_field_goal_blocked(self, norm_diff_blocking_blitzing: float, yard_line: int) -> bool:
         """
         Generates whether a field goal is blocked
@@ -103,12 +164,29 @@ class FieldGoalResultModel:
         Returns:
             bool: Whether the field goal was blocked
         """
+        return random.random() < self.p_field_goal_blocked(norm_diff_blocking_blitzing, yard_line)
+
+    def p_field_goal_blocked(
+            self,
+            norm_diff_blocking_blitzing: Union[float, np.ndarray],
+            yard_line: Union[float, np.ndarray]
+        ) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a field goal is blocked
+
+        Args:
+            norm_diff_blocking_blitzing (Union[float, np.ndarray]): Blocking & blitzing
+                skill differential of one or more kicks
+            yard_line (Union[float, np.ndarray]): The current yard line of each kick
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a block on each kick
+        """
         p_blocked_skill = self.p_blocked_skill_intr + (self.p_blocked_skill_coef * norm_diff_blocking_blitzing)
         p_blocked_yardline = np.exp(
             self.p_blocked_yard_line_intr + (self.p_blocked_yard_line_coef * yard_line)
         )
-        p_blocked = ((p_blocked_skill * 0.7) + (p_blocked_yardline * 0.3)) * 0.7
-        return random.random() < p_blocked
+        return ((p_blocked_skill * 0.7) + (p_blocked_yardline * 0.3)) * 0.7
 
     def field_goal_block_return_yards(self) -> int:
         """
@@ -129,12 +207,24 @@ class FieldGoalResultModel:
         Returns:
             bool: Whether the field goal was made
         """
+        return random.random() < self.p_field_goal_made(norm_kicking)
+
+    def p_field_goal_made(self, norm_kicking: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a field goal is made
+
+        Args:
+            norm_kicking (Union[float, np.ndarray]): Kicking skill level of one or more
+                kicks
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a make on each kick
+        """
         p_made_skill = self.field_goal_made_skill_intr + (self.field_goal_made_skill_coef * norm_kicking)
         p_made_yardline = self.field_goal_made_yard_line_intr + \
             (self.field_goal_made_yard_line_coef_1 * norm_kicking) + \
             (self.field_goal_made_yard_line_coef_2 * pow(norm_kicking, 2))
-        p_made = ((p_made_skill * 0.4) + (p_made_yardline * 0.6)) * 1.18
-        return random.random() < p_made
+        return ((p_made_skill * 0.4) + (p_made_yardline * 0.6)) * 1.18
 
     def field_goal_duration(self, is_blocked: bool) -> int:
         """
@@ -146,19 +236,28 @@ class FieldGoalResultModel:
         Returns:
             int: The duration of the play
         """
-        if is_blocked:
-            return int(round(
-                skewnorm.rvs(
-                    a=self.field_goal_blocked_duration_skew,
-                    loc=self.field_goal_blocked_duration_mean,
-                    scale=self.field_goal_blocked_duration_std
-                )
-            ))
-        else:
-            return int(round(
-                skewnorm.rvs(
-                    a=self.field_goal_not_blocked_duration_skew,
-                    loc=self.field_goal_not_blocked_duration_mean,
-                    scale=self.field_goal_not_blocked_duration_std
-                )
-            ))
+        skew, mean, std = self.field_goal_duration_params(is_blocked)
+        return int(round(
+            skewnorm.rvs(
+                a=skew,
+                loc=mean,
+                scale=std
+            )
+        ))
+
+    def field_goal_duration_params(self, is_blocked: Union[bool, np.ndarray]) -> tuple:
+        """
+        Generates the skewed normal distribution of the field goal play
+        duration, from the blocked or not blocked regression
+
+        Args:
+            is_blocked (Union[bool, np.ndarray]): Whether each field goal was
+                blocked
+        
+        Returns:
+            tuple: The skew, mean and std duration of each play
+        """
+        skew = np.where(is_blocked, self.field_goal_blocked_duration_skew, self.field_goal_not_blocked_duration_skew)
+        mean = np.where(is_blocked, self.field_goal_blocked_duration_mean, self.field_goal_not_blocked_duration_mean)
+        std = np.where(is_blocked, self.field_goal_blocked_duration_std, self.field_goal_not_blocked_duration_std)
+        return skew, mean, std
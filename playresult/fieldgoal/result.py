@@ -117,3 +117,66 @@ class FieldGoalResult:
         else:
             res += " MISSED."
         return res
+
+class FieldGoalResultBatch:
+    """
+    The results of a batch of field goal plays, stored as one array per field
+    rather than one FieldGoalResult per play
+    """
+    def __init__(
+            self,
+            field_goal_made: np.ndarray,
+            field_goal_blocked: np.ndarray,
+            field_goal_block_return_yards: np.ndarray,
+            field_goal_distance: np.ndarray,
+            play_duration: np.ndarray
+        ) -> "FieldGoalResultBatch":
+        """
+        Constructor for the FieldGoalResultBatch class
+
+        Args:
+            field_goal_made (np.ndarray): Whether each field goal was made
+            field_goal_blocked (np.ndarray): Whether each field goal was blocked
+            field_goal_block_return_yards (np.ndarray): The return yards of
+                each blocked field goal
+            field_goal_distance (np.ndarray): The distance of each field goal
+            play_duration (np.ndarray): The duration of each play in seconds
+
+        Returns:
+            FieldGoalResultBatch: The instantiated FieldGoalResultBatch
+        """
+        self.field_goal_made = field_goal_made
+        self.field_goal_blocked = field_goal_blocked
+        self.field_goal_block_return_yards = field_goal_block_return_yards
+        self.field_goal_distance = field_goal_distance
+        self.play_duration = play_duration
+
+    def __len__(self) -> int:
+        """
+        Gets the number of plays in the batch
+
+        Returns:
+            int: The number of plays
+        """
+        return len(self.field_goal_made)
+
+    def result(
+            self,
+            index: int
+        ) -> FieldGoalResult:
+        """
+        Gets the result of a single play of the batch
+
+        Args:
+            index (int): The position of the play in the batch
+
+        Returns:
+            FieldGoalResult: The result of the play
+        """
+        return FieldGoalResult(
+            field_goal_made=bool(self.field_goal_made[index]),
+            field_goal_blocked=bool(self.field_goal_blocked[index]),
+            field_goal_block_return_yards=int(self.field_goal_block_return_yards[index]),
+            field_goal_distance=int(self.field_goal_distance[index]),
+            play_duration=int(self.play_duration[index])
+        )
@@ -1,10 +1,11 @@
 import random
 import numpy as np
 from context.context import PlayContext
-from playresult.kickoff.result import KickoffResult
+from playresult.kickoff.result import KickoffResult, KickoffResultBatch
 from team.offense import OffensiveSkill
 from team.defense import DefensiveSkill
 from scipy.stats import skewnorm
+from typing import Union
 
 class KickoffResultModel:
     def __init__(self):
@@ -126,6 +127,96 @@ class KickoffResultModel:
             touchdown=(35 + kickoff_yards - return_yards) <= 0
         )
 
+    def sim_batch(
+            self,
+            norm_kicking: np.ndarray,
+            norm_diff_returning: np.ndarray,
+            rng: np.random.Generator=None
+        ) -> KickoffResultBatch:
+        """
+        Simulates a batch of kickoff plays with the same branches as sim,
+        each resolved for every play at once with boolean masks.  Unlike sim,
+        the return yards of fumbled returns are kept in fumble_return_yards.
+
+        Args:
+            norm_kicking (np.ndarray): The kicking skill of each kickoff
+            norm_diff_returning (np.ndarray): The returning skill diff of each
+                kickoff, 0.5 + (defense returning - offense return defense) / 2
+            rng (np.random.Generator): The random generator, a fresh one if None
+
+        Returns:
+            KickoffResultBatch: The results of the kickoffs
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        norm_kicking, norm_diff_returning = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(norm_kicking, dtype=np.float64)),
+            np.atleast_1d(np.asarray(norm_diff_returning, dtype=np.float64))
+        )
+        n = len(norm_kicking)
+        zeros = np.zeros(n, dtype=np.int64)
+
+        # Is the kickoff a touchback, otherwise out of bounds or fair caught?
+        touchback = rng.random(n) < self.p_touchback(norm_kicking)
+        kicked = ~touchback
+        out_of_bounds = kicked & (rng.random(n) < self.p_out_of_bounds(norm_kicking))
+        inside_20 = rng.random(n) < self.p_kickoff_inside_20
+        fair_catch = kicked & ~out_of_bounds & (rng.random(n) < self.p_fair_catch(norm_diff_returning))
+        returned = kicked & ~out_of_bounds & ~fair_catch
+
+        # Generate the distance of the kickoffs which are not touchbacks from
+        # the inside or outside 20 distribution
+        kicking = norm_kicking[kicked]
+        inside_20 = inside_20[kicked]
+        skew, mean, std = self.kickoff_distance_params(kicking, inside_20)
+        kickoff_yards = np.full(n, 65, dtype=np.int64)
+        kickoff_yards[kicked] = np.round(skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=len(kicking),
+            random_state=rng
+        )).astype(np.int64)
+
+        # Generate the return yards of the returned kickoffs
+        returning = norm_diff_returning[returned]
+        skew, mean, std = self.kick_return_yards_params(returning)
+        kick_return_yards = zeros.copy()
+        kick_return_yards[returned] = np.round(skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=len(returning),
+            random_state=rng
+        )).astype(np.int64)
+
+        # Is there a fumble on the return?
+        fumble = returned & (rng.random(n) < self.p_kickoff_return_fumble)
+        fumble_return_yards = np.where(fumble, rng.exponential(scale=1, size=n).astype(np.int64), 0)
+
+        # Derive the touchdowns and the durations of the returns
+        touchdown = np.where(
+            fumble,
+            (35 + kickoff_yards - kick_return_yards + fumble_return_yards) >= 100,
+            returned & ((35 + kickoff_yards - kick_return_yards) <= 0)
+        )
+        duration_yards = kick_return_yards + fumble_return_yards
+        play_duration = np.where(
+            returned,
+            np.sqrt(np.abs(rng.normal(self.mean_kick_return_duration(duration_yards), 2))).astype(np.int64),
+            0
+        )
+        return KickoffResultBatch(
+            kickoff_yards=kickoff_yards,
+            kick_return_yards=kick_return_yards,
+            play_duration=play_duration,
+            fumble_return_yards=fumble_return_yards,
+            touchback=touchback,
+            out_of_bounds=out_of_bounds,
+            fair_catch=fair_catch,
+            fumble=fumble,
+            touchdown=touchdown
+        )
+
     def is_touchback(self, norm_kicking: float) -> bool:
         """
         Generates whether a touchback occurred
@@ -136,8 +227,20 @@ class KickoffResultModel:
         Returns:
             bool: Whether a touchback occurred
         """
-        p_touchback = self.p_touchback_intr + (self.p_touchback_coef * norm_kicking)
-        return random.random() < p_touchback
+        return random.random() < self.p_touchback(norm_kicking)
+
+    def p_touchback(self, norm_kicking: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability of a touchback
+
+        Args:
+            norm_kicking (Union[float, np.ndarray]): Kicking skill level of one or more
+                kickoffs
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a touchback on each kickoff
+        """
+        return self.p_touchback_intr + (self.p_touchback_coef * norm_kicking)
 
     def is_out_of_bounds(self, norm_kicking: float) -> bool:
         """
@@ -149,8 +252,20 @@ class KickoffResultModel:
         Returns:
             bool: Whether the kickoff went out of bounds
         """
-        p_oob = self.p_out_of_bounds_intr + (self.p_out_of_bounds_coef * norm_kicking)
-        return random.random() < p_oob
+        return random.random() < self.p_out_of_bounds(norm_kicking)
+
+    def p_out_of_bounds(self, norm_kicking: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the kickoff goes out of bounds
+
+        Args:
+            norm_kicking (Union[float, np.ndarray]): Kicking skill level of one or more
+                kickoffs
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of going out of bounds on each kickoff
+        """
+        return self.p_out_of_bounds_intr + (self.p_out_of_bounds_coef * norm_kicking)
 
     def is_kickoff_inside_20(self, norm_kicking: float) -> bool:
         """
@@ -175,48 +290,89 @@ class KickoffResultModel:
         Returns:
             bool: The kickoff distance
         """
-        if inside_20:
-            return int(round(skewnorm.rvs(
-                a=self.skew_kickoff_inside_20_dist,
-                loc=self.mean_kickoff_inside_20_dist,
-                scale=self.std_kickoff_inside_20_dist_intr + (
-                    self.std_kickoff_inside_20_dist_coef * norm_kicking
-                )
-            )))
-        else:
-            return int(round(skewnorm.rvs(
-                a=self.skew_kickoff_outside_20_dist,
-                loc=self.mean_kickoff_outside_20_dist_intr + (
-                    self.mean_kickoff_outside_20_dist_coef * norm_kicking
-                ),
-                scale=self.std_kickoff_outside_20_dist_intr + (
-                    self.std_kickoff_outside_20_dist_coef * norm_kicking
-                )
-            )))
+        skew, mean, std = self.kickoff_distance_params(norm_kicking, inside_20)
+        return int(round(skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std
+        )))
+
+    def kickoff_distance_params(
+            self,
+            norm_kicking: Union[float, np.ndarray],
+            inside_20: Union[bool, np.ndarray]
+        ) -> tuple:
+        """
+        Generates the skewed normal distribution of the kickoff distance,
+        from the inside or outside 20 regressions
+
+        Args:
+            norm_kicking (Union[float, np.ndarray]): Kicking skill level of each kickoff
+            inside_20 (Union[bool, np.ndarray]): Whether each kickoff landed
+                inside the 20
+        
+        Returns:
+            tuple: The skew, mean and std distance of each kickoff
+        """
+        skew = np.where(inside_20, self.skew_kickoff_inside_20_dist, self.skew_kickoff_outside_20_dist)
+        mean = np.where(
+            inside_20,
+            self.mean_kickoff_inside_20_dist,
+            self.mean_kickoff_outside_20_dist_intr + (self.mean_kickoff_outside_20_dist_coef * norm_kicking)
+        )
+        std = np.where(
+            inside_20,
+            self.std_kickoff_inside_20_dist_intr + (self.std_kickoff_inside_20_dist_coef * norm_kicking),
+            self.std_kickoff_outside_20_dist_intr + (self.std_kickoff_outside_20_dist_coef * norm_kicking)
+        )
+        return skew, mean, std
 
     def is_fair_catch(self, norm_diff_returning: float) -> bool:
         """
         Generates whether the kickoff resulted in a fair catch
         """
-        p_fair_catch = self.p_fair_catch_intr + (self.p_fair_catch_coef * norm_diff_returning)
-        return random.random() < p_fair_catch
+        return random.random() < self.p_fair_catch(norm_diff_returning)
+
+    def p_fair_catch(self, norm_diff_returning: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the kickoff is fair caught
+
+        Args:
+            norm_diff_returning (Union[float, np.ndarray]): Kick returning skill
+                differential of one or more kickoffs
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a fair catch on each kickoff
+        """
+        return self.p_fair_catch_intr + (self.p_fair_catch_coef * norm_diff_returning)
 
     def kick_return_yards(self, norm_diff_returning: float) -> bool:
         """
         Generates the yards gained or lost on the kick return
         """
+        skew, mean, std = self.kick_return_yards_params(norm_diff_returning)
         return int(round(skewnorm.rvs(
-            a=self.skew_kickoff_return_yards_intr + (
-                self.skew_kickoff_return_yards_coef * norm_diff_returning
-            ),
-            loc=self.mean_kickoff_return_yards_intr + (
-                self.mean_kickoff_return_yards_coef * norm_diff_returning
-            ),
-            scale=self.std_kickoff_return_yards_intr + (
-                self.std_kickoff_return_yards_coef * norm_diff_returning
-            )
+            a=skew,
+            loc=mean,
+            scale=std
         )))
 
+    def kick_return_yards_params(self, norm_diff_returning: Union[float, np.ndarray]) -> tuple:
+        """
+        Generates the skewed normal distribution of the kick return yards
+
+        Args:
+            norm_diff_returning (Union[float, np.ndarray]): Kick returning skill
+                differential of one or more kickoffs
+        
+        Returns:
+            tuple: The skew, mean and std return yards of each kickoff
+        """
+        skew = self.skew_kickoff_return_yards_intr + (self.skew_kickoff_return_yards_coef * norm_diff_returning)
+        mean = self.mean_kickoff_return_yards_intr + (self.mean_kickoff_return_yards_coef * norm_diff_returning)
+        std = self.std_kickoff_return_yards_intr + (self.std_kickoff_return_yards_coef * norm_diff_returning)
+        return skew, mean, std
+
     def is_kick_return_fumble(self) -> bool:
         """
         Generates whether a fumble occurred on the kick return
@@ -249,10 +405,21 @@ class KickoffResultModel:
             np.sqrt(
                 np.abs(
                     np.random.normal(
-                        loc=self.kickoff_return_play_duration_intr + \
-                        (self.kickoff_return_play_duration_coef * yards_gained),
+                        loc=self.mean_kick_return_duration(yards_gained),
                         scale=2
                     )
                 )
             )
         )
+
+    def mean_kick_return_duration(self, yards_gained: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the mean duration of the kickoff return
+
+        Args:
+            yards_gained (Union[float, np.ndarray]): Yards gained on one or more returns
+        
+        Returns:
+            Union[float, np.ndarray]: The mean duration of each return
+        """
+        return self.kickoff_return_play_duration_intr + (self.kickoff_return_play_duration_coef * yards_gained)
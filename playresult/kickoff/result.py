@@ -1,4 +1,5 @@
 import copy
+import numpy as np
 from context.context import GameContext
 
 class KickoffResult:
@@ -152,3 +153,81 @@ class KickoffResult:
         if self.touchdown:
             res += f" TOUCHDOWN!"
         return res
+
+class KickoffResultBatch:
+    """
+    The results of a batch of kickoff plays, stored as one array per field
+    rather than one KickoffResult per play
+    """
+    def __init__(
+            self,
+            kickoff_yards: np.ndarray,
+            kick_return_yards: np.ndarray,
+            play_duration: np.ndarray,
+            fumble_return_yards: np.ndarray,
+            touchback: np.ndarray,
+            out_of_bounds: np.ndarray,
+            fair_catch: np.ndarray,
+            fumble: np.ndarray,
+            touchdown: np.ndarray
+        ) -> "KickoffResultBatch":
+        """
+        Constructor for the KickoffResultBatch class
+
+        Args:
+            kickoff_yards (np.ndarray): The distance of each kickoff in yards
+            kick_return_yards (np.ndarray): The return yards of each kickoff
+            play_duration (np.ndarray): The duration of each play in seconds
+            fumble_return_yards (np.ndarray): The return yards of each fumble
+            touchback (np.ndarray): Whether each kickoff was a touchback
+            out_of_bounds (np.ndarray): Whether each kickoff went out of bounds
+            fair_catch (np.ndarray): Whether a fair catch was called
+            fumble (np.ndarray): Whether each return was fumbled
+            touchdown (np.ndarray): Whether each play was a touchdown
+
+        Returns:
+            KickoffResultBatch: The instantiated KickoffResultBatch
+        """
+        self.kickoff_yards = kickoff_yards
+        self.kick_return_yards = kick_return_yards
+        self.play_duration = play_duration
+        self.fumble_return_yards = fumble_return_yards
+        self.touchback = touchback
+        self.out_of_bounds = out_of_bounds
+        self.fair_catch = fair_catch
+        self.fumble = fumble
+        self.touchdown = touchdown
+
+    def __len__(self) -> int:
+        """
+        Gets the number of plays in the batch
+
+        Returns:
+            int: The number of plays
+        """
+        return len(self.kickoff_yards)
+
+    def result(
+            self,
+            index: int
+        ) -> KickoffResult:
+        """
+        Gets the result of a single play of the batch
+
+        Args:
+            index (int): The position of the play in the batch
+
+        Returns:
+            KickoffResult: The result of the play
+        """
+        return KickoffResult(
+            kickoff_yards=int(self.kickoff_yards[index]),
+            kick_return_yards=int(self.kick_return_yards[index]),
+            play_duration=int(self.play_duration[index]),
+            fumble_return_yards=int(self.fumble_return_yards[index]),
+            touchback=bool(self.touchback[index]),
+            out_of_bounds=bool(self.out_of_bounds[index]),
+            fair_catch=bool(self.fair_catch[index]),
+            fumble=bool(self.fumble[index]),
+            touchdown=bool(self.touchdown[index])
+        )
@@ -3,7 +3,7 @@ import numpy as np
 from context.context import PlayContext
 from playresult.rushing.model import RushResultModel
 from playresult.rushing.result import RushResult
-from playresult.passing.result import PassResult
+from playresult.passing.result import PassResult, PassResultBatch
 from scipy.stats import skewnorm
 from team.offense import OffensiveSkill
 from team.defense import DefensiveSkill
@@ -209,6 +209,146 @@ class PassResultModel:
             play_duration=self.play_duration(pass_dist)
         )
 
+    def sim_batch(
+            self,
+            yard_line: np.ndarray,
+            norm_diff_blocking_blitzing: np.ndarray,
+            norm_diff_turnovers: np.ndarray,
+            norm_diff_passing: np.ndarray,
+            norm_diff_receiving: np.ndarray,
+            scrambling: np.ndarray,
+            norm_diff_scrambling: np.ndarray,
+            rng: np.random.Generator=None
+        ) -> PassResultBatch:
+        """
+        Simulates a batch of passing plays through the same decision tree as
+        sim.  Each step of the tree is resolved for every play at once with
+        boolean masks, and QB scrambles are simulated together through
+        RushResultModel.sim_batch.
+
+        Args:
+            yard_line (np.ndarray): The yard line (0-100) of each play
+            norm_diff_blocking_blitzing (np.ndarray): The blocking / blitzing
+                skill diff of each play
+            norm_diff_turnovers (np.ndarray): The turnover skill diff of each
+                play
+            norm_diff_passing (np.ndarray): The passing skill diff of each play
+            norm_diff_receiving (np.ndarray): The receiving skill diff of each
+                play
+            scrambling (np.ndarray): The QB scrambling skill of each play
+            norm_diff_scrambling (np.ndarray): The scrambling / rush defense
+                skill diff of each play, 0.5 + (scrambling - rush defense) / 2
+            rng (np.random.Generator): The random generator, a fresh one if None
+
+        Returns:
+            PassResultBatch: The results of the plays
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        arrays = np.broadcast_arrays(*[
+            np.atleast_1d(np.asarray(values, dtype=np.float64))
+            for values in [
+                yard_line,
+                norm_diff_blocking_blitzing,
+                norm_diff_turnovers,
+                norm_diff_passing,
+                norm_diff_receiving,
+                scrambling,
+                norm_diff_scrambling
+            ]
+        ])
+        yard_line, norm_diff_blocking_blitzing, norm_diff_turnovers, norm_diff_passing, \
+            norm_diff_receiving, scrambling, norm_diff_scrambling = arrays
+        n = len(yard_line)
+        zeros = np.zeros(n, dtype=np.int64)
+
+        # 1-3. Pressure, then a sack or a scramble under pressure
+        pressure = rng.random(n) < self.p_pressure(norm_diff_blocking_blitzing)
+        sack = pressure & (rng.random(n) < self.p_sack(norm_diff_blocking_blitzing))
+        scramble = pressure & ~sack & (rng.random(n) < self.p_scramble(scrambling))
+        passed = ~sack & ~scramble
+
+        # 5. Pass distance, short passes losing at most 2 yards
+        short_pass_dist = rng.normal(*self.short_pass_distance_params(yard_line)).astype(np.int64)
+        deep_pass_dist = rng.normal(*self.deep_pass_distance_params(yard_line)).astype(np.int64)
+        pass_dist = np.where(
+            rng.random(n) < self.p_short_pass(yard_line),
+            np.maximum(short_pass_dist, -2),
+            deep_pass_dist
+        )
+        pass_dist = np.where(passed, pass_dist, 0)
+
+        # 6-8. Interception, otherwise completion
+        interception = passed & (rng.random(n) < self.p_interception(norm_diff_turnovers))
+        complete = passed & ~interception & (rng.random(n) < self.p_complete(norm_diff_passing))
+
+        # 7. Interception return yards, drawing the skewed normal only for
+        # the interceptions since it is the costliest draw
+        return_yards = zeros.copy()
+        skew, mean, std = self.interception_return_yards_params(yard_line[interception])
+        return_yards[interception] = skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=interception.sum(),
+            random_state=rng
+        ).astype(np.int64)
+
+        # 9. Yards after catch of the completions not held to zero
+        zero_yac = rng.random(n) < self.p_zero_yac(norm_diff_receiving)
+        gains_yac = complete & ~zero_yac
+        yac = zeros.copy()
+        skew, mean, std = self.yards_after_catch_params(norm_diff_receiving[gains_yac])
+        yac[gains_yac] = skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=gains_yac.sum(),
+            random_state=rng
+        ).astype(np.int64)
+
+        # 10-11. Fumbles after the catch and their return yards
+        fumble = complete & (rng.random(n) < self.p_fumble)
+        return_yards = np.where(fumble, rng.exponential(scale=1, size=n).astype(np.int64), return_yards)
+
+        # Derive the yards gained and the play durations, sacks losing 3 yards
+        sack_yards_lost = np.where(sack, 3, 0)
+        yards_gained = np.where(complete, pass_dist + yac, 0) - return_yards
+        yards_gained = np.where(interception, pass_dist - return_yards, yards_gained) - sack_yards_lost
+        duration_yards = np.where(sack, sack_yards_lost, pass_dist + yac + return_yards)
+        play_duration = np.abs(rng.normal(self.mean_play_duration(duration_yards), 2).astype(np.int64))
+        touchdown = np.zeros(n, dtype=bool)
+
+        # 4. Simulate the scrambles as rushes
+        if scramble.any():
+            rush = RushResultModel().sim_batch(
+                yard_line[scramble],
+                norm_diff_scrambling[scramble],
+                norm_diff_turnovers[scramble],
+                scramble=True,
+                rng=rng
+            )
+            yards_gained[scramble] = rush.yards_gained
+            play_duration[scramble] = rush.play_duration
+            fumble[scramble] = rush.fumble
+            return_yards[scramble] = rush.return_yards
+            touchdown[scramble] = rush.touchdown
+
+        return PassResultBatch(
+            pressure=pressure,
+            sack=sack,
+            sack_yards_lost=sack_yards_lost,
+            scramble=scramble,
+            pass_dist=pass_dist,
+            interception=interception,
+            return_yards=return_yards,
+            complete=complete,
+            yac=yac,
+            fumble=fumble,
+            touchdown=touchdown,
+            yards_gained=yards_gained,
+            play_duration=play_duration
+        )
+
     # 1. Is QB pressured?
     def is_pressure(self, norm_diff_blocking_blitzing: float) -> bool:
         """
@@ -222,8 +362,20 @@ class PassResultModel:
         Returns:
             bool: Whether the quarterback was pressured on the play
         """
-        p_pressure = self.p_pressure_intr + (self.p_pressure_coef * norm_diff_blocking_blitzing)
-        return random.random() < p_pressure
+        return random.random() < self.p_pressure(norm_diff_blocking_blitzing)
+
+    def p_pressure(self, norm_diff_blocking_blitzing: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the QB comes under pressure
+
+        Args:
+            norm_diff_blocking_blitzing (Union[float, np.ndarray]): Blocking / blitzing
+                skill diff of one or more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of pressure on each play
+        """
+        return self.p_pressure_intr + (self.p_pressure_coef * norm_diff_blocking_blitzing)
 
     # 2. If pressured, is QB sacked?
     def is_sack(self, norm_diff_blocking_blitzing: float) -> bool:
@@ -238,8 +390,20 @@ class PassResultModel:
         Returns:
             bool: Whether the quarterback was sacked on the play
         """
-        p_sack = self.p_sack_intr + (self.p_sack_coef * norm_diff_blocking_blitzing)
-        return random.random() < p_sack
+        return random.random() < self.p_sack(norm_diff_blocking_blitzing)
+
+    def p_sack(self, norm_diff_blocking_blitzing: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a pressured QB is sacked
+
+        Args:
+            norm_diff_blocking_blitzing (Union[float, np.ndarray]): Blocking / blitzing
+                skill diff of one or more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a sack on each play
+        """
+        return self.p_sack_intr + (self.p_sack_coef * norm_diff_blocking_blitzing)
     
     # 3. If not sacked, does QB scramble?
     def is_scramble(self, norm_scrambling: float) -> bool:
@@ -253,8 +417,20 @@ class PassResultModel:
         Returns:
             bool: Whether the quarterback scrambled on the play
         """
-        p_scramble = self.p_scramble_intr + (self.p_scramble_coef * norm_scrambling)
-        return random.random() < p_scramble
+        return random.random() < self.p_scramble(norm_scrambling)
+
+    def p_scramble(self, norm_scrambling: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a pressured QB scrambles
+
+        Args:
+            norm_scrambling (Union[float, np.ndarray]): QB scrambling skill of one or
+                more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a scramble on each play
+        """
+        return self.p_scramble_intr + (self.p_scramble_coef * norm_scrambling)
     
     # 4. If scramble, rush result
     def scramble_result(
@@ -303,10 +479,21 @@ class PassResultModel:
         Returns:
             bool: Whether this was a short pass
         """
-        p_short_pass = self.p_short_pass_intr + \
+        return random.random() < self.p_short_pass(yard_line)
+
+    def p_short_pass(self, yard_line: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the pass is short
+
+        Args:
+            yard_line (Union[float, np.ndarray]): The yard line of one or more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a short pass on each play
+        """
+        return self.p_short_pass_intr + \
             (self.p_short_pass_coef_1 * yard_line) + \
             (self.p_short_pass_coef_2 * pow(yard_line, 2))
-        return random.random() < p_short_pass
 
     def short_pass_distance(self, yard_line: int) -> int:
         """
@@ -318,59 +505,77 @@ class PassResultModel:
         Returns:
             int: The distance of the pass in yards
         """
-        # Generate the mean pass distance
+        # Sample the normal dist to generate the past distance
+        mean_pass_dist, std_pass_dist = self.short_pass_distance_params(yard_line)
+        pass_dist = int(
+            np.random.normal(
+                loc=mean_pass_dist,
+                scale=std_pass_dist
+            )
+        )
+        if pass_dist < -2:
+            pass_dist = -2
+        return pass_dist
+
+    def short_pass_distance_params(self, yard_line: Union[float, np.ndarray]) -> tuple:
+        """
+        Generates the normal distribution of the short pass distance
+
+        Args:
+            yard_line (Union[float, np.ndarray]): The yard line of one or more plays
+        
+        Returns:
+            tuple: The mean and std pass distance of each play
+        """
         mean_pass_dist = self.mean_short_pass_dist_intr + \
             (self.mean_short_pass_dist_coef_1 * yard_line) + \
             (self.mean_short_pass_dist_coef_2 * pow(yard_line, 2)) + \
             (self.mean_short_pass_dist_coef_3 * pow(yard_line, 3))
-
-        # Generate the std pass distance
         std_pass_dist = self.std_short_pass_dist_intr + \
             (self.std_short_pass_dist_coef_1 * yard_line) + \
             (self.std_short_pass_dist_coef_2 * pow(yard_line, 2)) + \
             (self.std_short_pass_dist_coef_3 * pow(yard_line, 3))
+        return mean_pass_dist, std_pass_dist
 
+    def deep_pass_distance(self, yard_line: int) -> int:
+        """
+        Generates the distance of the QB's pass for a deep pass
+
+        Args:
+            yard_line (int): The current yard line
+        
+        Returns:
+            int: The distance of the pass in yards
+        """
         # Sample the normal dist to generate the past distance
+        mean_pass_dist, std_pass_dist = self.deep_pass_distance_params(yard_line)
         pass_dist = int(
             np.random.normal(
                 loc=mean_pass_dist,
                 scale=std_pass_dist
             )
         )
-        if pass_dist < -2:
-            pass_dist = -2
         return pass_dist
 
-    def deep_pass_distance(self, yard_line: int) -> int:
+    def deep_pass_distance_params(self, yard_line: Union[float, np.ndarray]) -> tuple:
         """
-        Generates the distance of the QB's pass for a deep pass
+        Generates the normal distribution of the deep pass distance
 
         Args:
-            yard_line (int): The current yard line
+            yard_line (Union[float, np.ndarray]): The yard line of one or more plays
         
         Returns:
-            int: The distance of the pass in yards
+            tuple: The mean and std pass distance of each play
         """
-        # Generate the mean pass distance
         mean_pass_dist = self.mean_deep_pass_dist_intr + \
             (self.mean_deep_pass_dist_coef_1 * yard_line) + \
             (self.mean_deep_pass_dist_coef_2 * pow(yard_line, 2)) + \
             (self.mean_deep_pass_dist_coef_3 * pow(yard_line, 3))
-
-        # Generate the std pass distance
         std_pass_dist = self.std_deep_pass_dist_intr + \
             (self.std_deep_pass_dist_coef_1 * yard_line) + \
             (self.std_deep_pass_dist_coef_2 * pow(yard_line, 2)) + \
             (self.std_deep_pass_dist_coef_3 * pow(yard_line, 3))
-
-        # Sample the normal dist to generate the past distance
-        pass_dist = int(
-            np.random.normal(
-                loc=mean_pass_dist,
-                scale=np.abs(std_pass_dist)
-            )
-        )
-        return pass_dist
+        return mean_pass_dist, np.abs(std_pass_dist)
 
     # 6. Interception?
     def is_interception(self, norm_diff_turnovers: float) -> bool:
@@ -383,8 +588,20 @@ class PassResultModel:
         Returns:
             bool: Whether an interception occurred
         """
-        p_interception = self.p_interception_intr + (self.p_interception_coef * norm_diff_turnovers)
-        return random.random() < p_interception
+        return random.random() < self.p_interception(norm_diff_turnovers)
+
+    def p_interception(self, norm_diff_turnovers: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a pass is intercepted
+
+        Args:
+            norm_diff_turnovers (Union[float, np.ndarray]): Turnover skill differential of
+                one or more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of an interception on each play
+        """
+        return self.p_interception_intr + (self.p_interception_coef * norm_diff_turnovers)
 
     # 7. If interception, return yards
     def interception_return_yards(self, yard_line: int) -> int:
@@ -397,31 +614,40 @@ class PassResultModel:
         Returns:
             int: The return yards following the interception
         """
-        # Generate the mean interception return yards
+        # Sample the skewed normal distribution to generate INT return yards
+        skew_int_return_yards, mean_int_return_yards, std_int_return_yards = \
+            self.interception_return_yards_params(yard_line)
+        return_yards = int(skewnorm.rvs(
+            a=skew_int_return_yards,
+            loc=mean_int_return_yards,
+            scale=std_int_return_yards
+        ))
+        return return_yards
+
+    def interception_return_yards_params(self, yard_line: Union[float, np.ndarray]) -> tuple:
+        """
+        Generates the skewed normal distribution of the interception return
+        yards
+
+        Args:
+            yard_line (Union[float, np.ndarray]): The yard line of one or more plays
+        
+        Returns:
+            tuple: The skew, mean and std return yards of each play
+        """
         mean_int_return_yards = self.mean_int_return_yards_intr + \
             (self.mean_int_return_yards_coef_1 * yard_line) + \
             (self.mean_int_return_yards_coef_2 * pow(yard_line, 2)) + \
             (self.mean_int_return_yards_coef_3 * pow(yard_line, 3))
-
-        # Generate the std interception return yards
         std_int_return_yards = self.std_int_return_yards_intr + \
             (self.std_int_return_yards_coef_1 * yard_line) + \
             (self.std_int_return_yards_coef_2 * pow(yard_line, 2)) + \
             (self.std_int_return_yards_coef_3 * pow(yard_line, 3))
-
-        # Generate the skew interception return yards
         skew_int_return_yards = self.skew_int_return_yards_intr + \
             (self.skew_int_return_yards_coef_1 * yard_line) + \
             (self.skew_int_return_yards_coef_2 * pow(yard_line, 2)) + \
             (self.skew_int_return_yards_coef_3 * pow(yard_line, 3))
-
-        # Sample the skewed normal distribution to generate INT return yards
-        return_yards = int(skewnorm.rvs(
-            a=skew_int_return_yards,
-            loc=mean_int_return_yards,
-            scale=std_int_return_yards
-        ))
-        return return_yards
+        return skew_int_return_yards, mean_int_return_yards, std_int_return_yards
     
     # 8. Complete?
     def complete_pass(self, norm_diff_passing: float) -> bool:
@@ -434,8 +660,20 @@ class PassResultModel:
         Returns:
             bool: Whether the pass was complete
         """
-        p_complete = self.p_complete_intr + (self.p_complete_coef * norm_diff_passing)
-        return random.random() < p_complete
+        return random.random() < self.p_complete(norm_diff_passing)
+
+    def p_complete(self, norm_diff_passing: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a pass is complete
+
+        Args:
+            norm_diff_passing (Union[float, np.ndarray]): Passing skill differential of
+                one or more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a completion on each play
+        """
+        return self.p_complete_intr + (self.p_complete_coef * norm_diff_passing)
 
     def zero_yards_after_catch(self, norm_diff_receiving: float) -> bool:
         """
@@ -447,8 +685,20 @@ class PassResultModel:
         Returns:
             int: Whether the receiver was held to 0 YAC
         """
-        p_zero_yac = self.p_zero_yac_intr + (self.p_zero_yac_coef * norm_diff_receiving)
-        return random.random() < p_zero_yac
+        return random.random() < self.p_zero_yac(norm_diff_receiving)
+
+    def p_zero_yac(self, norm_diff_receiving: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the receiver is held to 0 YAC
+
+        Args:
+            norm_diff_receiving (Union[float, np.ndarray]): Receiving skill differential of
+                one or more plays
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of 0 YAC on each play
+        """
+        return self.p_zero_yac_intr + (self.p_zero_yac_coef * norm_diff_receiving)
 
     # 9. Yards after catch
     def yards_after_catch(self, norm_diff_receiving: float) -> int:
@@ -461,26 +711,34 @@ class PassResultModel:
         Returns:
             int: Yards after the catch
         """
-        # Generate the mean YAC
+        # Sample the skewed normal distribution to generate the YAC
+        skew_yac, mean_yac, std_yac = self.yards_after_catch_params(norm_diff_receiving)
+        yac = int(skewnorm.rvs(
+            a=skew_yac,
+            loc=mean_yac,
+            scale=std_yac
+        ))
+        return yac
+
+    def yards_after_catch_params(self, norm_diff_receiving: Union[float, np.ndarray]) -> tuple:
+        """
+        Generates the skewed normal distribution of the yards after the catch
+
+        Args:
+            norm_diff_receiving (Union[float, np.ndarray]): Receiving skill differential of
+                one or more plays
+        
+        Returns:
+            tuple: The skew, mean and std YAC of each play
+        """
         mean_yac = self.mean_yac_intr + \
             (self.mean_yac_coef_1 * norm_diff_receiving) + \
             (self.mean_yac_coef_2 * pow(norm_diff_receiving, 2))
-
-        # Generate the std YAC
         std_yac = self.std_yac_intr + \
             (self.std_yac_coef_1 * norm_diff_receiving) + \
             (self.std_yac_coef_2 * pow(norm_diff_receiving, 2))
-
-        # Generate the skew YAC
         skew_yac = self.skew_yac_intr + (self.skew_yac_coef * norm_diff_receiving)
-
-        # GSample the skewed normal distribution to generate the YAC
-        yac = int(skewnorm.rvs(
-            a=skew_yac,
-            loc=mean_yac,
-            scale=std_yac
-        ))
-        return yac
+        return skew_yac, mean_yac, std_yac
 
     # 10. Fumble?
     def is_fumble(self) -> bool:
@@ -511,7 +769,19 @@ class PassResultModel:
         Returns:
             float: The mean duration of the play in seconds
         """
-        mean_play_duration = self.mean_play_duration_intr + \
+        return abs(int(np.random.normal(loc=self.mean_play_duration(yards), scale=2)))
+
+    def mean_play_duration(self, yards: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the mean duration of the play in seconds
+
+        Args:
+            yards (Union[float, np.ndarray]): The yards of one or more plays, as in
+                play_duration
+        
+        Returns:
+            Union[float, np.ndarray]: The mean duration of each play in seconds
+        """
+        return self.mean_play_duration_intr + \
             (self.mean_play_duration_coef_1 * yards) + \
             (self.mean_play_duration_coef_2 * pow(yards, 2))
-        return abs(int(np.random.normal(loc=mean_play_duration, scale=2)))
@@ -1,5 +1,8 @@
 import copy
+import numpy as np
 from context.context import GameContext
+from playresult.rushing.result import RushResult
+from typing import Union
 
 class PassResult:
     def __init__(
@@ -93,3 +96,113 @@ class PassResult:
             return res
         res += f" incomplete."
         return res.lstrip()
+
+class PassResultBatch:
+    """
+    The results of a batch of passing plays, stored as one array per field
+    rather than one PassResult per play.  QB scrambles are stored in the same
+    arrays, with the yards, duration, fumble, return yards and touchdown of
+    their rush.
+    """
+    def __init__(
+            self,
+            pressure: np.ndarray,
+            sack: np.ndarray,
+            sack_yards_lost: np.ndarray,
+            scramble: np.ndarray,
+            pass_dist: np.ndarray,
+            interception: np.ndarray,
+            return_yards: np.ndarray,
+            complete: np.ndarray,
+            yac: np.ndarray,
+            fumble: np.ndarray,
+            touchdown: np.ndarray,
+            yards_gained: np.ndarray,
+            play_duration: np.ndarray
+        ) -> "PassResultBatch":
+        """
+        Constructor for the PassResultBatch class
+
+        Args:
+            pressure (np.ndarray): Whether the QB was pressured on each play
+            sack (np.ndarray): Whether the QB was sacked on each play
+            sack_yards_lost (np.ndarray): The yards lost on each sack
+            scramble (np.ndarray): Whether the QB scrambled on each play
+            pass_dist (np.ndarray): The distance of each pass in yards
+            interception (np.ndarray): Whether each pass was intercepted
+            return_yards (np.ndarray): The interception or fumble return
+                yards of each play
+            complete (np.ndarray): Whether each pass was complete
+            yac (np.ndarray): The yards after the catch of each pass
+            fumble (np.ndarray): Whether each play was a lost fumble
+            touchdown (np.ndarray): Whether each play was a touchdown
+            yards_gained (np.ndarray): The yards gained on each play
+            play_duration (np.ndarray): The duration of each play in seconds
+
+        Returns:
+            PassResultBatch: The instantiated PassResultBatch
+        """
+        self.pressure = pressure
+        self.sack = sack
+        self.sack_yards_lost = sack_yards_lost
+        self.scramble = scramble
+        self.pass_dist = pass_dist
+        self.interception = interception
+        self.return_yards = return_yards
+        self.complete = complete
+        self.yac = yac
+        self.fumble = fumble
+        self.touchdown = touchdown
+        self.yards_gained = yards_gained
+        self.play_duration = play_duration
+
+    def __len__(self) -> int:
+        """
+        Gets the number of plays in the batch
+
+        Returns:
+            int: The number of plays
+        """
+        return len(self.yards_gained)
+
+    def result(
+            self,
+            index: int
+        ) -> Union[PassResult, RushResult]:
+        """
+        Gets the result of a single play of the batch
+
+        Args:
+            index (int): The position of the play in the batch
+
+        Returns:
+            PassResult | RushResult: The result of the play, a RushResult
+                for a QB scramble
+        """
+        if self.scramble[index]:
+            return RushResult(
+                yards_gained=int(self.yards_gained[index]),
+                play_duration=int(self.play_duration[index]),
+                fumble=bool(self.fumble[index]),
+                return_yards=int(self.return_yards[index]),
+                touchdown=bool(self.touchdown[index]),
+                scramble=True
+            )
+        if self.sack[index]:
+            return PassResult(
+                pressure=bool(self.pressure[index]),
+                sack=True,
+                sack_yards_lost=int(self.sack_yards_lost[index]),
+                play_duration=int(self.play_duration[index])
+            )
+        return PassResult(
+            pressure=bool(self.pressure[index]),
+            pass_dist=int(self.pass_dist[index]),
+            interception=bool(self.interception[index]),
+            return_yards=int(self.return_yards[index]),
+            complete=bool(self.complete[index]),
+            yac=int(self.yac[index]),
+            fumble=bool(self.fumble[index]),
+            touchdown=bool(self.touchdown[index]),
+            play_duration=int(self.play_duration[index])
+        )
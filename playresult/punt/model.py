@@ -1,10 +1,11 @@
 import random
 import numpy as np
 from context.context import PlayContext
-from playresult.punt.result import PuntResult
+from playresult.punt.result import PuntResult, PuntResultBatch
 from scipy.stats import skewnorm
 from team.offense import OffensiveSkill
 from team.defense import DefensiveSkill
+from typing import Union
 
 class PuntResultModel:
     def __init__(self):
@@ -194,6 +195,120 @@ class PuntResultModel:
             touchdown=(context.yard_line + punt_distance - punt_return_yards) <= 0
         )
 
+    def sim_batch(
+            self,
+            yard_line: np.ndarray,
+            norm_diff_blocking_blitzing: np.ndarray,
+            norm_punting: np.ndarray,
+            norm_diff_returning: np.ndarray,
+            rng: np.random.Generator=None
+        ) -> PuntResultBatch:
+        """
+        Simulates a batch of punt plays with the same branches as sim, each
+        resolved for every play at once with boolean masks
+
+        Args:
+            yard_line (np.ndarray): The yard line (0-100) of each punt
+            norm_diff_blocking_blitzing (np.ndarray): The blitzing skill diff
+                of each punt, 0.5 + (defense blitzing - offense blocking) / 2
+            norm_punting (np.ndarray): The punting skill of each punt
+            norm_diff_returning (np.ndarray): The returning skill diff of each
+                punt, 0.5 + (defense returning - offense return defense) / 2
+            rng (np.random.Generator): The random generator, a fresh one if None
+
+        Returns:
+            PuntResultBatch: The results of the punts
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        yard_line, norm_diff_blocking_blitzing, norm_punting, norm_diff_returning = np.broadcast_arrays(*[
+            np.atleast_1d(np.asarray(values, dtype=np.float64))
+            for values in [yard_line, norm_diff_blocking_blitzing, norm_punting, norm_diff_returning]
+        ])
+        n = len(yard_line)
+        zeros = np.zeros(n, dtype=np.int64)
+
+        # Is the punt blocked?
+        blocked = rng.random(n) < self.p_blocked(norm_diff_blocking_blitzing)
+        kicked = ~blocked
+
+        # Generate the relative punt distance of the kicked punts from the
+        # inside or outside 20 distribution
+        current_yard_line = 100 - yard_line
+        inside_20 = (rng.random(n) < self.p_punt_inside_20(current_yard_line, norm_punting))[kicked]
+        kick_yard_line = current_yard_line[kicked]
+        skew, mean, std = self.relative_punt_distance_params(inside_20, kick_yard_line)
+        relative_punt_distance = skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=len(kick_yard_line),
+            random_state=rng
+        )
+        new_yard_line = zeros.copy()
+        new_yard_line[kicked] = np.round(kick_yard_line * relative_punt_distance).astype(np.int64)
+        punt_yards = np.where(kicked, current_yard_line.astype(np.int64) - new_yard_line, 0)
+
+        # Is the punt out of bounds, otherwise is it fair caught or muffed?
+        out_of_bounds = kicked & (rng.random(n) < self.p_punt_out_of_bounds(current_yard_line))
+        fielded = kicked & ~out_of_bounds
+        fair_catch = fielded & (rng.random(n) < self.p_fair_catch(new_yard_line))
+        muffed = fielded & (rng.random(n) < self.p_muffed_punt(norm_diff_returning))
+        returned = fielded & ~fair_catch & ~muffed
+
+        # Generate the return yards relative to the punt landing
+        returning = norm_diff_returning[returned]
+        skew, mean, std = self.relative_return_distance_params(returning)
+        relative_return_distance = skewnorm.rvs(
+            a=skew,
+            loc=mean,
+            scale=std,
+            size=len(returning),
+            random_state=rng
+        )
+        punt_return_yards = zeros.copy()
+        punt_return_yards[returned] = np.round((100 - new_yard_line[returned]) * relative_return_distance).astype(np.int64)
+
+        # Is there a fumble on the return?  Blocks, muffs and fumbles are
+        # all returned by the recovering team
+        fumble = returned & (rng.random(n) < self.p_fumble(norm_diff_returning))
+        fumble_return_yards = np.where(
+            blocked | muffed | fumble,
+            rng.exponential(scale=1, size=n).astype(np.int64),
+            0
+        )
+
+        # Derive the touchdowns and the play durations
+        touchdown = np.select(
+            [
+                blocked,
+                muffed,
+                fumble,
+                returned
+            ],
+            [
+                (yard_line - fumble_return_yards) <= 0,
+                (yard_line + punt_yards + fumble_return_yards) >= 100,
+                (yard_line + punt_yards) >= 100,
+                (yard_line + punt_yards - punt_return_yards) <= 0
+            ],
+            default=False
+        )
+        duration_yards = punt_yards + punt_return_yards + fumble_return_yards
+        play_duration = rng.normal(self.mean_duration(duration_yards), 2).astype(np.int64)
+        return PuntResultBatch(
+            punt_yards=punt_yards,
+            punt_return_yards=punt_return_yards,
+            play_duration=play_duration,
+            blocked=blocked,
+            fumble_return_yards=fumble_return_yards,
+            touchback=np.zeros(n, dtype=bool),
+            out_of_bounds=out_of_bounds,
+            fair_catch=fair_catch,
+            muffed=muffed,
+            fumble=fumble | blocked,
+            touchdown=touchdown
+        )
+
     def is_blocked(self, norm_diff_blocking_blitzing: float) -> bool:
         """
         Generates whether the punt is blocked
@@ -204,8 +319,20 @@ class PuntResultModel:
         Returns:
             bool: Whether the punt was blocked
         """
-        p_blocked = self.p_block_intr + (self.p_block_coef * norm_diff_blocking_blitzing)
-        return random.random() < p_blocked
+        return random.random() < self.p_blocked(norm_diff_blocking_blitzing)
+
+    def p_blocked(self, norm_diff_blocking_blitzing: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the punt is blocked
+
+        Args:
+            norm_diff_blocking_blitzing (Union[float, np.ndarray]): Blitzing skill
+                differential of one or more punts
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a block on each punt
+        """
+        return self.p_block_intr + (self.p_block_coef * norm_diff_blocking_blitzing)
 
     def is_punt_inside_20(self, yard_line: int, norm_punting: float) -> bool:
         """
@@ -218,6 +345,20 @@ class PuntResultModel:
         Returns:
             bool: Whether the punt landed inside the 20
         """
+        return random.random() < self.p_punt_inside_20(yard_line, norm_punting)
+
+    def p_punt_inside_20(self, yard_line: Union[float, np.ndarray], norm_punting: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the punt lands inside the 20
+
+        Args:
+            yard_line (Union[float, np.ndarray]): The current yard line of one or more
+                punts
+            norm_punting (Union[float, np.ndarray]): How good the punter is at punting
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of landing inside the 20 on each punt
+        """
         p_inside_20_skill = self.p_punt_inside_20_skill_intr + (self.p_punt_inside_20_skill_coef * norm_punting)
         p_inside_20_yardline = self.p_punt_inside_20_yardage_param_1 / ((
                 1 + np.exp(
@@ -226,8 +367,7 @@ class PuntResultModel:
                     )
                 )
             ) + self.p_punt_inside_20_yardage_param_4)
-        p_inside_20 = ((p_inside_20_skill * 0.4) + (p_inside_20_yardline * 0.6)) * 1.18
-        return random.random() < p_inside_20
+        return ((p_inside_20_skill * 0.4) + (p_inside_20_yardline * 0.6)) * 1.18
 
     def relative_punt_distance(self, is_inside_20: bool, yard_line: int) -> float:
         """
@@ -240,27 +380,56 @@ class PuntResultModel:
         Returns:
             float: The relative distance
         """
-        if is_inside_20:
-            return float(skewnorm.rvs(
-                a=self.punt_inside_20_skew_rel_dist_intr + \
-                    (self.punt_inside_20_skew_rel_dist_coef_1 * yard_line) + \
-                    (self.punt_inside_20_skew_rel_dist_coef_2 * pow(yard_line, 2)),
-                loc=self.punt_inside_20_mean_rel_dist_intr + \
-                    (self.punt_inside_20_mean_rel_dist_coef * yard_line),
-                scale=self.punt_inside_20_std_rel_dist_intr + \
-                    (self.punt_inside_20_std_rel_dist_coef * yard_line)
-            ))
+        skew, mean, std = self.relative_punt_distance_params(is_inside_20, yard_line)
         return float(skewnorm.rvs(
-            a=self.punt_outside_20_skew_rel_dist_intr + \
+            a=skew,
+            loc=mean,
+            scale=std
+        ))
+
+    def relative_punt_distance_params(
+            self,
+            is_inside_20: Union[bool, np.ndarray],
+            yard_line: Union[float, np.ndarray]
+        ) -> tuple:
+        """
+        Generates the skewed normal distribution of the relative punt
+        distance, from the inside or outside 20 regressions
+
+        Args:
+            is_inside_20 (Union[bool, np.ndarray]): Whether each punt will
+                land inside the 20
+            yard_line (Union[float, np.ndarray]): The current yard line of each punt
+        
+        Returns:
+            tuple: The skew, mean and std relative distance of each punt
+        """
+        skew = np.where(
+            is_inside_20,
+            self.punt_inside_20_skew_rel_dist_intr + \
+                (self.punt_inside_20_skew_rel_dist_coef_1 * yard_line) + \
+                (self.punt_inside_20_skew_rel_dist_coef_2 * pow(yard_line, 2)),
+            self.punt_outside_20_skew_rel_dist_intr + \
                 (self.punt_outside_20_skew_rel_dist_coef_1 * yard_line) + \
-                (self.punt_outside_20_skew_rel_dist_coef_2 * pow(yard_line, 2)),
-            loc=self.punt_outside_20_mean_rel_dist_intr + \
+                (self.punt_outside_20_skew_rel_dist_coef_2 * pow(yard_line, 2))
+        )
+        mean = np.where(
+            is_inside_20,
+            self.punt_inside_20_mean_rel_dist_intr + \
+                (self.punt_inside_20_mean_rel_dist_coef * yard_line),
+            self.punt_outside_20_mean_rel_dist_intr + \
                 (self.punt_outside_20_mean_rel_dist_coef_1 * yard_line) + \
                 (self.punt_outside_20_mean_rel_dist_coef_2 * pow(yard_line, 2)) + \
-                (self.punt_outside_20_mean_rel_dist_coef_3 * pow(yard_line, 3)),
-            scale=self.punt_outside_20_std_rel_dist_intr + \
+                (self.punt_outside_20_mean_rel_dist_coef_3 * pow(yard_line, 3))
+        )
+        std = np.where(
+            is_inside_20,
+            self.punt_inside_20_std_rel_dist_intr + \
+                (self.punt_inside_20_std_rel_dist_coef * yard_line),
+            self.punt_outside_20_std_rel_dist_intr + \
                 (self.punt_outside_20_std_rel_dist_coef * yard_line)
-        ))
+        )
+        return skew, mean, std
 
     def is_punt_out_of_bounds(self, yard_line: int) -> bool:
         """
@@ -272,9 +441,21 @@ class PuntResultModel:
         Returns:
             bool: Whether the punt went out of bounds
         """
-        p_punt_oob = self.p_punt_oob_intr + (self.p_punt_oob_coef_1 * yard_line) + \
+        return random.random() < self.p_punt_out_of_bounds(yard_line)
+
+    def p_punt_out_of_bounds(self, yard_line: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the punt goes out of bounds
+
+        Args:
+            yard_line (Union[float, np.ndarray]): The current yard line of one or more
+                punts
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of going out of bounds on each punt
+        """
+        return self.p_punt_oob_intr + (self.p_punt_oob_coef_1 * yard_line) + \
             (self.p_punt_oob_coef_2 * pow(yard_line, 2))
-        return random.random() < p_punt_oob
 
     def is_fair_catch(self, punt_landing: int) -> bool:
         """
@@ -286,8 +467,19 @@ class PuntResultModel:
         Returns:
             bool: Whether a fair catch was called
         """
-        p_fair_catch = self.p_fair_catch_intr + (self.p_fair_catch_coef * punt_landing)
-        return random.random() < p_fair_catch
+        return random.random() < self.p_fair_catch(punt_landing)
+
+    def p_fair_catch(self, punt_landing: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability a fair catch is called
+
+        Args:
+            punt_landing (Union[float, np.ndarray]): Where one or more punts landed
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a fair catch on each punt
+        """
+        return self.p_fair_catch_intr + (self.p_fair_catch_coef * punt_landing)
 
     def is_muffed_punt(self, norm_diff_returning: float) -> bool:
         """
@@ -299,8 +491,20 @@ class PuntResultModel:
         Returns:
             bool: Whether the punt was muffed
         """
-        p_muffed_punt = self.p_muffed_punt_intr + (self.p_muffed_punt_coef * norm_diff_returning)
-        return random.random() < p_muffed_punt
+        return random.random() < self.p_muffed_punt(norm_diff_returning)
+
+    def p_muffed_punt(self, norm_diff_returning: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability the punt is muffed
+
+        Args:
+            norm_diff_returning (Union[float, np.ndarray]): Punt returning skill
+                differential of one or more punts
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a muff on each punt
+        """
+        return self.p_muffed_punt_intr + (self.p_muffed_punt_coef * norm_diff_returning)
 
     def relative_return_distance(self, norm_diff_returning: float) -> float:
         """
@@ -312,18 +516,37 @@ class PuntResultModel:
         Returns:
             float: Return distance relative to punt landing
         """
+        skew, mean, std = self.relative_return_distance_params(norm_diff_returning)
         return float(skewnorm.rvs(
-            a=self.skew_rel_return_yards_intr + \
-                (self.skew_rel_return_yards_coef_1 * norm_diff_returning) + \
-                (self.skew_rel_return_yards_coef_2 * pow(norm_diff_returning, 2)),
-            loc=self.mean_rel_return_yards_intr + \
-                (self.mean_rel_return_yards_coef_1 * norm_diff_returning) + \
-                (self.mean_rel_return_yards_coef_2 * pow(norm_diff_returning, 2)),
-            scale=self.std_rel_return_yards_intr + \
-                (self.std_rel_return_yards_coef_1 * norm_diff_returning) + \
-                (self.std_rel_return_yards_coef_2 * pow(norm_diff_returning, 2))
+            a=skew,
+            loc=mean,
+            scale=std
         ))
 
+    def relative_return_distance_params(self, norm_diff_returning: Union[float, np.ndarray]) -> tuple:
+        """
+        Generates the skewed normal distribution of the return distance
+        relative to the punt landing
+
+        Args:
+            norm_diff_returning (Union[float, np.ndarray]): Punt returning skill
+                differential of one or more punts
+        
+        Returns:
+            tuple: The skew, mean and std relative return distance of each
+                punt
+        """
+        skew = self.skew_rel_return_yards_intr + \
+            (self.skew_rel_return_yards_coef_1 * norm_diff_returning) + \
+            (self.skew_rel_return_yards_coef_2 * pow(norm_diff_returning, 2))
+        mean = self.mean_rel_return_yards_intr + \
+            (self.mean_rel_return_yards_coef_1 * norm_diff_returning) + \
+            (self.mean_rel_return_yards_coef_2 * pow(norm_diff_returning, 2))
+        std = self.std_rel_return_yards_intr + \
+            (self.std_rel_return_yards_coef_1 * norm_diff_returning) + \
+            (self.std_rel_return_yards_coef_2 * pow(norm_diff_returning, 2))
+        return skew, mean, std
+
     def is_fumble(self, norm_diff_returning: float) -> bool:
         """
         Generates whether there was a fumble on the punt return
@@ -334,8 +557,20 @@ class PuntResultModel:
         Returns:
             bool: Whether there was a fumble on the punt return
         """
-        p_fumble = self.p_fumble_intr + (self.p_fumble_coef * norm_diff_returning)
-        return random.random() < p_fumble
+        return random.random() < self.p_fumble(norm_diff_returning)
+
+    def p_fumble(self, norm_diff_returning: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the probability of a fumble on the punt return
+
+        Args:
+            norm_diff_returning (Union[float, np.ndarray]): Punt returning skill
+                differential of one or more punts
+        
+        Returns:
+            Union[float, np.ndarray]: Probability of a fumble on each punt return
+        """
+        return self.p_fumble_intr + (self.p_fumble_coef * norm_diff_returning)
 
     def fumble_recovery_return_yards(self) -> int:
         """
@@ -358,8 +593,20 @@ class PuntResultModel:
         """
         return int(
             np.random.normal(
-                loc=self.punt_play_duration_intr + \
-                    (self.punt_play_duration_coef * yards),
+                loc=self.mean_duration(yards),
                 scale=2
             )
         )
+
+    def mean_duration(self, yards: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Generates the mean duration of the punt play
+
+        Args:
+            yards (Union[float, np.ndarray]): The total yards of one or more punts,
+                including punt & return distances
+        
+        Returns:
+            Union[float, np.ndarray]: The mean duration of each play in seconds
+        """
+        return self.punt_play_duration_intr + (self.punt_play_duration_coef * yards)
@@ -1,4 +1,5 @@
 import copy
+import numpy as np
 from context.context import GameContext
 
 class PuntResult:
@@ -152,3 +153,90 @@ class PuntResult:
         if self.touchdown:
             res += f" TOUCHDOWN!"
         return res
+
+class PuntResultBatch:
+    """
+    The results of a batch of punt plays, stored as one array per field
+    rather than one PuntResult per play
+    """
+    def __init__(
+            self,
+            punt_yards: np.ndarray,
+            punt_return_yards: np.ndarray,
+            play_duration: np.ndarray,
+            blocked: np.ndarray,
+            fumble_return_yards: np.ndarray,
+            touchback: np.ndarray,
+            out_of_bounds: np.ndarray,
+            fair_catch: np.ndarray,
+            muffed: np.ndarray,
+            fumble: np.ndarray,
+            touchdown: np.ndarray
+        ) -> "PuntResultBatch":
+        """
+        Constructor for the PuntResultBatch class
+
+        Args:
+            punt_yards (np.ndarray): The distance of each punt in yards
+            punt_return_yards (np.ndarray): The return yards of each punt
+            play_duration (np.ndarray): The duration of each play in seconds
+            blocked (np.ndarray): Whether each punt was blocked
+            fumble_return_yards (np.ndarray): The return yards of each block,
+                muff or fumble
+            touchback (np.ndarray): Whether each punt was a touchback
+            out_of_bounds (np.ndarray): Whether each punt went out of bounds
+            fair_catch (np.ndarray): Whether a fair catch was called
+            muffed (np.ndarray): Whether each punt was muffed
+            fumble (np.ndarray): Whether each block or return was fumbled
+            touchdown (np.ndarray): Whether each play was a touchdown
+
+        Returns:
+            PuntResultBatch: The instantiated PuntResultBatch
+        """
+        self.punt_yards = punt_yards
+        self.punt_return_yards = punt_return_yards
+        self.play_duration = play_duration
+        self.blocked = blocked
+        self.fumble_return_yards = fumble_return_yards
+        self.touchback = touchback
+        self.out_of_bounds = out_of_bounds
+        self.fair_catch = fair_catch
+        self.muffed = muffed
+        self.fumble = fumble
+        self.touchdown = touchdown
+
+    def __len__(self) -> int:
+        """
+        Gets the number of plays in the batch
+
+        Returns:
+            int: The number of plays
+        """
+        return len(self.punt_yards)
+
+    def result(
+            self,
+            index: int
+        ) -> PuntResult:
+        """
+        Gets the result of a single play of the batch
+
+        Args:
+            index (int): The position of the play in the batch
+
+        Returns:
+            PuntResult: The result of the play
+        """
+        return PuntResult(
+            punt_yards=int(self.punt_yards[index]),
+            punt_return_yards=int(self.punt_return_yards[index]),
+            play_duration=int(self.play_duration[index]),
+            blocked=bool(self.blocked[index]),
+            fumble_return_yards=int(self.fumble_return_yards[index]),
+            touchback=bool(self.touchback[index]),
+            out_of_bounds=bool(self.out_of_bounds[index]),
+            fair_catch=bool(self.fair_catch[index]),
+            muffed=bool(self.muffed[index]),
+            fumble=bool(self.fumble[index]),
+            touchdown=bool(self.touchdown[index])
+        )
@@ -1,7 +1,7 @@
 import random
 import numpy as np
 from context.context import PlayContext
-from playresult.rushing.result import RushResult
+from playresult.rushing.result import RushResult, RushResultBatch
 from team.offense import OffensiveSkill
 from team.defense import DefensiveSkill
 
@@ -152,6 +152,80 @@ class RushResultModel:
             scramble=scramble
         )
 
+    def sim_batch(
+            self,
+            yard_line: np.ndarray,
+            norm_diff_rushing: np.ndarray,
+            norm_diff_ball_handling: np.ndarray,
+            scramble: bool=False,
+            rng: np.random.Generator=None
+        ) -> RushResultBatch:
+        """
+        Simulates a batch of rushing plays with the same branches as sim.
+        Every random draw is made once for the whole batch, and each play
+        takes the draws of its branch by mask.
+
+        Args:
+            yard_line (np.ndarray): The yard line (0-100) of each play
+            norm_diff_rushing (np.ndarray): The rushing skill diff of each
+                play, 0.5 + (offense rushing - defense rush defense) / 2
+            norm_diff_ball_handling (np.ndarray): The ball handling skill diff
+                of each play, 0.5 + (offense turnovers - defense turnovers) / 2
+            scramble (bool): Whether the plays are QB scrambles
+            rng (np.random.Generator): The random generator, a fresh one if None
+
+        Returns:
+            RushResultBatch: The results of the plays
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        yard_line, norm_diff_rushing, norm_diff_ball_handling = np.broadcast_arrays(
+            np.asarray(yard_line, dtype=np.float64),
+            np.asarray(norm_diff_rushing, dtype=np.float64),
+            np.asarray(norm_diff_ball_handling, dtype=np.float64)
+        )
+        n = yard_line.size
+
+        # Resolve the branch of each play
+        p_big_play = np.exp(self.p_big_play_intr + (self.p_big_play_coef * norm_diff_rushing))
+        p_big_play_td = np.exp(self.p_big_play_td_intr + (self.p_big_play_td_coef * norm_diff_rushing))
+        p_fumble = self.p_fumble_intr + (self.p_fumble_coef * norm_diff_ball_handling)
+        big_play = rng.random(n) < p_big_play
+        big_play_td = big_play & (rng.random(n) < p_big_play_td)
+        fumble = ~big_play & (rng.random(n) < p_fumble)
+
+        # Generate the yards of big plays and of normal plays
+        yards = np.where(
+            big_play,
+            rng.normal(
+                self.mean_big_play_rushing_yards(norm_diff_rushing),
+                self.std_big_play_rushing_yards(norm_diff_rushing)
+            ),
+            rng.normal(
+                self.mean_rushing_yards(norm_diff_rushing),
+                self.std_rushing_yards(norm_diff_rushing)
+            )
+        ).astype(np.int64)
+        yards = np.where(big_play_td, 100 - yard_line.astype(np.int64), yards)
+
+        # Fumbles are returned against the yards gained
+        return_yards = np.where(fumble, rng.exponential(scale=1, size=n).astype(np.int64), 0)
+        duration_yards = yards
+        yards = yards - return_yards
+        touchdown = np.where(fumble, (yard_line + yards) < 0, yards > (100 - yard_line)) | big_play_td
+
+        # Generate the duration of every play from its yards
+        play_duration = np.abs(
+            rng.normal(self.mean_play_duration(duration_yards), 2).astype(np.int64)
+        )
+        return RushResultBatch(
+            yards_gained=yards,
+            play_duration=play_duration,
+            fumble=fumble,
+            return_yards=return_yards,
+            touchdown=touchdown,
+            scramble=np.full(n, scramble)
+        )
+
     def is_fumble(self, norm_diff_ball_handling: float) -> bool:
         """
         Based on the normalized skill differential between the offense's ball
@@ -1,4 +1,5 @@
 import copy
+import numpy as np
 from context.context import GameContext
 
 class RushResult:
@@ -50,3 +51,69 @@ class RushResult:
         if self.touchdown:
             res += " TOUCHDOWN!"
         return res
+
+class RushResultBatch:
+    """
+    The results of a batch of rushing plays, stored as one array per field
+    rather than one RushResult per play
+    """
+    def __init__(
+            self,
+            yards_gained: np.ndarray,
+            play_duration: np.ndarray,
+            fumble: np.ndarray,
+            return_yards: np.ndarray,
+            touchdown: np.ndarray,
+            scramble: np.ndarray
+        ) -> "RushResultBatch":
+        """
+        Constructor for the RushResultBatch class
+
+        Args:
+            yards_gained (np.ndarray): The yards gained on each play
+            play_duration (np.ndarray): The duration of each play in seconds
+            fumble (np.ndarray): Whether each play was a lost fumble
+            return_yards (np.ndarray): The fumble return yards of each play
+            touchdown (np.ndarray): Whether each play was a touchdown
+            scramble (np.ndarray): Whether each play was a QB scramble
+
+        Returns:
+            RushResultBatch: The instantiated RushResultBatch
+        """
+        self.yards_gained = yards_gained
+        self.play_duration = play_duration
+        self.fumble = fumble
+        self.return_yards = return_yards
+        self.touchdown = touchdown
+        self.scramble = scramble
+
+    def __len__(self) -> int:
+        """
+        Gets the number of plays in the batch
+
+        Returns:
+            int: The number of plays
+        """
+        return len(self.yards_gained)
+
+    def result(
+            self,
+            index: int
+        ) -> RushResult:
+        """
+        Gets the result of a single play of the batch
+
+        Args:
+            index (int): The position of the play in the batch
+
+        Returns:
+            RushResult: The result of the play
+        """
+        return RushResult(
+            yards_gained=int(self.yards_gained[index]),
+            play_duration=int(self.play_duration[index]),
+            fumble=bool(self.fumble[index]),
+            return_yards=int(self.return_yards[index]),
+            touchdown=bool(self.touchdown[index]),
+            scramble=bool(self.scramble[index])
+        )
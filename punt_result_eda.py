@@ -1,12 +1,24 @@
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
+from data.sample import estimate_binned_statistics, sample_nfl_pbp_dataset
 from scipy.optimize import curve_fit
 from scipy.stats import skewnorm
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 
-df = pd.read_csv('./data/punts.csv')
+# Load punting data, or a stratified sample of it for a quick look, e.g.
+# python punt_result_eda.py 0.05
+fraction = float(sys.argv[1]) if len(sys.argv) > 1 else None
+if fraction is None:
+    df = load_nfl_pbp_dataset('punt')
+else:
+    df = sample_nfl_pbp_dataset('punt', fraction)
+    print(f"Sampled {len(df)} plays, estimated error of the binned statistics:")
+    print(estimate_binned_statistics(df, 'kick_distance', pd.cut(df['norm_punting'], bins=5)))
+    print()
 
 ###
 # Punt model flow
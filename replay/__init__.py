@@ -0,0 +1 @@
+import replay.replay
\ No newline at end of file
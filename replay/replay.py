@@ -0,0 +1,274 @@
+import random
+import numpy as np
+import pandas as pd
+from context.context import GameContext
+from data.game import GameIndex
+from data.store import TeamSkillStore
+from playcalling.model import PlayCallingModel
+from playcalling.playcall import PlayCall
+from playresult.fieldgoal.model import FieldGoalResultModel
+from playresult.passing.result import PassResult
+from playresult.passing.model import PassResultModel
+from playresult.punt.model import PuntResultModel
+from playresult.rushing.model import RushResultModel
+
+# The play call of each replayed play type
+REPLAY_PLAYCALLS = {
+    'run': PlayCall.RUN,
+    'pass': PlayCall.PASS,
+    'field_goal': PlayCall.FIELD_GOAL,
+    'punt': PlayCall.PUNT
+}
+
+# The historical column each play type's simulated result is scored against
+REPLAY_RESULT_COLUMNS = {
+    'run': 'yards_gained',
+    'pass': 'yards_gained',
+    'field_goal': 'field_goal_made',
+    'punt': 'kick_distance'
+}
+
+# The columns every replayed play needs a value of to build its game context
+REPLAY_CONTEXT_COLUMNS = [
+    'posteam',
+    'defteam',
+    'qtr',
+    'half_seconds_remaining',
+    'down',
+    'ydstogo',
+    'yardline_100',
+    'posteam_score',
+    'defteam_score',
+    'posteam_timeouts_remaining',
+    'defteam_timeouts_remaining'
+]
+
+class GameReplay:
+    """
+    Replays historical games through the play calling and play result
+    models.  Each scrimmage play of a game is converted into the GameContext
+    it was called in, the play calling model is asked for a play call, and
+    the play result model of the play actually called is simulated with the
+    teams' skills in that season.  The simulated play calls and results are
+    scored against what happened on the field.
+    """
+    def __init__(
+            self,
+            index: GameIndex=None,
+            store: TeamSkillStore=None
+        ) -> "GameReplay":
+        """
+        Constructor for the GameReplay class
+
+        Args:
+            index (GameIndex): The game index, the default index if None
+            store (TeamSkillStore): The team skill store, the default store
+                if None
+
+        Returns:
+            GameReplay: The instantiated GameReplay
+        """
+        self.index = GameIndex() if index is None else index
+        self.store = TeamSkillStore() if store is None else store
+        self.playcalling_model = PlayCallingModel()
+        self.result_models = {
+            'run': RushResultModel(),
+            'pass': PassResultModel(),
+            'field_goal': FieldGoalResultModel(),
+            'punt': PuntResultModel()
+        }
+        self.team_skills = {}
+
+    def skills(
+            self,
+            season: int,
+            team: str
+        ) -> tuple:
+        """
+        Looks up the offensive, defensive and coaching skills of a team in a
+        season, remembering them for the rest of the replay
+
+        Args:
+            season (int): The season
+            team (str): The team abbreviation (e.g. KC)
+
+        Returns:
+            tuple: The OffensiveSkill, DefensiveSkill and CoachSkill of the team
+        """
+        if (season, team) not in self.team_skills:
+            self.team_skills[(season, team)] = (
+                self.store.offensive_skill(season, team),
+                self.store.defensive_skill(season, team),
+                self.store.coach_skill(season, team)
+            )
+        return self.team_skills[(season, team)]
+
+    def game_contexts(
+            self,
+            df: pd.DataFrame
+        ) -> list[tuple[dict, GameContext]]:
+        """
+        Converts the replayable plays of a game into the game contexts they
+        were called in.  Only regulation plays of the replayed play types
+        with a complete game situation are kept, since the play context does
+        not model overtime.
+
+        Args:
+            df (pd.DataFrame): The plays of a game from the game index
+
+        Returns:
+            list[tuple[dict, GameContext]]: Each replayable play and its
+                game context
+        """
+        plays = df[
+            df['play_type'].isin(list(REPLAY_PLAYCALLS))
+            & df[REPLAY_CONTEXT_COLUMNS].notna().all(axis=1)
+            & (df['qtr'] <= 4)
+        ]
+        contexts = []
+        for play in plays.to_dict('records'):
+            home_possession = play['posteam'] == play['home_team']
+            if home_possession:
+                home_score, away_score = play['posteam_score'], play['defteam_score']
+                home_timeouts, away_timeouts = play['posteam_timeouts_remaining'], play['defteam_timeouts_remaining']
+            else:
+                home_score, away_score = play['defteam_score'], play['posteam_score']
+                home_timeouts, away_timeouts = play['defteam_timeouts_remaining'], play['posteam_timeouts_remaining']
+
+            # The home team drives towards 100, so the yard line of a home
+            # possession is measured from the home goal line
+            yardline_100 = int(play['yardline_100'])
+            contexts.append((play, GameContext(
+                home_team=play['home_team'],
+                away_team=play['away_team'],
+                quarter=int(play['qtr']),
+                half_seconds=int(play['half_seconds_remaining']),
+                down=int(play['down']),
+                distance=int(play['ydstogo']),
+                yard_line=100 - yardline_100 if home_possession else yardline_100,
+                home_score=int(home_score),
+                away_score=int(away_score),
+                home_positive_direction=True,
+                home_possession=home_possession,
+                home_timeouts=int(home_timeouts),
+                away_timeouts=int(away_timeouts)
+            )))
+        return contexts
+
+    def replay_game(
+            self,
+            df: pd.DataFrame
+        ) -> pd.DataFrame:
+        """
+        Replays the plays of a game through the play calling and play result
+        models
+
+        Args:
+            df (pd.DataFrame): The plays of a game from the game index
+
+        Returns:
+            pd.DataFrame: One row per replayed play, with the actual and
+                simulated play call and the actual and simulated result
+        """
+        records = []
+        for play, game_context in self.game_contexts(df):
+            season = int(play['season'])
+            offense, _, coach = self.skills(season, play['posteam'])
+            _, defense, _ = self.skills(season, play['defteam'])
+            context = game_context.into_play_context()
+
+            # Simulate the play call, then the result of the actual play call
+            playcall = self.playcalling_model.sim(context, coach)
+            play_type = play['play_type']
+            result = self.result_models[play_type].sim(context, offense, defense)
+            if play_type == 'field_goal':
+                actual, simulated = float(play['field_goal_result'] == 'made'), float(result.field_goal_made)
+            elif play_type == 'punt':
+                actual, simulated = play['kick_distance'], result.punt_yards
+            else:
+                actual = play['yards_gained']
+                simulated = result.yards_gained() if isinstance(result, PassResult) else result.yards_gained
+            records.append({
+                'game_id': play['game_id'],
+                'play_id': play['play_id'],
+                'play_type': play_type,
+                'actual_playcall': REPLAY_PLAYCALLS[play_type].name,
+                'simulated_playcall': playcall.name,
+                'result_column': REPLAY_RESULT_COLUMNS[play_type],
+                'actual_result': actual,
+                'simulated_result': simulated
+            })
+        return pd.DataFrame(records)
+
+    def replay(
+            self,
+            game_id: str,
+            seed: int=None
+        ) -> pd.DataFrame:
+        """
+        Replays a single historical game
+
+        Args:
+            game_id (str): The game id (e.g. 2023_01_DET_KC)
+            seed (int): The random seed of the simulation, unseeded if None
+
+        Returns:
+            pd.DataFrame: One row per replayed play
+        """
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
+        return self.replay_game(self.index.game(game_id))
+
+    def replay_season(
+            self,
+            season: int,
+            seed: int=None
+        ) -> pd.DataFrame:
+        """
+        Replays every game of a season, reading the season's plays in one
+        sequential pass
+
+        Args:
+            season (int): The season
+            seed (int): The random seed of the simulation, unseeded if None
+
+        Returns:
+            pd.DataFrame: One row per replayed play
+        """
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
+        return pd.concat(
+            [self.replay_game(df) for _, df in self.index.games(season)],
+            ignore_index=True
+        )
+
+def score_replay(
+        replayed: pd.DataFrame
+    ) -> pd.DataFrame:
+    """
+    Scores replayed plays by play type.  The play call accuracy is the share
+    of plays whose simulated play call matches the actual one, and the
+    result error is the mean absolute difference between the simulated and
+    actual results (yards gained, punt distance, or field goals made).
+
+    Args:
+        replayed (pd.DataFrame): Replayed plays from GameReplay
+
+    Returns:
+        pd.DataFrame: The number of plays, play call accuracy, and the mean
+            actual result, mean simulated result and result error of each
+            play type
+    """
+    replayed = replayed.assign(
+        playcall_correct=replayed['actual_playcall'] == replayed['simulated_playcall'],
+        result_error=(replayed['actual_result'] - replayed['simulated_result']).abs()
+    )
+    return replayed.groupby('play_type').agg(
+        plays=('play_id', 'count'),
+        playcall_accuracy=('playcall_correct', 'mean'),
+        actual_result=('actual_result', 'mean'),
+        simulated_result=('simulated_result', 'mean'),
+        result_error=('result_error', 'mean')
+    )
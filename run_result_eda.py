@@ -1,11 +1,22 @@
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
+from data.sample import estimate_binned_statistics, sample_nfl_pbp_dataset
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 
-# Load rushing data
-df = pd.read_csv("./data/rushing.csv")
+# Load rushing data, or a stratified sample of it for a quick look, e.g.
+# python run_result_eda.py 0.05
+fraction = float(sys.argv[1]) if len(sys.argv) > 1 else None
+if fraction is None:
+    df = load_nfl_pbp_dataset('run')
+else:
+    df = sample_nfl_pbp_dataset('run', fraction)
+    print(f"Sampled {len(df)} plays, estimated error of the binned statistics:")
+    print(estimate_binned_statistics(df, 'yards_gained', pd.cut(df['norm_diff_rushing'], bins=5)))
+    print()
 
 # Sort into 10 subsets based on normalized diff column values
 df['norm_diff_rushing_group'] = pd.cut(df['norm_diff_rushing'], bins=5)
@@ -1,5 +1,5 @@
 import numpy as np
-import pandas as pd
+from data.dataset import load_nfl_pbp_dataset
 from data.pbp import load_clean_nfl_pbp_run_data
 from keras.models import Sequential, save_model
 from keras.layers import Dense
@@ -8,7 +8,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, classification_report
 
 # Load rushing data
-df = pd.read_csv("./data/rushing.csv")
+df = load_nfl_pbp_dataset('run')
 
 # Prepare the dataset features
 x = df[
@@ -0,0 +1,19 @@
+import os
+import sys
+from data.store import (
+    build_rolling_team_skill_store,
+    build_team_season_skill_store,
+    update_team_season_skill_store
+)
+
+# Guard the entry point, since the worker processes may re-import this script
+if __name__ == '__main__':
+    # Rebuild the whole skill store unless seasons to update are named, e.g.
+    # python team_skill_data.py 2024
+    # With --rolling, the week-by-week skill store is rebuilt instead
+    if '--rolling' in sys.argv[1:]:
+        build_rolling_team_skill_store(workers=os.cpu_count())
+    elif len(sys.argv) > 1:
+        update_team_season_skill_store([int(year) for year in sys.argv[1:]])
+    else:
+        build_team_season_skill_store(workers=os.cpu_count())